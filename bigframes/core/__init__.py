@@ -20,6 +20,8 @@ from typing import Iterable, Sequence
 
 import ibis.expr.types as ibis_types
 import pandas
+import pyarrow
+import pyarrow.feather
 
 import bigframes.core.compile as compiling
 import bigframes.core.expression as ex
@@ -77,7 +79,12 @@ class ArrayValue:
             for label in pd_df.columns
         ]
         unique_ids = tuple(bigframes.core.utils.disambiguate_ids(as_ids))
-        pd_df.reset_index(drop=True).set_axis(unique_ids, axis=1).to_feather(iobytes)
+        # Convert straight to Arrow, dropping the index, rather than copying the
+        # frame to reset its index and relabel its columns first.
+        arrow_table = pyarrow.Table.from_pandas(
+            pd_df.set_axis(unique_ids, axis=1, copy=False), preserve_index=False
+        )
+        pyarrow.feather.write_feather(arrow_table, iobytes)
         node = nodes.ReadLocalNode(iobytes.getvalue())
         return cls(node)
 
@@ -126,6 +133,10 @@ class ArrayValue:
     def filter(self, predicate: ex.Expression):
         return ArrayValue(nodes.FilterNode(child=self.node, predicate=predicate))
 
+    def is_ordered_by(self, by: Sequence[OrderingColumnReference]) -> bool:
+        """Whether the rows are already sorted by the given columns, so that ordering by them is a no-op."""
+        return self._compile_ordered().is_ordered_by(by)
+
     def order_by(self, by: Sequence[OrderingColumnReference]) -> ArrayValue:
         return ArrayValue(nodes.OrderByNode(child=self.node, by=tuple(by)))
 
@@ -226,6 +237,17 @@ class ArrayValue:
             )
         )
 
+    def projection(
+        self, assignments: typing.Sequence[typing.Tuple[ex.Expression, str]]
+    ) -> ArrayValue:
+        """Replace the value columns with the given (expression, output id) pairs, in order."""
+        return ArrayValue(
+            nodes.ProjectionNode(
+                child=self.node,
+                assignments=tuple(assignments),
+            )
+        )
+
     def drop_columns(self, columns: Iterable[str]) -> ArrayValue:
         new_projection = (
             (ex.free_var(col_id), col_id)
@@ -13,6 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
+import functools
 import typing
 
 import pandas as pd
@@ -66,6 +67,8 @@ def indicate_duplicates(
     """Create a boolean column where True indicates a duplicate value"""
     if keep not in ["first", "last", False]:
         raise ValueError("keep must be one of 'first', 'last', or False'")
+    if block.is_unique_over(columns):
+        return block.create_constant(False, dtype=pd.BooleanDtype())
 
     if keep == "first":
         # Count how many copies occur up to current copy of value
@@ -186,24 +189,20 @@ def _interpolate_column(
         ops.where_op.as_expr(x_values, notnull, ex.const(None))
     )
 
-    block, previous_value = block.apply_window_op(
-        column, agg_ops.LastNonNullOp(), backwards_window
-    )
-    block, next_value = block.apply_window_op(
-        column, agg_ops.FirstNonNullOp(), forwards_window
-    )
-    block, previous_value_offset = block.apply_window_op(
-        masked_offsets,
-        agg_ops.LastNonNullOp(),
-        backwards_window,
-        skip_reproject_unsafe=True,
-    )
-    block, next_value_offset = block.apply_window_op(
-        masked_offsets,
-        agg_ops.FirstNonNullOp(),
-        forwards_window,
-        skip_reproject_unsafe=True,
+    block, window_results = block.multi_apply_window_ops(
+        [
+            (column, agg_ops.last_non_null_op, backwards_window),
+            (column, agg_ops.first_non_null_op, forwards_window),
+            (masked_offsets, agg_ops.last_non_null_op, backwards_window),
+            (masked_offsets, agg_ops.first_non_null_op, forwards_window),
+        ]
     )
+    (
+        previous_value,
+        next_value,
+        previous_value_offset,
+        next_value_offset,
+    ) = window_results
 
     if interpolate_method == "linear":
         block, prediction_id = _interpolate_points_linear(
@@ -306,10 +305,15 @@ def _interpolate_points_ffill(
 def drop_duplicates(
     block: blocks.Block, columns: typing.Sequence[str], keep: str = "first"
 ) -> blocks.Block:
+    if keep not in ["first", "last", False]:
+        raise ValueError("keep must be one of 'first', 'last', or False'")
+    if block.is_unique_over(columns):
+        return block
+    value_columns = block.value_columns
     block, dupe_indicator_id = indicate_duplicates(block, columns, keep)
     block, keep_indicator_id = block.apply_unary_op(dupe_indicator_id, ops.invert_op)
-    return block.filter(keep_indicator_id).drop_columns(
-        (dupe_indicator_id, keep_indicator_id)
+    return block.filter_and_select(keep_indicator_id, value_columns).with_unique_keys(
+        columns
     )
 
 
@@ -360,14 +364,15 @@ def pct_change(block: blocks.Block, periods: int = 1) -> blocks.Block:
 
     original_columns = block.value_columns
     block, shift_columns = block.multi_apply_window_op(
-        original_columns, agg_ops.ShiftOp(periods), window_spec=window_spec
+        original_columns, agg_ops.shift_op(periods), window_spec=window_spec
     )
-    result_ids = []
-    for original_col, shifted_col in zip(original_columns, shift_columns):
-        block, change_id = block.apply_binary_op(original_col, shifted_col, ops.sub_op)
-        block, pct_change_id = block.apply_binary_op(change_id, shifted_col, ops.div_op)
-        result_ids.append(pct_change_id)
-    return block.select_columns(result_ids).with_column_labels(column_labels)
+    # Compute every (x - shifted) / shifted in a single projection.
+    exprs = [
+        ops.div_op.as_expr(ops.sub_op.as_expr(original_col, shifted_col), shifted_col)
+        for original_col, shifted_col in zip(original_columns, shift_columns)
+    ]
+    block, _ = block.project_exprs(exprs, labels=column_labels, drop=True)
+    return block
 
 
 def rank(
@@ -460,32 +465,17 @@ def dropna(
     """
     Drop na entries from block
     """
-    if how == "any":
-        filtered_block = block
-        for column in column_ids:
-            filtered_block, result_id = filtered_block.apply_unary_op(
-                column, ops.notnull_op
-            )
-            filtered_block = filtered_block.filter(result_id)
-            filtered_block = filtered_block.drop_columns([result_id])
-        return filtered_block
-    else:  # "all"
-        filtered_block = block
-        predicate = None
-        for column in column_ids:
-            filtered_block, partial_predicate = filtered_block.apply_unary_op(
-                column, ops.notnull_op
-            )
-            if predicate:
-                filtered_block, predicate = filtered_block.apply_binary_op(
-                    partial_predicate, predicate, ops.or_op
-                )
-            else:
-                predicate = partial_predicate
-        if predicate:
-            filtered_block = filtered_block.filter(predicate)
-        filtered_block = filtered_block.select_columns(block.value_columns)
-        return filtered_block
+    if not column_ids:
+        return block
+    # Combine the per-column null checks into a single predicate so that only
+    # one filter is applied.
+    combine_op = ops.and_op if how == "any" else ops.or_op
+    predicate = functools.reduce(
+        combine_op.as_expr,
+        (ops.notnull_op.as_expr(column) for column in column_ids),
+    )
+    filtered_block, predicate_id = block.project_expr(predicate)
+    return filtered_block.filter_and_select(predicate_id, block.value_columns)
 
 
 def nsmallest(
@@ -508,14 +498,14 @@ def nsmallest(
     if keep in ("first", "last"):
         return block.slice(0, n)
     else:  # keep == "all":
+        value_columns = block.value_columns
         block, counter = block.apply_window_op(
             column_ids[0],
             agg_ops.rank_op,
             window_spec=windows.WindowSpec(ordering=tuple(order_refs)),
         )
         block, condition = block.project_expr(ops.le_op.as_expr(counter, ex.const(n)))
-        block = block.filter(condition)
-        return block.drop_columns([counter, condition])
+        return block.filter_and_select(condition, value_columns)
 
 
 def nlargest(
@@ -538,14 +528,14 @@ def nlargest(
     if keep in ("first", "last"):
         return block.slice(0, n)
     else:  # keep == "all":
+        value_columns = block.value_columns
         block, counter = block.apply_window_op(
             column_ids[0],
             agg_ops.rank_op,
             window_spec=windows.WindowSpec(ordering=tuple(order_refs)),
         )
         block, condition = block.project_expr(ops.le_op.as_expr(counter, ex.const(n)))
-        block = block.filter(condition)
-        return block.drop_columns([counter, condition])
+        return block.filter_and_select(condition, value_columns)
 
 
 def skew(
@@ -565,7 +555,7 @@ def skew(
     for i, col in enumerate(original_columns):
         count_agg = (col, agg_ops.count_op)
         moment3_agg = (delta3_ids[i], agg_ops.mean_op)
-        variance_agg = (col, agg_ops.PopVarOp())
+        variance_agg = (col, agg_ops.pop_var_op)
         aggregations.extend([count_agg, moment3_agg, variance_agg])
 
     block, agg_ids = block.aggregate(
@@ -605,7 +595,7 @@ def kurt(
     for i, col in enumerate(original_columns):
         count_agg = (col, agg_ops.count_op)
         moment4_agg = (delta4_ids[i], agg_ops.mean_op)
-        variance_agg = (col, agg_ops.PopVarOp())
+        variance_agg = (col, agg_ops.pop_var_op)
         aggregations.extend([count_agg, moment4_agg, variance_agg])
 
     block, agg_ids = block.aggregate(
@@ -841,5 +831,5 @@ def _idx_extrema(
     # Stack the entire column axis to produce single-column result
     # Assumption: uniform dtype for stackability
     return block.aggregate_all_and_stack(
-        agg_ops.AnyValueOp(), dtype=block.dtypes[0]
+        agg_ops.any_value_op, dtype=block.dtypes[0]
     ).with_column_labels([original_block.index.name])
@@ -39,6 +39,7 @@ import bigframes.core.expression as ex
 import bigframes.core.guid as guid
 import bigframes.core.indexes as indexes
 import bigframes.core.join_def as join_defs
+import bigframes.core.nodes as nodes
 import bigframes.core.ordering as ordering
 import bigframes.core.utils
 import bigframes.core.utils as utils
@@ -55,6 +56,9 @@ Label = typing.Hashable
 _BYTES_TO_KILOBYTES = 1024
 _BYTES_TO_MEGABYTES = _BYTES_TO_KILOBYTES * 1024
 
+# Downloaded results up to this size are kept on the block for reuse.
+_MAX_CACHED_LOCAL_MEGABYTES = 64
+
 # This is the max limit of physical columns in BQ
 # May choose to set smaller limit for number of block columns to allow overhead for ordering, etc.
 _BQ_MAX_COLUMNS = 10000
@@ -139,28 +143,52 @@ class Block:
         # TODO(kemppeterson) Add a cache for corr to parallel the single-column stats.
 
         self._stats_cache[" ".join(self.index_columns)] = {}
+        # Row count, once known from a count query or a full download.
+        self._cached_row_count: Optional[int] = None
+        # include_index -> (sql, index_column_ids, index_labels)
+        self._sql_cache: dict[bool, typing.Tuple[str, list[str], list[Label]]] = {}
+        # (include_index, ordering_id) -> SQL of an I/O query
+        self._io_sql_cache: dict[typing.Tuple[bool, Optional[str]], str] = {}
+        # (include_index, ordering_id) -> destination table of an I/O query
+        self._io_table_cache: dict[
+            typing.Tuple[bool, Optional[str]], bigquery.TableReference
+        ] = {}
+        # ordered -> (dataframe, query job, table size in MB if it was checked)
+        self._local_cache: dict[
+            bool, typing.Tuple[pd.DataFrame, bigquery.QueryJob, Optional[float]]
+        ] = {}
+        # Sets of value column ids the rows are known to be unique over.
+        self._unique_keys: typing.FrozenSet[typing.FrozenSet[str]] = frozenset()
 
     @property
     def index(self) -> indexes.IndexValue:
         """Row identities for values in the Block."""
         return indexes.IndexValue(self)
 
-    @functools.cached_property
+    @property
     def shape(self) -> typing.Tuple[int, int]:
         """Returns dimensions as (length, width) tuple."""
+        if self._cached_row_count is None:
+            self._cached_row_count = self._compute_row_count()
+        return (self._cached_row_count, len(self.value_columns))
+
+    def _preserving_row_count(self, block: Block) -> Block:
+        """Marks a block derived from this one without adding or removing rows."""
+        block._cached_row_count = self._cached_row_count
+        return block
+
+    def _compute_row_count(self) -> int:
         row_count_expr = self.expr.row_count()
 
         # Support in-memory engines for hermetic unit tests.
         if self.expr.node.session is None:
             try:
-                row_count = row_count_expr._try_evaluate_local().squeeze()
-                return (row_count, len(self.value_columns))
+                return row_count_expr._try_evaluate_local().squeeze()
             except Exception:
                 pass
 
         iter, _ = self.session._execute(row_count_expr, sorted=False)
-        row_count = next(iter)[0]
-        return (row_count, len(self.value_columns))
+        return next(iter)[0]
 
     @property
     def index_columns(self) -> Sequence[str]:
@@ -172,7 +200,7 @@ class Block:
         """Name of column(s) to use as row labels."""
         return self._index_labels
 
-    @property
+    @functools.cached_property
     def value_columns(self) -> Sequence[str]:
         """All value columns, mutually exclusive with index columns."""
         return [
@@ -190,7 +218,7 @@ class Block:
         """Expression representing all columns, including index columns."""
         return self._expr
 
-    @property
+    @functools.cached_property
     def dtypes(
         self,
     ) -> Sequence[bigframes.dtypes.Dtype]:
@@ -216,13 +244,18 @@ class Block:
             for col_id, label in zip(self.value_columns, self._column_labels)
         }
 
+    @functools.cached_property
+    def col_id_to_position(self) -> typing.Mapping[str, int]:
+        """Get position of each value column"""
+        return {col_id: i for i, col_id in enumerate(self.value_columns)}
+
     @functools.cached_property
     def label_to_col_id(self) -> typing.Mapping[Label, typing.Sequence[str]]:
         """Get column label for value columns, or index name for index columns"""
-        mapping: typing.Dict[Label, typing.Sequence[str]] = {}
+        mapping: typing.Dict[Label, typing.List[str]] = {}
         for id, label in self.col_id_to_label.items():
-            mapping[label] = (*mapping.get(label, ()), id)
-        return mapping
+            mapping.setdefault(label, []).append(id)
+        return {label: tuple(ids) for label, ids in mapping.items()}
 
     @functools.cached_property
     def col_id_to_index_name(self) -> typing.Mapping[str, Label]:
@@ -235,10 +268,10 @@ class Block:
     @functools.cached_property
     def index_name_to_col_id(self) -> typing.Mapping[Label, typing.Sequence[str]]:
         """Get column label for value columns, or index name for index columns"""
-        mapping: typing.Dict[Label, typing.Sequence[str]] = {}
+        mapping: typing.Dict[Label, typing.List[str]] = {}
         for id, label in self.col_id_to_index_name.items():
-            mapping[label] = (*mapping.get(label, ()), id)
-        return mapping
+            mapping.setdefault(label, []).append(id)
+        return {label: tuple(ids) for label, ids in mapping.items()}
 
     def cols_matching_label(self, partial_label: Label) -> typing.Sequence[str]:
         """
@@ -262,11 +295,14 @@ class Block:
         self,
         by: typing.Sequence[ordering.OrderingColumnReference],
     ) -> Block:
+        # Re-sorting by the existing ordering would only discard its encoding.
+        if self._expr.is_ordered_by(by):
+            return self
         return Block(
             self._expr.order_by(by),
             index_columns=self.index_columns,
             column_labels=self.column_labels,
-            index_labels=self.index.names,
+            index_labels=self._index_labels,
         )
 
     def reversed(self) -> Block:
@@ -274,7 +310,7 @@ class Block:
             self._expr.reversed(),
             index_columns=self.index_columns,
             column_labels=self.column_labels,
-            index_labels=self.index.names,
+            index_labels=self._index_labels,
         )
 
     def reset_index(self, drop: bool = True) -> Block:
@@ -303,7 +339,7 @@ class Block:
             )
         else:
             # Add index names to column index
-            index_labels = self.index.names
+            index_labels = self._index_labels
             column_labels_modified = self.column_labels
             for level, label in enumerate(index_labels):
                 if label is None:
@@ -456,26 +492,37 @@ class Block:
             # Pandas names is annotated as list[str] rather than the more
             # general Sequence[Label] that BigQuery DataFrames has.
             # See: https://github.com/pandas-dev/pandas-stubs/issues/804
-            df.index.names = self.index.names  # type: ignore
+            df.index.names = self._index_labels  # type: ignore
 
     def _materialize_local(
         self, materialize_options: MaterializationOptions = MaterializationOptions()
     ) -> Tuple[pd.DataFrame, bigquery.QueryJob]:
         """Run query and download results as a pandas DataFrame. Return the total number of results as well."""
+        sample_config = materialize_options.downsampling
+        max_download_size = sample_config.max_download_size
+        cached = self._local_cache.get(materialize_options.ordered)
+        if cached is not None:
+            cached_df, cached_job, cached_size = cached
+            if max_download_size is None or (
+                cached_size is not None and cached_size <= max_download_size
+            ):
+                return cached_df.copy(), cached_job
+
         # TODO(swast): Allow for dry run and timeout.
         results_iterator, query_job = self.session._execute(
             self.expr, sorted=materialize_options.ordered
         )
-        table_size = (
-            self.session._get_table_size(query_job.destination) / _BYTES_TO_MEGABYTES
-        )
-        sample_config = materialize_options.downsampling
-        max_download_size = sample_config.max_download_size
-        fraction = (
-            max_download_size / table_size
-            if (max_download_size is not None) and (table_size != 0)
-            else 2
-        )
+        fraction = 2.0
+        table_size: Optional[float] = None
+        # The table metadata is only needed to check against a size limit.
+        if max_download_size is not None:
+            result_size = (
+                self.session._get_table_size(query_job.destination)
+                / _BYTES_TO_MEGABYTES
+            )
+            table_size = result_size
+            if result_size != 0:
+                fraction = max_download_size / result_size
 
         # TODO: Maybe materialize before downsampling
         # Some downsampling methods
@@ -513,6 +560,19 @@ class Block:
             total_rows = results_iterator.total_rows
             df = self._to_dataframe(results_iterator)
             self._copy_index_to_pandas(df)
+            self._cached_row_count = len(df)
+            if (
+                df.memory_usage().sum() / _BYTES_TO_MEGABYTES
+                <= _MAX_CACHED_LOCAL_MEGABYTES
+            ):
+                # A shallow copy keeps column assignments on the returned frame
+                # out of the cache without duplicating the data. Hits are
+                # copied in full.
+                self._local_cache[materialize_options.ordered] = (
+                    df.copy(deep=False),
+                    query_job,
+                    table_size,
+                )
 
         return df, query_job
 
@@ -529,7 +589,7 @@ class Block:
                 filtered_expr,
                 index_columns=self.index_columns,
                 column_labels=self.column_labels,
-                index_labels=self.index.names,
+                index_labels=self._index_labels,
             )
             return block
         elif sampling_method == _UNIFORM:
@@ -577,46 +637,41 @@ class Block:
         if random_state is None:
             random_state = random.randint(-(2**63), 2**63 - 1)
 
-        # Create a new column with random_state value.
-        block, random_state_col = block.create_constant(str(random_state))
-
-        # Create an ordering col and convert to string
+        # Order by a hash of the offsets salted with random_state. The whole
+        # hash is built as one expression so no intermediate columns are needed.
         block, ordering_col = block.promote_offsets()
-        block, string_ordering_col = block.apply_unary_op(
-            ordering_col, ops.AsTypeOp(to_type="string[pyarrow]")
+        string_ordering = ops.AsTypeOp(to_type="string[pyarrow]").as_expr(ordering_col)
+        salted_ordering = ops.strconcat_op.as_expr(
+            string_ordering, ex.const(str(random_state))
         )
-
-        # Apply hash method to sum col and order by it.
-        block, string_sum_col = block.apply_binary_op(
-            string_ordering_col, random_state_col, ops.strconcat_op
-        )
-        block, hash_string_sum_col = block.apply_unary_op(string_sum_col, ops.hash_op)
-        block = block.order_by([ordering.OrderingColumnReference(hash_string_sum_col)])
-
-        intervals = []
-        cur = 0
-
-        for sample_size in sample_sizes:
-            intervals.append((cur, cur + sample_size))
-            cur += sample_size
-
-        sliced_blocks = [
-            typing.cast(Block, block.slice(start=lower, stop=upper))
-            for lower, upper in intervals
-        ]
+        block, hash_col = block.project_expr(ops.hash_op.as_expr(salted_ordering))
+        block = block.order_by([ordering.OrderingColumnReference(hash_col)])
+
+        # Number the shuffled rows once and take every sample from that same
+        # numbering, rather than re-numbering the rows for each slice.
+        block, shuffled_offsets_col = block.promote_offsets()
+        bounds = [0, *itertools.accumulate(sample_sizes)]
+        sliced_blocks = []
+        for lower, upper in zip(bounds, bounds[1:]):
+            in_range = ops.lt_op.as_expr(shuffled_offsets_col, ex.const(upper))
+            if lower > 0:
+                # The first sample, which is the only one for sample(), has
+                # no lower bound to check.
+                in_range = ops.and_op.as_expr(
+                    ops.ge_op.as_expr(shuffled_offsets_col, ex.const(lower)),
+                    in_range,
+                )
+            sliced_block, in_range_col = block.project_expr(in_range)
+            sliced_blocks.append(
+                sliced_block.filter_and_select(in_range_col, block.value_columns)
+            )
         if preserve_order:
             sliced_blocks = [
                 sliced_block.order_by([ordering.OrderingColumnReference(ordering_col)])
                 for sliced_block in sliced_blocks
             ]
 
-        drop_cols = [
-            random_state_col,
-            ordering_col,
-            string_ordering_col,
-            string_sum_col,
-            hash_string_sum_col,
-        ]
+        drop_cols = [ordering_col, hash_col, shuffled_offsets_col]
         return [sliced_block.drop_columns(drop_cols) for sliced_block in sliced_blocks]
 
     def _compute_dry_run(
@@ -643,11 +698,13 @@ class Block:
                 f"The column labels size `{len(label_list)} ` should equal to the value"
                 + f"columns size: {len(self.value_columns)}."
             )
-        return Block(
-            self._expr,
-            index_columns=self.index_columns,
-            column_labels=label_list,
-            index_labels=self.index.names,
+        return self._preserving_row_count(
+            Block(
+                self._expr,
+                index_columns=self.index_columns,
+                column_labels=label_list,
+                index_labels=self._index_labels,
+            )
         )
 
     def with_index_labels(self, value: typing.Sequence[Label]) -> Block:
@@ -656,12 +713,30 @@ class Block:
                 f"The index labels size `{len(value)} ` should equal to the index "
                 + f"columns size: {len(self.index_columns)}."
             )
-        return Block(
+        return self._preserving_row_count(
+            Block(
+                self._expr,
+                index_columns=self.index_columns,
+                column_labels=self.column_labels,
+                index_labels=tuple(value),
+            )
+        )
+
+    def with_unique_keys(self, column_ids: typing.Iterable[str]) -> Block:
+        """Returns the block, marked as having no duplicate rows over column_ids."""
+        block = Block(
             self._expr,
             index_columns=self.index_columns,
             column_labels=self.column_labels,
-            index_labels=tuple(value),
+            index_labels=self._index_labels,
         )
+        block._unique_keys = self._unique_keys | {frozenset(column_ids)}
+        return block
+
+    def is_unique_over(self, column_ids: typing.Iterable[str]) -> bool:
+        """Whether the rows are already known to be unique over column_ids."""
+        column_id_set = frozenset(column_ids)
+        return any(key <= column_id_set for key in self._unique_keys)
 
     def project_expr(
         self, expr: ex.Expression, label: Label = None
@@ -676,9 +751,40 @@ class Block:
             array_val,
             index_columns=self.index_columns,
             column_labels=[*self.column_labels, label],
-            index_labels=self.index.names,
+            index_labels=self._index_labels,
         )
-        return (block, result_id)
+        return (self._preserving_row_count(block), result_id)
+
+    def project_exprs(
+        self,
+        exprs: Sequence[ex.Expression],
+        labels: typing.Union[Sequence[Label], pd.Index],
+        drop=False,
+    ) -> typing.Tuple[Block, Sequence[str]]:
+        """
+        Apply scalar expressions to the block as a single projection. Creates a new column for each result.
+
+        If drop is True, the results replace all of the existing value columns.
+        """
+        result_ids = [guid.generate_guid() for _ in exprs]
+        kept_ids = self.index_columns if drop else self._expr.column_ids
+        array_val = self._expr.projection(
+            [
+                *((ex.free_var(col_id), col_id) for col_id in kept_ids),
+                *zip(exprs, result_ids),
+            ]
+        )
+        if drop:
+            new_labels = labels
+        else:
+            new_labels = self.column_labels.append(pd.Index(labels))
+        block = Block(
+            array_val,
+            index_columns=self.index_columns,
+            column_labels=new_labels,
+            index_labels=self._index_labels,
+        )
+        return (self._preserving_row_count(block), result_ids)
 
     def apply_unary_op(
         self, column: str, op: ops.UnaryOp, result_label: Label = None
@@ -719,16 +825,38 @@ class Block:
         skip_null_groups: bool = False,
         never_skip_nulls: bool = False,
     ) -> typing.Tuple[Block, typing.Sequence[str]]:
+        col_id_to_label = self.col_id_to_label
+        return self.multi_apply_window_ops(
+            [(col_id, op, window_spec) for col_id in columns],
+            result_labels=[col_id_to_label[col_id] for col_id in columns],
+            skip_null_groups=skip_null_groups,
+            never_skip_nulls=never_skip_nulls,
+        )
+
+    def multi_apply_window_ops(
+        self,
+        window_ops: typing.Sequence[
+            typing.Tuple[str, agg_ops.WindowOp, core.WindowSpec]
+        ],
+        result_labels: typing.Optional[typing.Sequence[Label]] = None,
+        *,
+        skip_null_groups: bool = False,
+        never_skip_nulls: bool = False,
+    ) -> typing.Tuple[Block, typing.Sequence[str]]:
+        """
+        Apply independent (column, op, window) window operations. The results
+        are only reprojected after the last one, so all of them are evaluated
+        in a single select. No window may take another's output as its input.
+        """
         block = self
         result_ids = []
-        for i, col_id in enumerate(columns):
-            label = self.col_id_to_label[col_id]
+        for i, (col_id, op, window_spec) in enumerate(window_ops):
             block, result_id = block.apply_window_op(
                 col_id,
                 op,
                 window_spec=window_spec,
-                skip_reproject_unsafe=(i + 1) < len(columns),
-                result_label=label,
+                skip_reproject_unsafe=(i + 1) < len(window_ops),
+                result_label=result_labels[i] if result_labels else None,
                 skip_null_groups=skip_null_groups,
                 never_skip_nulls=never_skip_nulls,
             )
@@ -740,17 +868,25 @@ class Block:
         columns: typing.Sequence[str],
         op: ops.UnaryOp,
     ) -> Block:
-        block = self
-        for i, col_id in enumerate(columns):
-            label = self.col_id_to_label[col_id]
-            block, result_id = block.apply_unary_op(
-                col_id,
-                op,
-                result_label=label,
-            )
-            block = block.copy_values(result_id, col_id)
-            block = block.drop_columns([result_id])
-        return block
+        # Apply the op to every column in place with one projection.
+        columns_to_apply = set(columns)
+        expr = self._expr.projection(
+            [
+                (
+                    op.as_expr(col_id)
+                    if col_id in columns_to_apply
+                    else ex.free_var(col_id),
+                    col_id,
+                )
+                for col_id in self._expr.column_ids
+            ]
+        )
+        return Block(
+            expr,
+            index_columns=self.index_columns,
+            column_labels=self.column_labels,
+            index_labels=self._index_labels,
+        )
 
     def apply_window_op(
         self,
@@ -783,6 +919,8 @@ class Block:
             column_labels=[*self.column_labels, result_label],
             index_labels=self._index_labels,
         )
+        if not skip_null_groups:
+            block = self._preserving_row_count(block)
         return (block, result_id)
 
     def copy_values(self, source_column_id: str, destination_column_id: str) -> Block:
@@ -794,6 +932,27 @@ class Block:
             index_labels=self._index_labels,
         )
 
+    def copy_values_multi(
+        self, source_column_id: str, destination_column_ids: typing.Sequence[str]
+    ) -> Block:
+        """Overwrite each of the destination columns with the source column as a single projection."""
+        destinations = set(destination_column_ids)
+        expr = self.expr.projection(
+            [
+                (
+                    ex.free_var(source_column_id if col_id in destinations else col_id),
+                    col_id,
+                )
+                for col_id in self.expr.column_ids
+            ]
+        )
+        return Block(
+            expr,
+            index_columns=self.index_columns,
+            column_labels=self.column_labels,
+            index_labels=self._index_labels,
+        )
+
     def create_constant(
         self,
         scalar_constant: typing.Any,
@@ -810,13 +969,13 @@ class Block:
                 expr,
                 index_columns=self.index_columns,
                 column_labels=labels,
-                index_labels=self.index.names,
+                index_labels=self._index_labels,
             ),
             result_id,
         )
 
     def assign_label(self, column_id: str, new_label: Label) -> Block:
-        col_index = self.value_columns.index(column_id)
+        col_index = self.col_id_to_position[column_id]
         # Create index copy with label inserted
         # See: https://pandas.pydata.org/docs/reference/api/pandas.Index.insert.html
         new_labels = self.column_labels.insert(col_index, new_label).delete(
@@ -829,7 +988,24 @@ class Block:
             self._expr.filter_by_id(column_id, keep_null),
             index_columns=self.index_columns,
             column_labels=self.column_labels,
-            index_labels=self.index.names,
+            index_labels=self._index_labels,
+        )
+
+    def filter_and_select(
+        self,
+        column_id: str,
+        value_column_ids: typing.Sequence[str],
+        keep_null: bool = False,
+    ) -> Block:
+        """Filter on the given column and keep only the given value columns, as a single block."""
+        expr = self._expr.filter_by_id(column_id, keep_null).select_columns(
+            [*self.index_columns, *value_column_ids]
+        )
+        return Block(
+            expr,
+            index_columns=self.index_columns,
+            column_labels=self._get_labels_for_columns(value_column_ids),
+            index_labels=self._index_labels,
         )
 
     def aggregate_all_and_stack(
@@ -876,7 +1052,7 @@ class Block:
                 dtype=dtype,
             )
             index_aggregations = [
-                (col_id, agg_ops.AnyValueOp(), col_id)
+                (col_id, agg_ops.any_value_op, col_id)
                 for col_id in [*self.index_columns]
             ]
             main_aggregation = (value_col_id, operation, value_col_id)
@@ -898,7 +1074,9 @@ class Block:
     def select_columns(self, ids: typing.Sequence[str]) -> Block:
         expr = self._expr.select_columns([*self.index_columns, *ids])
         col_labels = self._get_labels_for_columns(ids)
-        return Block(expr, self.index_columns, col_labels, self.index.names)
+        return self._preserving_row_count(
+            Block(expr, self.index_columns, col_labels, self._index_labels)
+        )
 
     def drop_columns(self, ids_to_drop: typing.Sequence[str]) -> Block:
         """Drops columns by id. Can drop index"""
@@ -911,7 +1089,9 @@ class Block:
             col_id for col_id in self.value_columns if (col_id not in ids_to_drop)
         ]
         labels = self._get_labels_for_columns(remaining_value_col_ids)
-        return Block(expr, self.index_columns, labels, self.index.names)
+        return self._preserving_row_count(
+            Block(expr, self.index_columns, labels, self._index_labels)
+        )
 
     def rename(
         self,
@@ -1033,9 +1213,12 @@ class Block:
         """Get a list of stats as a deferred block object."""
         label_col_id = guid.generate_guid()
         labels = [stat.name for stat in stats]
+        # All stats are computed side by side in one aggregation; repeated stats
+        # are only computed once and share an output column.
+        unique_stats = {stat.name: stat for stat in stats}.values()
         aggregations = [
             (col_id, stat, f"{col_id}-{stat.name}")
-            for stat in stats
+            for stat in unique_stats
             for col_id in column_ids
         ]
         columns = [
@@ -1195,15 +1378,23 @@ class Block:
         """
         # TODO(swast): Select a subset of columns if max_columns is less than the
         # number of columns in the schema.
-        count = self.shape[0]
-        if count > max_results:
-            head_block = self.slice(0, max_results)
+        if self._cached_row_count is not None:
+            count = self._cached_row_count
+            head_block = self.slice(0, max_results) if count > max_results else self
+            computed_df, query_job = head_block.to_pandas()
         else:
-            head_block = self
-        computed_df, query_job = head_block.to_pandas()
+            # Fetch one extra row so that the row count only needs a separate
+            # query when there are more rows than will be displayed.
+            computed_df, query_job = self.slice(0, max_results + 1).to_pandas()
+            if len(computed_df) > max_results:
+                computed_df = computed_df.iloc[:max_results]
+                count = self.shape[0]
+            else:
+                count = len(computed_df)
+                self._cached_row_count = count
         formatted_df = computed_df.set_axis(self.column_labels, axis=1)
         # we reset the axis and substitute the bf index name for the default
-        formatted_df.index.name = self.index.name
+        formatted_df.index.name = self._index_labels[0]
         return formatted_df, count, query_job
 
     def promote_offsets(self, label: Label = None) -> typing.Tuple[Block, str]:
@@ -1237,7 +1428,7 @@ class Block:
                 expr,
                 index_columns=self.index_columns,
                 column_labels=self.column_labels,
-                index_labels=self.index.names,
+                index_labels=self._index_labels,
             )
         if axis_number == 1:
             return self.rename(columns=lambda label: f"{prefix}{label}")
@@ -1260,7 +1451,7 @@ class Block:
                 expr,
                 index_columns=self.index_columns,
                 column_labels=self.column_labels,
-                index_labels=self.index.names,
+                index_labels=self._index_labels,
             )
         if axis_number == 1:
             return self.rename(columns=lambda label: f"{label}{suffix}")
@@ -1302,7 +1493,7 @@ class Block:
                 column_ids.append(masked_id)
 
         block = block.select_columns(column_ids)
-        aggregations = [(col_id, agg_ops.AnyValueOp()) for col_id in column_ids]
+        aggregations = [(col_id, agg_ops.any_value_op) for col_id in column_ids]
         result_block, _ = block.aggregate(
             by_column_ids=self.index_columns,
             aggregations=aggregations,
@@ -1413,12 +1604,13 @@ class Block:
     ):
         dtype = None
         input_columns: list[Optional[str]] = []
+        label_to_col_id = self.label_to_col_id
         for uvalue in stack_labels:
             label_to_match = (*col_label, *uvalue)
             label_to_match = (
                 label_to_match[0] if len(label_to_match) == 1 else label_to_match
             )
-            matching_ids = self.label_to_col_id.get(label_to_match, [])
+            matching_ids = label_to_col_id.get(label_to_match, ())
             input_id = matching_ids[0] if len(matching_ids) > 0 else None
             if input_id:
                 if dtype and dtype != self._column_type(input_id):
@@ -1432,7 +1624,7 @@ class Block:
         return tuple(input_columns), dtype or pd.Float64Dtype()
 
     def _column_type(self, col_id: str) -> bigframes.dtypes.Dtype:
-        col_offset = self.value_columns.index(col_id)
+        col_offset = self.col_id_to_position[col_id]
         dtype = self.dtypes[col_offset]
         return dtype
 
@@ -1568,53 +1760,66 @@ class Block:
             type=how,
         )
         joined_expr = self.expr.join(other.expr, join_def=join_def)
-        result_columns = []
-        matching_join_labels = []
-
-        coalesced_ids = []
         get_column_left = join_def.get_left_mapping()
         get_column_right = join_def.get_right_mapping()
-        for left_id, right_id in zip(left_join_ids, right_join_ids):
-            coalesced_id = guid.generate_guid()
-            joined_expr = joined_expr.project_to_id(
-                ops.coalesce_op.as_expr(
-                    get_column_left[left_id], get_column_right[right_id]
-                ),
-                coalesced_id,
+
+        coalesced_ids = [guid.generate_guid() for _ in left_join_ids]
+        coalesced_exprs = {
+            coalesced_id: ops.coalesce_op.as_expr(
+                get_column_left[left_id], get_column_right[right_id]
+            )
+            for coalesced_id, left_id, right_id in zip(
+                coalesced_ids, left_join_ids, right_join_ids
             )
-            coalesced_ids.append(coalesced_id)
+        }
+        left_key_parts = {col_id: i for i, col_id in enumerate(left_join_ids)}
+        right_key_parts = {col_id: i for i, col_id in enumerate(right_join_ids)}
 
+        left_labels = self.col_id_to_label
+        right_labels = other.col_id_to_label
+        result_columns = []
+        matching_join_labels = []
         for col_id in self.value_columns:
-            if col_id in left_join_ids:
-                key_part = left_join_ids.index(col_id)
-                matching_right_id = right_join_ids[key_part]
-                if (
-                    self.col_id_to_label[col_id]
-                    == other.col_id_to_label[matching_right_id]
-                ):
-                    matching_join_labels.append(self.col_id_to_label[col_id])
-                    result_columns.append(coalesced_ids[key_part])
-                else:
-                    result_columns.append(get_column_left[col_id])
+            key_part = left_key_parts.get(col_id)
+            if key_part is not None and (
+                left_labels[col_id] == right_labels[right_join_ids[key_part]]
+            ):
+                matching_join_labels.append(left_labels[col_id])
+                result_columns.append(coalesced_ids[key_part])
             else:
                 result_columns.append(get_column_left[col_id])
         for col_id in other.value_columns:
-            if col_id in right_join_ids:
-                key_part = right_join_ids.index(col_id)
-                if other.col_id_to_label[matching_right_id] in matching_join_labels:
-                    pass
-                else:
-                    result_columns.append(get_column_right[col_id])
-            else:
-                result_columns.append(get_column_right[col_id])
+            if (
+                col_id in right_key_parts
+                and right_labels[col_id] in matching_join_labels
+            ):
+                continue
+            result_columns.append(get_column_right[col_id])
 
         if sort:
             # sort uses coalesced join keys always
+            joined_expr = joined_expr.projection(
+                [
+                    *(
+                        (ex.free_var(col_id), col_id)
+                        for col_id in joined_expr.column_ids
+                    ),
+                    *((expr, col_id) for col_id, expr in coalesced_exprs.items()),
+                ]
+            )
             joined_expr = joined_expr.order_by(
                 [ordering.OrderingColumnReference(col_id) for col_id in coalesced_ids],
             )
-
-        joined_expr = joined_expr.select_columns(result_columns)
+            joined_expr = joined_expr.select_columns(result_columns)
+        else:
+            # Compute the coalesced keys in the same projection that selects the
+            # output columns.
+            joined_expr = joined_expr.projection(
+                [
+                    (coalesced_exprs.get(col_id, ex.free_var(col_id)), col_id)
+                    for col_id in result_columns
+                ]
+            )
         labels = utils.merge_column_labels(
             self.column_labels,
             other.column_labels,
@@ -1632,7 +1837,7 @@ class Block:
             self._expr._reproject_to_table(),
             index_columns=self.index_columns,
             column_labels=self.column_labels,
-            index_labels=self.index.names,
+            index_labels=self._index_labels,
         )
 
     def is_monotonic_increasing(
@@ -1661,31 +1866,31 @@ class Block:
                 If include_index is set to False, index_column_id_list and index_column_label_list
                 return empty lists.
         """
-        array_value = self._expr
-        col_labels, idx_labels = list(self.column_labels), list(self.index_labels)
-        old_col_ids, old_idx_ids = list(self.value_columns), list(self.index_columns)
+        # Blocks are immutable, so the compiled SQL can be reused.
+        if include_index not in self._sql_cache:
+            self._sql_cache[include_index] = self._compile_sql_query(include_index)
+        sql, idx_ids, idx_labels = self._sql_cache[include_index]
+        return sql, list(idx_ids), list(idx_labels)
 
+    def _compile_sql_query(
+        self, include_index: bool
+    ) -> typing.Tuple[str, list[str], list[Label]]:
+        array_value = self._expr
+        idx_labels = list(self.index_labels) if include_index else []
         if not include_index:
-            idx_labels, old_idx_ids = [], []
             array_value = array_value.drop_columns(self.index_columns)
 
-        old_ids = old_idx_ids + old_col_ids
-
-        new_col_ids, new_idx_ids = utils.get_standardized_ids(col_labels, idx_labels)
-        new_ids = new_idx_ids + new_col_ids
-
-        substitutions = {}
-        for old_id, new_id in zip(old_ids, new_ids):
-            # TODO(swast): Do we need to further escape this, or can we rely on
-            # the BigQuery unicode column name feature?
-            substitutions[old_id] = new_id
+        new_col_ids, new_idx_ids = utils.get_standardized_ids(
+            self.column_labels, idx_labels
+        )
+        # TODO(swast): Do we need to further escape this, or can we rely on
+        # the BigQuery unicode column name feature?
+        substitutions = dict(zip(self.value_columns, new_col_ids))
+        if include_index:
+            substitutions.update(zip(self.index_columns, new_idx_ids))
 
         sql = self.session._to_sql(array_value, col_id_overrides=substitutions)
-        return (
-            sql,
-            new_ids[: len(idx_labels)],
-            idx_labels,
-        )
+        return (sql, new_idx_ids, idx_labels)
 
     def cached(self) -> Block:
         """Write the block to a session table and create a new block object that references it."""
@@ -1744,7 +1949,7 @@ class Block:
         last_result_id = None
         for column_id in column_ids[::-1]:
             block, lag_result_id = block.apply_window_op(
-                column_id, agg_ops.ShiftOp(period), window
+                column_id, agg_ops.shift_op(period), window
             )
             block, strict_monotonic_id = block.apply_binary_op(
                 column_id, lag_result_id, ops.gt_op if increasing else ops.lt_op
@@ -1789,6 +1994,7 @@ def block_from_local(data) -> Block:
             list(pd_data.columns), is_potential_multiindex=False
         ),
         axis="columns",
+        copy=False,
     )
     index_ids = pd_data.columns[: len(index_labels)]
 
@@ -1801,6 +2007,63 @@ def block_from_local(data) -> Block:
     )
 
 
+def combine_shared_source_columns(
+    blocks: typing.Sequence[Block],
+) -> Optional[Block]:
+    """
+    Combines the value columns of several blocks into one block without a join,
+    if every block only selects columns from the same source with the same index.
+
+    Returns None if the blocks do not share a source.
+    """
+    sources = [_unwrap_selections(block) for block in blocks]
+    first_node, first_index_ids, _ = sources[0]
+    index_labels = blocks[0].index.names
+    for block, (node, index_ids, _) in zip(blocks[1:], sources[1:]):
+        if (
+            node is not first_node
+            or index_ids != first_index_ids
+            or block.index.names != index_labels
+        ):
+            return None
+
+    index_columns = blocks[0].index_columns
+    assignments = [
+        (ex.free_var(source_id), col_id)
+        for source_id, col_id in zip(first_index_ids, index_columns)
+    ]
+    for _, _, value_ids in sources:
+        assignments.extend(
+            (ex.free_var(source_id), guid.generate_guid()) for source_id in value_ids
+        )
+    return Block(
+        core.ArrayValue(first_node).projection(assignments),
+        index_columns=index_columns,
+        column_labels=[label for block in blocks for label in block.column_labels],
+        index_labels=index_labels,
+    )
+
+
+def _unwrap_selections(
+    block: Block,
+) -> typing.Tuple[nodes.BigFrameNode, typing.List[str], typing.List[str]]:
+    """Strips column selections from the block, returning the underlying node and the ids of the index and value columns in it."""
+    node = block.expr.node
+    index_ids = list(block.index_columns)
+    value_ids = list(block.value_columns)
+    while isinstance(node, nodes.ProjectionNode) and all(
+        isinstance(expr, ex.UnboundVariableExpression) for expr, _ in node.assignments
+    ):
+        source_ids = {
+            col_id: typing.cast(ex.UnboundVariableExpression, expr).id
+            for expr, col_id in node.assignments
+        }
+        index_ids = [source_ids[col_id] for col_id in index_ids]
+        value_ids = [source_ids[col_id] for col_id in value_ids]
+        node = node.child
+    return node, index_ids, value_ids
+
+
 def _cast_index(block: Block, dtypes: typing.Sequence[bigframes.dtypes.Dtype]):
     original_block = block
     result_ids = []
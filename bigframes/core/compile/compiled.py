@@ -77,6 +77,10 @@ class BaseIbisIR(abc.ABC):
             ).get_name(): column
             for column in self._columns
         }
+        # IRs are immutable and cached per node, so their SQL can be reused.
+        self._sql_cache: typing.Dict[
+            typing.Tuple[typing.Tuple[typing.Tuple[str, str], ...], bool], str
+        ] = {}
 
     @property
     def columns(self) -> typing.Tuple[ibis_types.Value, ...]:
@@ -86,9 +90,12 @@ class BaseIbisIR(abc.ABC):
     def column_ids(self) -> typing.Sequence[str]:
         return tuple(self._column_names.keys())
 
-    @property
+    @functools.cached_property
     def _reduced_predicate(self) -> typing.Optional[ibis_types.BooleanValue]:
-        """Returns the frame's predicates as an equivalent boolean value, useful where a single predicate value is preferred."""
+        """Returns the frame's predicates as an equivalent boolean value, useful where a single predicate value is preferred.
+
+        Predicates never change after construction, so this is only reduced once per IR.
+        """
         return (
             _reduce_predicate_list(self._predicates).name(PREDICATE_COLUMN)
             if self._predicates
@@ -168,7 +175,7 @@ class BaseIbisIR(abc.ABC):
 
     def _get_ibis_column(self, key: str) -> ibis_types.Value:
         """Gets the Ibis expression for a given column."""
-        if key not in self.column_ids:
+        if key not in self._column_names:
             raise ValueError(
                 "Column name {} not in set of values: {}".format(key, self.column_ids)
             )
@@ -216,12 +223,14 @@ class UnorderedIR(BaseIbisIR):
     ) -> str:
         if offset_column or sorted:
             raise ValueError("Cannot produce sorted sql in unordered mode")
-        sql = ibis_bigquery.Backend().compile(
-            self._to_ibis_expr(
-                col_id_overrides=col_id_overrides,
+        key = (tuple(col_id_overrides.items()), sorted)
+        if key not in self._sql_cache:
+            self._sql_cache[key] = ibis_bigquery.Backend().compile(
+                self._to_ibis_expr(
+                    col_id_overrides=col_id_overrides,
+                )
             )
-        )
-        return typing.cast(str, sql)
+        return self._sql_cache[key]
 
     def row_count(self) -> OrderedIR:
         original_table = self._to_ibis_expr()
@@ -296,11 +305,7 @@ class UnorderedIR(BaseIbisIR):
         base_table = table
         if self._reduced_predicate is not None:
             table = table.filter(base_table[PREDICATE_COLUMN])
-        table = table.drop(*columns_to_drop)
-        if col_id_overrides:
-            table = table.rename(
-                {value: key for key, value in col_id_overrides.items()}
-            )
+        table = _select_output_columns(table, columns_to_drop, col_id_overrides)
         if fraction is not None:
             table = table.filter(ibis.random() < ibis.literal(fraction))
         return table
@@ -734,6 +739,9 @@ class OrderedIR(BaseIbisIR):
             predicates=self._predicates,
         )
 
+    def is_ordered_by(self, by: Sequence[OrderingColumnReference]) -> bool:
+        return self._ordering.is_ordered_by(by)
+
     def order_by(self, by: Sequence[OrderingColumnReference]) -> OrderedIR:
         expr_builder = self.builder()
         expr_builder.ordering = self._ordering.with_ordering_columns(by)
@@ -1003,6 +1011,9 @@ class OrderedIR(BaseIbisIR):
         col_id_overrides: typing.Mapping[str, str] = {},
         sorted: bool = False,
     ) -> str:
+        key = (tuple(col_id_overrides.items()), sorted)
+        if key in self._sql_cache:
+            return self._sql_cache[key]
         sql = ibis_bigquery.Backend().compile(
             self._to_ibis_expr(
                 ordering_mode="unordered",
@@ -1025,7 +1036,8 @@ class OrderedIR(BaseIbisIR):
                 ")\n"
                 f"{order_by_clause}\n"
             )
-        return typing.cast(str, sql)
+        self._sql_cache[key] = sql
+        return sql
 
     def _ordering_clause(self, ordering: Iterable[OrderingColumnReference]) -> str:
         parts = []
@@ -1123,11 +1135,7 @@ class OrderedIR(BaseIbisIR):
         base_table = table
         if self._reduced_predicate is not None:
             table = table.filter(base_table[PREDICATE_COLUMN])
-        table = table.drop(*columns_to_drop)
-        if col_id_overrides:
-            table = table.rename(
-                {value: key for key, value in col_id_overrides.items()}
-            )
+        table = _select_output_columns(table, columns_to_drop, col_id_overrides)
         if fraction is not None:
             table = table.filter(ibis.random() < ibis.literal(fraction))
         return table
@@ -1252,7 +1260,7 @@ class OrderedIR(BaseIbisIR):
         if ordering_mode == "offset_col":
             return (self._create_offset_column().name(order_col_name),)
         elif ordering_mode == "string_encoded":
-            return (self._create_string_ordering_column().name(order_col_name),)
+            return (self._string_ordering_column.name(order_col_name),)
         elif expose_hidden_cols:
             return self._hidden_ordering_columns
         return ()
@@ -1268,7 +1276,9 @@ class OrderedIR(BaseIbisIR):
             offsets = ibis.row_number().over(window)
             return typing.cast(ibis_types.IntegerColumn, offsets)
 
-    def _create_string_ordering_column(self) -> ibis_types.StringColumn:
+    @functools.cached_property
+    def _string_ordering_column(self) -> ibis_types.StringColumn:
+        """String encoded order id for this expression, built once and reused by every consumer."""
         if self._ordering.total_order_col and self._ordering.is_string_encoded:
             string_order_ids = self._get_any_column(
                 self._ordering.total_order_col.column_id
@@ -1352,16 +1362,38 @@ class OrderedIR(BaseIbisIR):
             )
 
 
+def _select_output_columns(
+    table: ibis_types.Table,
+    columns_to_drop: typing.Sequence[str],
+    col_id_overrides: typing.Mapping[str, str],
+) -> ibis_types.Table:
+    """Drop and rename output columns in a single projection."""
+    if not columns_to_drop and not col_id_overrides:
+        return table
+    return table.select(
+        [
+            table[col].name(col_id_overrides.get(col, col))
+            for col in table.columns
+            if col not in columns_to_drop
+        ]
+    )
+
+
 def _reduce_predicate_list(
     predicate_list: typing.Collection[ibis_types.BooleanValue],
 ) -> ibis_types.BooleanValue:
     """Converts a list of predicates BooleanValues into a single BooleanValue."""
     if len(predicate_list) == 0:
         raise ValueError("Cannot reduce empty list of predicates")
-    if len(predicate_list) == 1:
-        (item,) = predicate_list
-        return item
-    return functools.reduce(lambda acc, pred: acc.__and__(pred), predicate_list)
+    # Combine adjacent pairs so the resulting AND tree has log(n) depth rather than n.
+    # Note: ibis.and_ is a left fold, which would produce a tree of depth n.
+    items = list(predicate_list)
+    while len(items) > 1:
+        paired = [left & right for left, right in zip(items[0::2], items[1::2])]
+        if len(items) % 2:
+            paired.append(items[-1])
+        items = paired
+    return items[0]
 
 
 def _convert_ordering_to_table_values(
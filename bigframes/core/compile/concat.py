@@ -17,6 +17,7 @@ import math
 import typing
 
 import ibis
+import ibis.expr.datatypes as ibis_dtypes
 
 import bigframes.core.compile.compiled as compiled
 from bigframes.core.ordering import (
@@ -27,6 +28,7 @@ from bigframes.core.ordering import (
 )
 
 ORDER_ID_COLUMN = "bigframes_ordering_id"
+SOURCE_ID_COLUMN = "bigframes_source_id"
 
 
 def concat_unordered(
@@ -56,6 +58,8 @@ def concat_ordered(
     """Append together multiple ArrayValue objects."""
     if len(items) == 1:
         return items[0]
+    if not any(expr._ordering.is_string_encoded for expr in items):
+        return _concat_ordered_by_offsets(items)
 
     tables = []
     prefix_base = 10
@@ -98,3 +102,48 @@ def concat_ordered(
         hidden_ordering_columns=[combined_table[ORDER_ID_COLUMN]],
         ordering=ordering,
     )
+
+
+def _concat_ordered_by_offsets(
+    items: typing.Sequence[compiled.OrderedIR],
+) -> compiled.OrderedIR:
+    """Append together ArrayValue objects, ordering by (input index, offset).
+
+    Ordering by a pair of integers avoids building and concatenating fixed
+    length order strings when none of the inputs are string encoded already.
+    """
+    tables = []
+    for i, expr in enumerate(items):
+        table = expr._to_ibis_expr(
+            ordering_mode="offset_col", order_col_name=ORDER_ID_COLUMN
+        )
+        # Rename the value columns based on horizontal offset before applying union.
+        table = table.select(
+            [
+                table[col].name(f"column_{j}") if col != ORDER_ID_COLUMN else table[col]
+                for j, col in enumerate(table.columns)
+            ]
+            + [ibis.literal(i, ibis_dtypes.int64).name(SOURCE_ID_COLUMN)]
+        )
+        tables.append(table)
+    combined_table = ibis.union(*tables)
+    ordering = ExpressionOrdering(
+        ordering_value_columns=(
+            OrderingColumnReference(SOURCE_ID_COLUMN),
+            OrderingColumnReference(ORDER_ID_COLUMN),
+        ),
+        total_ordering_columns=frozenset([SOURCE_ID_COLUMN, ORDER_ID_COLUMN]),
+    )
+    return compiled.OrderedIR(
+        combined_table,
+        columns=[
+            combined_table[col]
+            for col in combined_table.columns
+            if col not in (SOURCE_ID_COLUMN, ORDER_ID_COLUMN)
+        ],
+        hidden_ordering_columns=[
+            combined_table[SOURCE_ID_COLUMN],
+            combined_table[ORDER_ID_COLUMN],
+        ],
+        ordering=ordering,
+    )
@@ -16,7 +16,6 @@
 
 from __future__ import annotations
 
-import functools
 import typing
 
 import ibis
@@ -27,10 +26,32 @@ import bigframes.core.compile.compiled as compiled
 import bigframes.core.join_def as join_def
 import bigframes.core.joins as joining
 import bigframes.core.ordering as orderings
+import bigframes.dtypes
 
 SUPPORTED_ROW_IDENTITY_HOW = {"outer", "left", "inner"}
 
 
+def can_join_by_row_identity(
+    left: typing.Union[compiled.OrderedIR, compiled.UnorderedIR],
+    right: typing.Union[compiled.OrderedIR, compiled.UnorderedIR],
+    join_def: join_def.JoinDefinition,
+) -> bool:
+    """Whether the join can be computed by row identity instead of a SQL JOIN."""
+    return (
+        join_def.type in SUPPORTED_ROW_IDENTITY_HOW
+        and (left._table is right._table or left._table.equals(right._table))
+        # Make sure we're joining on exactly the same column(s), at least with
+        # regards to value its possible that they both have the same names but
+        # were modified in different ways. Ignore differences in the names.
+        and all(
+            left._get_ibis_column(lcol)
+            .name("index")
+            .equals(right._get_ibis_column(rcol).name("index"))
+            for lcol, rcol in join_def.conditions
+        )
+    )
+
+
 def join_by_row_identity_unordered(
     left: compiled.UnorderedIR,
     right: compiled.UnorderedIR,
@@ -42,7 +63,7 @@ def join_by_row_identity_unordered(
             f"Only how='outer','left','inner' currently supported. {constants.FEEDBACK_LINK}"
         )
 
-    if not left._table.equals(right._table):
+    if left._table is not right._table and not left._table.equals(right._table):
         raise ValueError(
             "Cannot combine objects without an explicit join/merge key. "
             f"Left based on: {left._table.compile()}, but "
@@ -65,21 +86,22 @@ def join_by_row_identity_unordered(
         combined_predicates = list(joined_predicates)  # builder expects mutable list
 
     left_mask = (
-        left_relative_predicates if join_def.type in ["right", "outer"] else None
+        compiled._reduce_predicate_list(left_relative_predicates)
+        if left_relative_predicates and join_def.type in ["right", "outer"]
+        else None
     )
     right_mask = (
-        right_relative_predicates if join_def.type in ["left", "outer"] else None
+        compiled._reduce_predicate_list(right_relative_predicates)
+        if right_relative_predicates and join_def.type in ["left", "outer"]
+        else None
     )
 
     # Public mapping must use JOIN_NAME_REMAPPER to stay in sync with consumers of join result
     map_left_id = join_def.get_left_mapping()
     map_right_id = join_def.get_right_mapping()
     joined_columns = [
-        _mask_value(left._get_ibis_column(key), left_mask).name(map_left_id[key])
-        for key in left.column_ids
-    ] + [
-        _mask_value(right._get_ibis_column(key), right_mask).name(map_right_id[key])
-        for key in right.column_ids
+        *_mask_and_rename(left, map_left_id, left_mask),
+        *_mask_and_rename(right, map_right_id, right_mask),
     ]
 
     joined_expr = compiled.UnorderedIR(
@@ -101,7 +123,7 @@ def join_by_row_identity_ordered(
             f"Only how='outer','left','inner' currently supported. {constants.FEEDBACK_LINK}"
         )
 
-    if not left._table.equals(right._table):
+    if left._table is not right._table and not left._table.equals(right._table):
         raise ValueError(
             "Cannot combine objects without an explicit join/merge key. "
             f"Left based on: {left._table.compile()}, but "
@@ -124,10 +146,14 @@ def join_by_row_identity_ordered(
         combined_predicates = list(joined_predicates)  # builder expects mutable list
 
     left_mask = (
-        left_relative_predicates if join_def.type in ["right", "outer"] else None
+        compiled._reduce_predicate_list(left_relative_predicates)
+        if left_relative_predicates and join_def.type in ["right", "outer"]
+        else None
     )
     right_mask = (
-        right_relative_predicates if join_def.type in ["left", "outer"] else None
+        compiled._reduce_predicate_list(right_relative_predicates)
+        if right_relative_predicates and join_def.type in ["left", "outer"]
+        else None
     )
 
     # Public mapping must use JOIN_NAME_REMAPPER to stay in sync with consumers of join result
@@ -140,15 +166,12 @@ def join_by_row_identity_ordered(
     map_right_id = {**rpublicmapping, **rhiddenmapping}
 
     joined_columns = [
-        _mask_value(left._get_ibis_column(key), left_mask).name(map_left_id[key])
-        for key in left.column_ids
-    ] + [
-        _mask_value(right._get_ibis_column(key), right_mask).name(map_right_id[key])
-        for key in right.column_ids
+        *_mask_and_rename(left, map_left_id, left_mask),
+        *_mask_and_rename(right, map_right_id, right_mask),
     ]
 
     # If left isn't being masked, can just use left ordering
-    if not left_mask:
+    if left_mask is None:
         col_mapping = {
             order_ref.column_id: map_left_id[order_ref.column_id]
             for order_ref in left._ordering.ordering_value_columns
@@ -193,18 +216,28 @@ def join_by_row_identity_ordered(
     return joined_expr
 
 
+def _mask_and_rename(
+    ir: typing.Union[compiled.OrderedIR, compiled.UnorderedIR],
+    mapping: typing.Mapping[str, str],
+    mask: typing.Optional[ibis_types.BooleanValue] = None,
+) -> typing.List[ibis_types.Value]:
+    """Masks each value column of ir and renames it according to mapping, in a single pass."""
+    return [
+        _mask_value(bigframes.dtypes.ibis_value_to_canonical_type(value), mask).name(
+            mapping[key]
+        )
+        for key, value in ir._column_names.items()
+    ]
+
+
 def _mask_value(
     value: ibis_types.Value,
-    predicates: typing.Optional[typing.Sequence[ibis_types.BooleanValue]] = None,
+    mask: typing.Optional[ibis_types.BooleanValue] = None,
 ):
-    if predicates:
-        return (
-            ibis.case()
-            .when(_reduce_predicate_list(predicates), value)
-            .else_(ibis.null())
-            .end()
-        )
-    return value
+    """Nulls out the value wherever the (already reduced) mask predicate is not true."""
+    if mask is None:
+        return value
+    return ibis.case().when(mask, value).else_(ibis.null()).end()
 
 
 def _join_predicates(
@@ -219,8 +252,9 @@ def _join_predicates(
         if not right_predicates:
             return ()
         # TODO(tbergeron): Investigate factoring out common predicates
-        joined_predicates = _reduce_predicate_list(left_predicates).__or__(
-            _reduce_predicate_list(right_predicates)
+        joined_predicates = ibis.or_(
+            compiled._reduce_predicate_list(left_predicates),
+            compiled._reduce_predicate_list(right_predicates),
         )
         return (joined_predicates,)
     if join_type == "left":
@@ -247,19 +281,14 @@ def _get_relative_predicates(
     left_relative_predicates = tuple(left_predicates) or ()
     right_relative_predicates = tuple(right_predicates) or ()
     if left_predicates and right_predicates:
-        # Factor out common predicates needed for left/right column masking
-        left_relative_predicates = tuple(set(left_predicates) - set(right_predicates))
-        right_relative_predicates = tuple(set(right_predicates) - set(left_predicates))
+        # Factor out common predicates needed for left/right column masking.
+        # Compare by ibis operation, which is structural, rather than by expression.
+        left_keys = {pred.op(): pred for pred in left_predicates}
+        right_keys = {pred.op(): pred for pred in right_predicates}
+        left_relative_predicates = tuple(
+            pred for key, pred in left_keys.items() if key not in right_keys
+        )
+        right_relative_predicates = tuple(
+            pred for key, pred in right_keys.items() if key not in left_keys
+        )
     return (left_relative_predicates, right_relative_predicates)
-
-
-def _reduce_predicate_list(
-    predicate_list: typing.Collection[ibis_types.BooleanValue],
-) -> ibis_types.BooleanValue:
-    """Converts a list of predicates BooleanValues into a single BooleanValue."""
-    if len(predicate_list) == 0:
-        raise ValueError("Cannot reduce empty list of predicates")
-    if len(predicate_list) == 1:
-        (item,) = predicate_list
-        return item
-    return functools.reduce(lambda acc, pred: acc.__and__(pred), predicate_list)
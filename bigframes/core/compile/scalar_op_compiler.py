@@ -34,6 +34,8 @@ _ZERO = typing.cast(ibis_types.NumericValue, ibis_types.literal(0))
 _NAN = typing.cast(ibis_types.NumericValue, ibis_types.literal(np.nan))
 _INF = typing.cast(ibis_types.NumericValue, ibis_types.literal(np.inf))
 _NEG_INF = typing.cast(ibis_types.NumericValue, ibis_types.literal(-np.inf))
+# Zero literals typed to match a compared value, so no cast is needed in SQL.
+_ZERO_BY_TYPE: typing.Dict[ibis_dtypes.DataType, ibis_types.NumericValue] = {}
 
 # Approx Highest number you can pass in to EXP function and get a valid FLOAT64 result
 # FLOAT64 has 11 exponent bits, so max values is about 2**(2**10)
@@ -115,10 +117,19 @@ class ScalarOpCompiler:
         key = typing.cast(str, op_ref.name)
 
         def decorator(impl: typing.Callable[..., ibis_types.Value]):
-            def normalized_impl(args: typing.Sequence[ibis_types.Value], op: ops.RowOp):
-                if pass_op:
+            # Choose the adapter once here, rather than branching on every call.
+            if pass_op:
+
+                def normalized_impl(
+                    args: typing.Sequence[ibis_types.Value], op: ops.RowOp
+                ):
                     return impl(args[0], op)
-                else:
+
+            else:
+
+                def normalized_impl(
+                    args: typing.Sequence[ibis_types.Value], op: ops.RowOp
+                ):
                     return impl(args[0])
 
             self._register(key, normalized_impl)
@@ -144,10 +155,19 @@ class ScalarOpCompiler:
         key = typing.cast(str, op_ref.name)
 
         def decorator(impl: typing.Callable[..., ibis_types.Value]):
-            def normalized_impl(args: typing.Sequence[ibis_types.Value], op: ops.RowOp):
-                if pass_op:
+            # Choose the adapter once here, rather than branching on every call.
+            if pass_op:
+
+                def normalized_impl(
+                    args: typing.Sequence[ibis_types.Value], op: ops.RowOp
+                ):
                     return impl(args[0], args[1], op)
-                else:
+
+            else:
+
+                def normalized_impl(
+                    args: typing.Sequence[ibis_types.Value], op: ops.RowOp
+                ):
                     return impl(args[0], args[1])
 
             self._register(key, normalized_impl)
@@ -978,13 +998,15 @@ def floordiv_op(
     x_numeric = typing.cast(ibis_types.NumericValue, x)
     y_numeric = typing.cast(ibis_types.NumericValue, y)
     floordiv_expr = x_numeric // y_numeric
+    if _is_nonzero_literal(y):
+        return floordiv_expr
 
     # DIV(N, 0) will error in bigquery, but needs to return 0 for int, and inf for float in BQ so we short-circuit in this case.
     # Multiplying left by zero propogates nulls.
     zero_result = _INF if (x.type().is_floating() or y.type().is_floating()) else _ZERO
     return (
         ibis.case()
-        .when(y_numeric == _ZERO, zero_result * x_numeric)
+        .when(y_numeric == _zero_like(y_numeric), zero_result * x_numeric)
         .else_(floordiv_expr)
         .end()
     )
@@ -994,6 +1016,22 @@ def _is_float(x: ibis_types.Value):
     return isinstance(x, (ibis_types.FloatingColumn, ibis_types.FloatingScalar))
 
 
+def _zero_like(x: ibis_types.Value) -> ibis_types.NumericValue:
+    dtype = x.type()
+    if not dtype.is_numeric():
+        return _ZERO
+    if dtype not in _ZERO_BY_TYPE:
+        _ZERO_BY_TYPE[dtype] = typing.cast(
+            ibis_types.NumericValue, ibis_types.literal(0, type=dtype)
+        )
+    return _ZERO_BY_TYPE[dtype]
+
+
+def _is_nonzero_literal(x: ibis_types.Value) -> bool:
+    op = x.op()
+    return isinstance(op, ibis.expr.operations.generic.Literal) and op.value != 0
+
+
 @scalar_op_compiler.register_binary_op(ops.mod_op)
 @short_circuit_nulls()
 def mod_op(
@@ -1023,18 +1061,16 @@ def mod_op(
         bq_mod = typing.cast(ibis_types.NumericValue, bq_mod.cast(ibis_dtypes.float64))
 
     # In BigQuery returned value has the same sign as X. In pandas, the sign of y is used, so we need to flip the result if sign(x) != sign(y)
-    return (
-        ibis.case()
-        .when(
-            y_numeric == _ZERO,
+    case = ibis.case()
+    if not _is_nonzero_literal(y):
+        case = case.when(
+            y_numeric == _zero_like(y_numeric),
             _NAN * x_numeric if is_result_float else _ZERO * x_numeric,
         )  # Dummy op to propogate nulls and type from x arg
-        .when(
-            (y_numeric < _ZERO) & (bq_mod > _ZERO), (y_numeric + bq_mod)
-        )  # Convert positive result to negative
-        .when(
-            (y_numeric > _ZERO) & (bq_mod < _ZERO), (y_numeric + bq_mod)
-        )  # Convert negative result to positive
+    return (
+        case.when(
+            (y_numeric.sign() * bq_mod.sign()) < _ZERO, (y_numeric + bq_mod)
+        )  # Non-zero result with the opposite sign of y, shift it by y
         .else_(bq_mod)
         .end()
     )
@@ -1100,28 +1136,27 @@ def clip_op(
     upper: ibis_types.Value,
 ) -> ibis_types.Value:
     """Clips value to lower and upper bounds."""
-    if isinstance(lower, ibis_types.NullScalar) and (
-        not isinstance(upper, ibis_types.NullScalar)
-    ):
+    lower_is_null = isinstance(lower, ibis_types.NullScalar)
+    upper_is_null = isinstance(upper, ibis_types.NullScalar)
+    if lower_is_null and upper_is_null:
+        return original
+    elif lower_is_null:
         return (
             ibis.case()
             .when(upper.isnull() | (original > upper), upper)
             .else_(original)
             .end()
         )
-    elif (not isinstance(lower, ibis_types.NullScalar)) and isinstance(
-        upper, ibis_types.NullScalar
-    ):
+    elif upper_is_null:
         return (
             ibis.case()
             .when(lower.isnull() | (original < lower), lower)
             .else_(original)
             .end()
         )
-    elif isinstance(lower, ibis_types.NullScalar) and (
-        isinstance(upper, ibis_types.NullScalar)
-    ):
-        return original
+    elif _are_ordered_bounds(lower, upper):
+        # Both bounds are known to be non-null, so the CASE reduces to this.
+        return ibis.least(ibis.greatest(original, lower), upper)
     else:
         # Note: Pandas has unchanged behavior when upper bound and lower bound are flipped. This implementation requires that lower_bound < upper_bound
         return (
@@ -1133,6 +1168,20 @@ def clip_op(
         )
 
 
+def _are_ordered_bounds(lower: ibis_types.Value, upper: ibis_types.Value) -> bool:
+    """Whether both bounds are non-null, non-NaN literals with lower <= upper."""
+    lower_op, upper_op = lower.op(), upper.op()
+    if not (
+        isinstance(lower_op, ibis.expr.operations.generic.Literal)
+        and isinstance(upper_op, ibis.expr.operations.generic.Literal)
+    ):
+        return False
+    try:
+        return bool(lower_op.value <= upper_op.value)
+    except TypeError:
+        return False
+
+
 # Helpers
 def is_null(value) -> bool:
     # float NaN/inf should be treated as distinct from 'true' null values
@@ -51,19 +51,8 @@ def join_by_column_ordered(
         first the coalesced join keys, then, all the left columns, and
         finally, all the right columns.
     """
-    if (
-        allow_row_identity_join
-        and join.type in bigframes.core.compile.row_identity.SUPPORTED_ROW_IDENTITY_HOW
-        and left._table.equals(right._table)
-        # Make sure we're joining on exactly the same column(s), at least with
-        # regards to value its possible that they both have the same names but
-        # were modified in different ways. Ignore differences in the names.
-        and all(
-            left._get_ibis_column(lcol)
-            .name("index")
-            .equals(right._get_ibis_column(rcol).name("index"))
-            for lcol, rcol in join.conditions
-        )
+    if allow_row_identity_join and (
+        bigframes.core.compile.row_identity.can_join_by_row_identity(left, right, join)
     ):
         return bigframes.core.compile.row_identity.join_by_row_identity_ordered(
             left, right, join_def=join
@@ -152,19 +141,8 @@ def join_by_column_unordered(
         first the coalesced join keys, then, all the left columns, and
         finally, all the right columns.
     """
-    if (
-        allow_row_identity_join
-        and join.type in bigframes.core.compile.row_identity.SUPPORTED_ROW_IDENTITY_HOW
-        and left._table.equals(right._table)
-        # Make sure we're joining on exactly the same column(s), at least with
-        # regards to value its possible that they both have the same names but
-        # were modified in different ways. Ignore differences in the names.
-        and all(
-            left._get_ibis_column(lcol)
-            .name("index")
-            .equals(right._get_ibis_column(rcol).name("index"))
-            for lcol, rcol in join.conditions
-        )
+    if allow_row_identity_join and (
+        bigframes.core.compile.row_identity.can_join_by_row_identity(left, right, join)
     ):
         return bigframes.core.compile.row_identity.join_by_row_identity_unordered(
             left, right, join_def=join
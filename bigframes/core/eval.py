@@ -0,0 +1,115 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Translates pandas.eval-style expression strings into scalar expressions."""
+
+from __future__ import annotations
+
+import ast
+import functools
+import typing
+
+import bigframes.constants as constants
+import bigframes.core.expression as ex
+import bigframes.operations as ops
+
+_BINARY_OPS: typing.Mapping[typing.Type[ast.AST], ops.BinaryOp] = {
+    ast.Add: ops.add_op,
+    ast.Sub: ops.sub_op,
+    ast.Mult: ops.mul_op,
+    ast.Div: ops.div_op,
+    ast.FloorDiv: ops.floordiv_op,
+    ast.Mod: ops.mod_op,
+    ast.Pow: ops.pow_op,
+    ast.BitAnd: ops.and_op,
+    ast.BitOr: ops.or_op,
+}
+
+_COMPARISON_OPS: typing.Mapping[typing.Type[ast.AST], ops.BinaryOp] = {
+    ast.Eq: ops.eq_op,
+    ast.NotEq: ops.ne_op,
+    ast.Lt: ops.lt_op,
+    ast.LtE: ops.le_op,
+    ast.Gt: ops.gt_op,
+    ast.GtE: ops.ge_op,
+}
+
+_BOOL_OPS: typing.Mapping[typing.Type[ast.AST], ops.BinaryOp] = {
+    ast.And: ops.and_op,
+    ast.Or: ops.or_op,
+}
+
+
+def parse_expression(
+    expr: str, resolve_column: typing.Callable[[str], typing.Optional[str]]
+) -> ex.Expression:
+    """
+    Parses an arithmetic, comparison or boolean expression over column names.
+
+    Args:
+        expr:
+            The expression, written in Python syntax.
+        resolve_column:
+            Maps a name in the expression to a column id, or None if there is
+            no such column.
+
+    Returns:
+        A single scalar expression over the resolved column ids.
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {expr!r}") from e
+    return _translate(tree.body, resolve_column)
+
+
+def _translate(
+    node: ast.AST, resolve_column: typing.Callable[[str], typing.Optional[str]]
+) -> ex.Expression:
+    translate = functools.partial(_translate, resolve_column=resolve_column)
+
+    if isinstance(node, ast.Name):
+        col_id = resolve_column(node.id)
+        if col_id is None:
+            raise KeyError(f"Column {node.id!r} not found.")
+        return ex.free_var(col_id)
+    if isinstance(node, ast.Constant):
+        return ex.const(node.value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)].as_expr(
+            translate(node.left), translate(node.right)
+        )
+    if isinstance(node, ast.BoolOp) and type(node.op) in _BOOL_OPS:
+        op = _BOOL_OPS[type(node.op)]
+        return functools.reduce(op.as_expr, map(translate, node.values))
+    if isinstance(node, ast.Compare) and all(
+        type(cmp_op) in _COMPARISON_OPS for cmp_op in node.ops
+    ):
+        # Chained comparisons such as "a < b < c" mean "a < b and b < c".
+        operands = [translate(node.left), *map(translate, node.comparators)]
+        comparisons = [
+            _COMPARISON_OPS[type(cmp_op)].as_expr(left, right)
+            for cmp_op, left, right in zip(node.ops, operands, operands[1:])
+        ]
+        return functools.reduce(ops.and_op.as_expr, comparisons)
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.UAdd):
+            return translate(node.operand)
+        if isinstance(node.op, ast.USub):
+            return ops.mul_op.as_expr(ex.const(-1), translate(node.operand))
+        if isinstance(node.op, (ast.Not, ast.Invert)):
+            return ops.invert_op.as_expr(translate(node.operand))
+    raise NotImplementedError(
+        f"Unsupported syntax in expression: {ast.dump(node)}. {constants.FEEDBACK_LINK}"
+    )
@@ -201,7 +201,7 @@ class DataFrameGroupBy(vendored_pandas_groupby.DataFrameGroupBy):
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.ShiftOp(periods), window=window)
+        return self._apply_window_op(agg_ops.shift_op(periods), window=window)
 
     def diff(self, periods=1) -> series.Series:
         window = core.WindowSpec(
@@ -209,7 +209,7 @@ class DataFrameGroupBy(vendored_pandas_groupby.DataFrameGroupBy):
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.DiffOp(periods), window=window)
+        return self._apply_window_op(agg_ops.diff_op(periods), window=window)
 
     def rolling(self, window: int, min_periods=None) -> windows.Window:
         # To get n size window, need current row and n-1 preceding rows.
@@ -379,7 +379,7 @@ class DataFrameGroupBy(vendored_pandas_groupby.DataFrameGroupBy):
         return valid_agg_cols
 
     def _column_type(self, col_id: str) -> dtypes.Dtype:
-        col_offset = self._block.value_columns.index(col_id)
+        col_offset = self._block.col_id_to_position[col_id]
         dtype = self._block.dtypes[col_offset]
         return dtype
 
@@ -554,7 +554,7 @@ class SeriesGroupBy(vendored_pandas_groupby.SeriesGroupBy):
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.ShiftOp(periods), window=window)
+        return self._apply_window_op(agg_ops.shift_op(periods), window=window)
 
     def diff(self, periods=1) -> series.Series:
         window = core.WindowSpec(
@@ -562,7 +562,7 @@ class SeriesGroupBy(vendored_pandas_groupby.SeriesGroupBy):
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.DiffOp(periods), window=window)
+        return self._apply_window_op(agg_ops.diff_op(periods), window=window)
 
     def rolling(self, window: int, min_periods=None) -> windows.Window:
         # To get n size window, need current row and n-1 preceding rows.
@@ -289,8 +289,9 @@ class Index(vendored_pandas_index.Index):
             block, condition_id = block.project_expr(
                 ops.ne_op.as_expr(level_id, ex.const(labels))
             )
-        block = block.filter(condition_id, keep_null=True)
-        block = block.drop_columns([condition_id])
+        block = block.filter_and_select(
+            condition_id, self._block.value_columns, keep_null=True
+        )
         return Index._from_block(block)
 
     def dropna(self, how: str = "any") -> Index:
@@ -350,6 +351,9 @@ class Index(vendored_pandas_index.Index):
         else:
             raise NotImplementedError(f"Index key not supported {key}")
 
+    def __repr__(self) -> str:
+        return repr(IndexValue(self._block))
+
     def to_pandas(self) -> pandas.Index:
         """Gets the Index as a pandas Index.
 
@@ -410,10 +414,18 @@ class IndexValue:
         """Converts an Index to a string."""
         # TODO(swast): Add a timeout here? If the query is taking a long time,
         # maybe we just print the job metadata that we have so far?
-        # TODO(swast): Avoid downloading the whole index by using job
-        # metadata, like we do with DataFrame.
-        preview = self.to_pandas()
-        return repr(preview)
+        max_results = bigframes.options.display.max_rows
+        # Only download the rows that will be displayed, like Series does.
+        pandas_df, row_count, _ = self._block.select_columns(
+            []
+        ).retrieve_repr_request_results(max_results)
+        preview = pandas_df.index.set_names(self.names)
+        repr_string = repr(preview)
+        if row_count <= len(preview):
+            return repr_string
+
+        # Only the first rows were downloaded, so report the true length.
+        return f"{repr_string}\n...\nLength: {row_count}"
 
     def to_pandas(self) -> pandas.Index:
         """Executes deferred operations and downloads the results."""
@@ -423,8 +435,12 @@ class IndexValue:
         expr = self._expr.select_columns(index_columns)
         results, _ = self.session._execute(expr)
         df = expr.session._rows_to_dataframe(results, dtypes)
-        df = df.set_index(index_columns)
-        index = df.index
+        # Build the index straight from the downloaded columns, rather than
+        # copying the whole frame with set_index.
+        if len(index_columns) == 1:
+            index = pandas.Index(df[index_columns[0]])
+        else:
+            index = pandas.MultiIndex.from_frame(df)
         index.names = list(self._block._index_labels)
         return index
 
@@ -548,12 +564,14 @@ def join_multi_indexed(
     if not (left.is_uniquely_named() and right.is_uniquely_named()):
         raise ValueError("Joins not supported on indices with non-unique level names")
 
-    common_names = [name for name in left.names if name in right.names]
+    left_names = set(left.names)
+    right_names = set(right.names)
+    common_names = [name for name in left.names if name in right_names]
     if len(common_names) == 0:
         raise ValueError("Cannot join without a index level in common.")
 
-    left_only_names = [name for name in left.names if name not in right.names]
-    right_only_names = [name for name in right.names if name not in left.names]
+    left_only_names = [name for name in left.names if name not in right_names]
+    right_only_names = [name for name in right.names if name not in left_names]
 
     left_join_ids = [left.resolve_level_name(name) for name in common_names]
     right_join_ids = [right.resolve_level_name(name) for name in common_names]
@@ -616,13 +634,15 @@ def join_multi_indexed(
     else:
         index_labels = [*common_names, *left_only_names, *right_only_names]
 
+    coalesced_ids_by_name = dict(zip(common_names, coalesced_join_cols))
+
     def resolve_label_id(label: blocks.Label) -> str:
         # if name is shared between both blocks, coalesce the values
-        if label in common_names:
-            return coalesced_join_cols[common_names.index(label)]
-        if label in left_only_names:
+        if label in coalesced_ids_by_name:
+            return coalesced_ids_by_name[label]
+        if label in left_names:
             return get_column_left[left.resolve_level_name(label)]
-        if label in right_only_names:
+        if label in right_names:
             return get_column_right[right.resolve_level_name(label)]
         raise ValueError(f"Unexpected label: {label}")
 
@@ -647,20 +667,31 @@ def coalesce_columns(
     how: str,
 ) -> Tuple[core.ArrayValue, Sequence[str]]:
     result_ids = []
+    dropped_ids = set()
+    coalesced: list[tuple[ex.Expression, str]] = []
     for left_id, right_id in zip(left_ids, right_ids):
         if how == "left" or how == "inner":
             result_ids.append(left_id)
-            expr = expr.drop_columns([right_id])
+            dropped_ids.add(right_id)
         elif how == "right":
             result_ids.append(right_id)
-            expr = expr.drop_columns([left_id])
+            dropped_ids.add(left_id)
         elif how == "outer":
             coalesced_id = bigframes.core.guid.generate_guid()
-            expr = expr.project_to_id(
-                ops.coalesce_op.as_expr(left_id, right_id), coalesced_id
-            )
-            expr = expr.drop_columns([left_id, right_id])
+            coalesced.append((ops.coalesce_op.as_expr(left_id, right_id), coalesced_id))
+            dropped_ids.update((left_id, right_id))
             result_ids.append(coalesced_id)
         else:
             raise ValueError(f"Unexpected join type: {how}. {constants.FEEDBACK_LINK}")
+    # Apply all of the drops and coalesces as a single projection.
+    expr = expr.projection(
+        [
+            *(
+                (ex.free_var(col_id), col_id)
+                for col_id in expr.column_ids
+                if col_id not in dropped_ids
+            ),
+            *coalesced,
+        ]
+    )
     return expr, result_ids
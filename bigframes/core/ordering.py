@@ -17,6 +17,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum
 import math
+import sys
 import typing
 from typing import Optional, Sequence
 
@@ -28,6 +29,9 @@ ORDERING_ID_STRING_BASE: int = 10
 # Sufficient to store any value up to 2^63
 DEFAULT_ORDERING_ID_LENGTH: int = math.ceil(63 * math.log(2, ORDERING_ID_STRING_BASE))
 
+# dataclass(slots=True) is only available from Python 3.10.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class OrderingDirection(Enum):
     ASC = 1
@@ -44,7 +48,7 @@ class OrderingDirection(Enum):
         return self == OrderingDirection.ASC
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderingColumnReference:
     """References a column and how to order with respect to values in that column."""
 
@@ -108,6 +112,15 @@ class ExpressionOrdering:
 
         return self
 
+    def is_ordered_by(
+        self, ordering_value_columns: Sequence[OrderingColumnReference]
+    ) -> bool:
+        """Whether the rows are already sorted by the given columns, in decreasing precedence order."""
+        return (
+            tuple(ordering_value_columns)
+            == self.ordering_value_columns[: len(ordering_value_columns)]
+        )
+
     def with_ordering_columns(
         self,
         ordering_value_columns: Sequence[OrderingColumnReference] = (),
@@ -33,6 +33,11 @@ def get_axis_number(axis: typing.Union[str, int]) -> typing.Literal[0, 1]:
 
 
 def is_list_like(obj: typing.Any) -> typing_extensions.TypeGuard[typing.Sequence]:
+    # Fast path for the most common labels and label lists.
+    if obj is None or isinstance(obj, (str, bytes, int, float)):
+        return False
+    if isinstance(obj, (list, tuple)):
+        return True
     return pd.api.types.is_list_like(obj)
 
 
@@ -130,10 +135,13 @@ def merge_column_labels(
     suffixes: tuple[str, str] = ("_x", "_y"),
 ) -> pd.Index:
     result_labels = []
+    left_label_set = set(left_labels)
+    right_label_set = set(right_labels)
+    coalesce_label_set = set(coalesce_labels)
 
     for col_label in left_labels:
-        if col_label in right_labels:
-            if col_label in coalesce_labels:
+        if col_label in right_label_set:
+            if col_label in coalesce_label_set:
                 # Merging on the same column only returns 1 key column from coalesce both.
                 # Take the left key column.
                 result_labels.append(col_label)
@@ -143,8 +151,8 @@ def merge_column_labels(
             result_labels.append(col_label)
 
     for col_label in right_labels:
-        if col_label in left_labels:
-            if col_label in coalesce_labels:
+        if col_label in left_label_set:
+            if col_label in coalesce_label_set:
                 # Merging on the same column only returns 1 key column from coalesce both.
                 # Pass the right key column.
                 pass
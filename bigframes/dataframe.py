@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import re
 import sys
 import textwrap
@@ -47,6 +48,7 @@ import bigframes.core
 from bigframes.core import log_adapter
 import bigframes.core.block_transforms as block_ops
 import bigframes.core.blocks as blocks
+import bigframes.core.eval
 import bigframes.core.expression as ex
 import bigframes.core.groupby as groupby
 import bigframes.core.guid
@@ -84,6 +86,9 @@ ERROR_IO_REQUIRES_WILDCARD = (
     f"{constants.FEEDBACK_LINK}"
 )
 
+# Shape footer that pandas appends to a truncated DataFrame repr.
+_REPR_SHAPE_PATTERN = re.compile(r"\[[0-9]+ rows x [0-9]+ columns\]")
+
 
 # Inherits from pandas DataFrame so that we can use the same docstrings.
 @log_adapter.class_logger
@@ -127,19 +132,24 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 raise NotImplementedError(
                     f"Cannot mix Series with other types. {constants.FEEDBACK_LINK}"
                 )
-            keys = list(data.keys())
-            first_label, first_series = keys[0], data[keys[0]]
-            block = (
-                typing.cast(bf_series.Series, first_series)
+            series_blocks = [
+                typing.cast(bf_series.Series, series)
                 ._get_block()
-                .with_column_labels([first_label])
-            )
-
-            for key in keys[1:]:
-                other = typing.cast(bf_series.Series, data[key])
-                other_block = other._block.with_column_labels([key])
+                .with_column_labels([label])
+                for label, series in data.items()
+            ]
+            block = series_blocks[0]
+            for other_block in series_blocks[1:]:
+                # Series selected from the same source are already aligned, so
+                # combine them directly and keep their original order.
+                shared_block = blocks.combine_shared_source_columns(
+                    [block, other_block]
+                )
+                if shared_block is not None:
+                    block = shared_block
+                    continue
                 # Pandas will keep original sorting if all indices are aligned.
-                # We cannot detect this easily however, and so always sort on index
+                # We cannot detect this in general however, and so always sort on index
                 result_index, _ = block.index.join(  # type:ignore
                     other_block.index, how="outer", sort=True
                 )
@@ -214,13 +224,14 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 ValueError.
         """
         col_ids = self._sql_names(columns, tolerance)
-        return [self._block.value_columns.index(col_id) for col_id in col_ids]
+        col_id_to_position = self._block.col_id_to_position
+        return [col_id_to_position[col_id] for col_id in col_ids]
 
     def _resolve_label_exact(self, label) -> Optional[str]:
         """Returns the column id matching the label if there is exactly
         one such column. If there are multiple columns with the same name,
         raises an error. If there is no such column, returns None."""
-        matches = self._block.label_to_col_id.get(label, [])
+        matches = self._block.label_to_col_id.get(label, ())
         if len(matches) > 1:
             raise ValueError(
                 f"Multiple columns matching id {label} were found. {constants.FEEDBACK_LINK}"
@@ -238,12 +249,13 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             if utils.is_list_like(columns) and not isinstance(columns, tuple)
             else [columns]
         )  # type:ignore
-        results: Sequence[str] = []
+        label_to_col_id = self._block.label_to_col_id
+        results: List[str] = []
         for label in labels:
-            col_ids = self._block.label_to_col_id.get(label, [])
+            col_ids = label_to_col_id.get(label, ())
             if not tolerance and len(col_ids) == 0:
                 raise ValueError(f"Column name {label} doesn't exist")
-            results = (*results, *col_ids)
+            results.extend(col_ids)
         return results
 
     @property
@@ -279,11 +291,18 @@ class DataFrame(vendored_pandas_frame.DataFrame):
 
     @property
     def dtypes(self) -> pandas.Series:
-        return pandas.Series(data=self._block.dtypes, index=self._block.column_labels)
+        # Dtype objects are always stored as object, so skip inference.
+        return pandas.Series(
+            data=self._block.dtypes,
+            index=self._block.column_labels,
+            dtype="object",
+            copy=False,
+        )
 
     @property
     def columns(self) -> pandas.Index:
-        return self.dtypes.index
+        # Copy so that setting a name on the result can't change the block.
+        return self._block.column_labels.copy()
 
     @columns.setter
     def columns(self, labels: pandas.Index):
@@ -475,7 +494,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         # NOTE: This implements the operations described in
         # https://pandas.pydata.org/docs/getting_started/intro_tutorials/03_subset_data.html
 
-        if isinstance(key, bigframes.series.Series):
+        if isinstance(key, bf_series.Series):
             return self._getitem_bool_series(key)
 
         if isinstance(key, typing.Hashable):
@@ -496,10 +515,10 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         # Select a number of columns as DF.
         key = key if utils.is_list_like(key) else [key]  # type:ignore
 
-        selected_ids: Tuple[str, ...] = ()
+        label_to_col_id = self._block.label_to_col_id
+        selected_ids: List[str] = []
         for label in key:
-            col_ids = self._block.label_to_col_id[label]
-            selected_ids = (*selected_ids, *col_ids)
+            selected_ids.extend(label_to_col_id[label])
 
         return DataFrame(self._block.select_columns(selected_ids))
 
@@ -536,8 +555,10 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         ) = self._block.index.join(key._block.index, how="left")
         block = combined_index._block
         filter_col_id = get_column_right[key._value_column]
-        block = block.filter(filter_col_id)
-        block = block.drop_columns([filter_col_id])
+        block = block.filter_and_select(
+            filter_col_id,
+            [get_column_left[col_id] for col_id in self._block.value_columns],
+        )
         return DataFrame(block)
 
     def __getattr__(self, key: str):
@@ -603,8 +624,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
 
         # Modify the end of the string to reflect count.
         lines = repr_string.split("\n")
-        pattern = re.compile("\\[[0-9]+ rows x [0-9]+ columns\\]")
-        if pattern.match(lines[-1]):
+        if _REPR_SHAPE_PATTERN.match(lines[-1]):
             lines = lines[:-2]
 
         if row_count > len(lines) - 1:
@@ -661,7 +681,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
     ):
         if isinstance(other, (float, int)):
             return self._apply_scalar_binop(other, op, reverse=reverse)
-        elif isinstance(other, bigframes.series.Series):
+        elif isinstance(other, bf_series.Series):
             return self._apply_series_binop(
                 other, op, axis=axis, how=how, reverse=reverse
             )
@@ -675,17 +695,17 @@ class DataFrame(vendored_pandas_frame.DataFrame):
     def _apply_scalar_binop(
         self, other: float | int, op: ops.BinaryOp, reverse: bool = False
     ) -> DataFrame:
-        block = self._block
-        for column_id, label in zip(
-            self._block.value_columns, self._block.column_labels
-        ):
-            expr = (
+        exprs = [
+            (
                 op.as_expr(ex.const(other), column_id)
                 if reverse
                 else op.as_expr(column_id, ex.const(other))
             )
-            block, _ = block.project_expr(expr, label)
-            block = block.drop_columns([column_id])
+            for column_id in self._block.value_columns
+        ]
+        block, _ = self._block.project_exprs(
+            exprs, labels=self._block.column_labels, drop=True
+        )
         return DataFrame(block)
 
     def _apply_series_binop(
@@ -711,20 +731,18 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         series_column_id = other._value_column
         series_col = get_column_right[series_column_id]
         block = joined_index._block
-        for column_id, label in zip(
-            self._block.value_columns, self._block.column_labels
-        ):
-            self_col = get_column_left[column_id]
-            expr = (
-                op.as_expr(series_col, self_col)
+        exprs = [
+            (
+                op.as_expr(series_col, get_column_left[column_id])
                 if reverse
-                else op.as_expr(self_col, series_col)
+                else op.as_expr(get_column_left[column_id], series_col)
             )
-            block, _ = block.project_expr(expr, label)
-            block = block.drop_columns([get_column_left[column_id]])
-
-        block = block.drop_columns([series_col])
-        block = block.with_index_labels(self.index.names)
+            for column_id in self._block.value_columns
+        ]
+        block, _ = block.project_exprs(
+            exprs, labels=self._block.column_labels, drop=True
+        )
+        block = block.with_index_labels(self._block.index_labels)
         return DataFrame(block)
 
     def _apply_dataframe_binop(
@@ -922,7 +940,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         typing.Union[DataFrame, bigframes.series.Series],
     ]:
         axis_n = utils.get_axis_number(axis) if axis else None
-        if axis_n == 1 and isinstance(other, bigframes.series.Series):
+        if axis_n == 1 and isinstance(other, bf_series.Series):
             raise NotImplementedError(
                 f"align with series and axis=1 not supported. {constants.FEEDBACK_LINK}"
             )
@@ -1317,11 +1335,10 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             src_col = get_column_right[new_column_block.value_columns[0]]
             # Check to see if key exists, and modify in place
             col_ids = self._block.cols_matching_label(k)
-            for col_id in col_ids:
-                result_block = result_block.copy_values(
-                    src_col, get_column_left[col_id]
-                )
             if len(col_ids) > 0:
+                result_block = result_block.copy_values_multi(
+                    src_col, [get_column_left[col_id] for col_id in col_ids]
+                )
                 result_block = result_block.drop_columns([src_col])
         return DataFrame(result_block)
 
@@ -1329,10 +1346,8 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         col_ids = self._block.cols_matching_label(label)
 
         block, constant_col_id = self._block.create_constant(value, label)
-        for col_id in col_ids:
-            block = block.copy_values(constant_col_id, col_id)
-
         if len(col_ids) > 0:
+            block = block.copy_values_multi(constant_col_id, col_ids)
             block = block.drop_columns([constant_col_id])
 
         return DataFrame(block)
@@ -1351,10 +1366,9 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         source_column = get_column_right[series._value_column]
 
         # Replace each column matching the label
+        block = block.copy_values_multi(source_column, column_ids)
         for column_id in column_ids:
-            block = block.copy_values(source_column, column_id).assign_label(
-                column_id, label
-            )
+            block = block.assign_label(column_id, label)
 
         if not column_ids:
             # Append case, so new column needs appropriate label
@@ -1363,7 +1377,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             # Update case, remove after copying into columns
             block = block.drop_columns([source_column])
 
-        return DataFrame(block.with_index_labels(self.index.names))
+        return DataFrame(block.with_index_labels(self._block.index_labels))
 
     def reset_index(self, *, drop: bool = False) -> DataFrame:
         block = self._block.reset_index(drop)
@@ -1425,20 +1439,20 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         else:
             sort_directions = (ascending,) * len_by
 
-        ordering = []
-        for i in range(len(sort_labels)):
-            column_id = sort_column_ids[i]
-            direction = (
-                order.OrderingDirection.ASC
-                if sort_directions[i]
-                else order.OrderingDirection.DESC
-            )
-            na_last = na_position == "last"
-            ordering.append(
-                order.OrderingColumnReference(
-                    column_id, direction=direction, na_last=na_last
-                )
+        # Orderings are always stable, as ties fall back to the existing row
+        # order. A single multi-key ORDER BY already gives the result of
+        # stable per-key passes, so ``kind`` has no effect.
+        na_last = na_position == "last"
+        ordering = [
+            order.OrderingColumnReference(
+                column_id,
+                direction=order.OrderingDirection.ASC
+                if is_ascending
+                else order.OrderingDirection.DESC,
+                na_last=na_last,
             )
+            for column_id, is_ascending in zip(sort_column_ids, sort_directions)
+        ]
         return DataFrame(self._block.order_by(ordering))
 
     def value_counts(
@@ -1608,7 +1622,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         )
         # and then reset the names after the join
         return result.rename_axis(
-            self.index.names if keep_original_names else index.names
+            self._block.index_labels if keep_original_names else index.names
         )
 
     def _reindex_columns(self, columns):
@@ -1656,11 +1670,11 @@ class DataFrame(vendored_pandas_frame.DataFrame):
 
     def ffill(self, *, limit: typing.Optional[int] = None) -> DataFrame:
         window = bigframes.core.WindowSpec(preceding=limit, following=0)
-        return self._apply_window_op(agg_ops.LastNonNullOp(), window)
+        return self._apply_window_op(agg_ops.last_non_null_op, window)
 
     def bfill(self, *, limit: typing.Optional[int] = None) -> DataFrame:
         window = bigframes.core.WindowSpec(preceding=0, following=limit)
-        return self._apply_window_op(agg_ops.FirstNonNullOp(), window)
+        return self._apply_window_op(agg_ops.first_non_null_op, window)
 
     def isin(self, values) -> DataFrame:
         if utils.is_dict_like(values):
@@ -1691,6 +1705,13 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 f"isin(), you passed a [{type(values).__name__}]"
             )
 
+    def eval(self, expr: str) -> bigframes.series.Series:
+        expression = bigframes.core.eval.parse_expression(
+            expr, self._resolve_label_exact
+        )
+        block, result_id = self._block.project_expr(expression)
+        return bigframes.series.Series(block.select_column(result_id))
+
     def keys(self) -> pandas.Index:
         return self.columns
 
@@ -1728,26 +1749,26 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             raise ValueError("'how' must be one of 'any', 'all'")
 
         axis_n = utils.get_axis_number(axis)
+        block = self._block
+        value_columns = block.value_columns
 
         if axis_n == 0:
-            result = block_ops.dropna(self._block, self._block.value_columns, how=how)  # type: ignore
+            result = block_ops.dropna(block, value_columns, how=how)  # type: ignore
             if ignore_index:
                 result = result.reset_index()
             return DataFrame(result)
         else:
-            isnull_block = self._block.multi_apply_unary_op(
-                self._block.value_columns, ops.isnull_op
-            )
+            isnull_block = block.multi_apply_unary_op(value_columns, ops.isnull_op)
             if how == "any":
                 null_locations = DataFrame(isnull_block).any().to_pandas()
             else:  # 'all'
                 null_locations = DataFrame(isnull_block).all().to_pandas()
             keep_columns = [
                 col
-                for col, to_drop in zip(self._block.value_columns, null_locations)
+                for col, to_drop in zip(value_columns, null_locations)
                 if not to_drop
             ]
-            return DataFrame(self._block.select_columns(keep_columns))
+            return DataFrame(block.select_columns(keep_columns))
 
     def any(
         self,
@@ -1951,10 +1972,14 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             raise NotImplementedError(
                 f"df.describe() currently only supports numeric values. {constants.FEEDBACK_LINK}"
             )
-        result = df_numeric.agg(
-            ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        stats = [
+            agg_ops.lookup_agg_func(func)
+            for func in ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+        ]
+        # All stats are computed in a single aggregation over the table.
+        return DataFrame(
+            df_numeric._block.summarize(df_numeric._block.value_columns, stats)
         )
-        return typing.cast(DataFrame, result)
 
     def skew(self, *, numeric_only: bool = False):
         if not numeric_only:
@@ -2335,7 +2360,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             by = [typing.cast(typing.Union[blocks.Label, bigframes.series.Series], by)]
 
         block = self._block
-        col_ids: typing.Sequence[str] = []
+        col_ids: typing.List[str] = []
         for key in by:
             if isinstance(key, bigframes.series.Series):
                 combined_index, (
@@ -2344,21 +2369,18 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 ) = block.index.join(
                     key._block.index, how="inner" if dropna else "left"
                 )
-                col_ids = [
-                    *[get_column_left[value] for value in col_ids],
-                    get_column_right[key._value_column],
-                ]
+                col_ids = [get_column_left[value] for value in col_ids]
+                col_ids.append(get_column_right[key._value_column])
                 block = combined_index._block
             else:
                 # Interpret as index level or column name
-                col_matches = block.label_to_col_id.get(key, [])
-                level_matches = block.index_name_to_col_id.get(key, [])
-                matches = [*col_matches, *level_matches]
-                if len(matches) != 1:
+                col_matches = block.label_to_col_id.get(key, ())
+                level_matches = block.index_name_to_col_id.get(key, ())
+                if len(col_matches) + len(level_matches) != 1:
                     raise ValueError(
                         f"GroupBy key {key} does not match a unique column or index level. BigQuery DataFrames only interprets lists of strings as column or index names, not directly as per-row group assignments."
                     )
-                col_ids = [*col_ids, matches[0]]
+                col_ids.append(col_matches[0] if col_matches else level_matches[0])
 
         return groupby.DataFrameGroupBy(
             block,
@@ -2381,11 +2403,8 @@ class DataFrame(vendored_pandas_frame.DataFrame):
     notnull = notna
 
     def cumsum(self):
-        is_numeric_types = [
-            (dtype in bigframes.dtypes.NUMERIC_BIGFRAMES_TYPES_PERMISSIVE)
-            for _, dtype in self.dtypes.items()
-        ]
-        if not all(is_numeric_types):
+        numeric_types = bigframes.dtypes.NUMERIC_BIGFRAMES_TYPES_PERMISSIVE
+        if not all(dtype in numeric_types for dtype in self._block.dtypes):
             raise ValueError("All values must be numeric to apply cumsum.")
         return self._apply_window_op(
             agg_ops.sum_op,
@@ -2393,12 +2412,9 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         )
 
     def cumprod(self) -> DataFrame:
-        is_numeric_types = [
-            (dtype in bigframes.dtypes.NUMERIC_BIGFRAMES_TYPES_PERMISSIVE)
-            for _, dtype in self.dtypes.items()
-        ]
-        if not all(is_numeric_types):
-            raise ValueError("All values must be numeric to apply cumsum.")
+        numeric_types = bigframes.dtypes.NUMERIC_BIGFRAMES_TYPES_PERMISSIVE
+        if not all(dtype in numeric_types for dtype in self._block.dtypes):
+            raise ValueError("All values must be numeric to apply cumprod.")
         return self._apply_window_op(
             agg_ops.product_op,
             bigframes.core.WindowSpec(following=0),
@@ -2421,14 +2437,14 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.ShiftOp(periods), window)
+        return self._apply_window_op(agg_ops.shift_op(periods), window)
 
     def diff(self, periods: int = 1) -> DataFrame:
         window = bigframes.core.WindowSpec(
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.DiffOp(periods), window)
+        return self._apply_window_op(agg_ops.diff_op(periods), window)
 
     def pct_change(self, periods: int = 1) -> DataFrame:
         # Future versions of pandas will not perfrom ffill automatically
@@ -2440,8 +2456,9 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         op: agg_ops.WindowOp,
         window_spec: bigframes.core.WindowSpec,
     ):
-        block, result_ids = self._block.multi_apply_window_op(
-            self._block.value_columns,
+        block = self._block
+        block, result_ids = block.multi_apply_window_op(
+            block.value_columns,
             op,
             window_spec=window_spec,
         )
@@ -2517,17 +2534,15 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         if "*" not in path_or_buf:
             raise NotImplementedError(ERROR_IO_REQUIRES_WILDCARD)
 
-        result_table = self._run_io_query(
-            index=index, ordering_id=bigframes.session._io.bigquery.IO_ORDERING_ID
-        )
-        export_data_statement = bigframes.session._io.bigquery.create_export_csv_statement(
-            f"{result_table.project}.{result_table.dataset_id}.{result_table.table_id}",
-            uri=path_or_buf,
-            field_delimiter=sep,
-            header=header,
+        self._run_io_export(
+            index,
+            lambda table_id: bigframes.session._io.bigquery.create_export_csv_statement(
+                table_id,
+                uri=path_or_buf,
+                field_delimiter=sep,
+                header=header,
+            ),
         )
-        _, query_job = self._block.expr.session._start_query(export_data_statement)
-        self._set_internal_query_job(query_job)
 
     def to_json(
         self,
@@ -2559,17 +2574,15 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 f"Only newline delimited JSON format is supported. {constants.FEEDBACK_LINK}"
             )
 
-        result_table = self._run_io_query(
-            index=index, ordering_id=bigframes.session._io.bigquery.IO_ORDERING_ID
-        )
-        export_data_statement = bigframes.session._io.bigquery.create_export_data_statement(
-            f"{result_table.project}.{result_table.dataset_id}.{result_table.table_id}",
-            uri=path_or_buf,
-            format="JSON",
-            export_options={},
+        self._run_io_export(
+            index,
+            lambda table_id: bigframes.session._io.bigquery.create_export_data_statement(
+                table_id,
+                uri=path_or_buf,
+                format="JSON",
+                export_options={},
+            ),
         )
-        _, query_job = self._block.expr.session._start_query(export_data_statement)
-        self._set_internal_query_job(query_job)
 
     def to_gbq(
         self,
@@ -2686,17 +2699,15 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         if compression:
             export_options["compression"] = compression.upper()
 
-        result_table = self._run_io_query(
-            index=index, ordering_id=bigframes.session._io.bigquery.IO_ORDERING_ID
-        )
-        export_data_statement = bigframes.session._io.bigquery.create_export_data_statement(
-            f"{result_table.project}.{result_table.dataset_id}.{result_table.table_id}",
-            uri=path,
-            format="PARQUET",
-            export_options=export_options,
+        self._run_io_export(
+            index,
+            lambda table_id: bigframes.session._io.bigquery.create_export_data_statement(
+                table_id,
+                uri=path,
+                format="PARQUET",
+                export_options=export_options,
+            ),
         )
-        _, query_job = self._block.expr.session._start_query(export_data_statement)
-        self._set_internal_query_job(query_job)
 
     def to_dict(
         self,
@@ -2868,7 +2879,9 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             raise ValueError("Duplicates are not supported in clustering_columns")
 
         all_possible_columns = (
-            (set(self.columns) | set(self.index.names)) if index else set(self.columns)
+            (set(self.columns) | set(self._block.index_labels))
+            if index
+            else set(self.columns)
         )
         missing_columns = set(clustering_columns) - all_possible_columns
         if missing_columns:
@@ -2880,7 +2893,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             list(self._block.column_labels)
         )
         clustering_columns_for_index = (
-            map_columns_on_occurrence(list(self.index.names)) if index else []
+            map_columns_on_occurrence(list(self._block.index_labels)) if index else []
         )
 
         (
@@ -2894,10 +2907,17 @@ class DataFrame(vendored_pandas_frame.DataFrame):
 
     def _create_io_query(self, index: bool, ordering_id: Optional[str]) -> str:
         """Create query text representing this dataframe for I/O."""
+        io_sql_cache = self._block._io_sql_cache
+        cache_key = (index, ordering_id)
+        if cache_key not in io_sql_cache:
+            io_sql_cache[cache_key] = self._compile_io_query(index, ordering_id)
+        return io_sql_cache[cache_key]
+
+    def _compile_io_query(self, index: bool, ordering_id: Optional[str]) -> str:
         array_value = self._block.expr
 
         new_col_labels, new_idx_labels = utils.get_standardized_ids(
-            self._block.column_labels, self.index.names
+            self._block.column_labels, self._block.index_labels
         )
 
         columns = list(self._block.value_columns)
@@ -2906,7 +2926,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         # most pandas write APIs. The exception is `pandas.to_csv`, which keeps
         # unnamed indexes as `Unnamed: 0`.
         # TODO(chelsealin): check if works for multiple indexes.
-        if index and self.index.name is not None:
+        if index and self._block.index_labels[0] is not None:
             columns.extend(self._block.index_columns)
             column_labels.extend(new_idx_labels)
         else:
@@ -2915,9 +2935,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         # Make columns in SQL reflect _labels_ not _ids_. Note: This may use
         # the arbitrary unicode column labels feature in BigQuery, which is
         # currently (June 2023) in preview.
-        id_overrides = {
-            col_id: col_label for col_id, col_label in zip(columns, column_labels)
-        }
+        id_overrides = dict(zip(columns, column_labels))
 
         if ordering_id is not None:
             array_value = array_value.promote_offsets(ordering_id)
@@ -2934,6 +2952,13 @@ class DataFrame(vendored_pandas_frame.DataFrame):
     ) -> bigquery.TableReference:
         """Executes a query job presenting this dataframe and returns the destination
         table."""
+        # Blocks are immutable, so a result table written without a custom job
+        # config can be reused by later exports of the same block.
+        io_table_cache = self._block._io_table_cache
+        cache_key = (index, ordering_id)
+        if job_config is None and cache_key in io_table_cache:
+            return io_table_cache[cache_key]
+
         expr = self._block.expr
         session = expr.session
         sql = self._create_io_query(index=index, ordering_id=ordering_id)
@@ -2945,8 +2970,39 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         # The query job should have finished, so there should be always be a result table.
         result_table = query_job.destination
         assert result_table is not None
+        if job_config is None:
+            io_table_cache[cache_key] = result_table
         return result_table
 
+    def _run_io_export(
+        self, index: bool, create_export_statement: Callable[[str], str]
+    ) -> None:
+        """Exports the result table of an I/O query with the given statement."""
+        cache_key = (index, bigframes.session._io.bigquery.IO_ORDERING_ID)
+        cached_table = self._block._io_table_cache.get(cache_key)
+        session = self._block.expr.session
+
+        def export() -> bigquery.QueryJob:
+            result_table = self._run_io_query(index=index, ordering_id=cache_key[1])
+            _, query_job = session._start_query(
+                create_export_statement(
+                    f"{result_table.project}.{result_table.dataset_id}.{result_table.table_id}"
+                )
+            )
+            return query_job
+
+        try:
+            query_job = export()
+        except google.api_core.exceptions.NotFound as exc:
+            # Query results tables expire, so write the cached one again if
+            # it is gone. Other missing resources, such as the export bucket,
+            # are not retried.
+            if cached_table is None or cached_table.table_id not in str(exc):
+                raise
+            self._block._io_table_cache.pop(cache_key, None)
+            query_job = export()
+        self._set_internal_query_job(query_job)
+
     def map(self, func, na_action: Optional[str] = None) -> DataFrame:
         if not callable(func):
             raise TypeError("the first argument must be callable")
@@ -2981,25 +3037,12 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         *,
         keep: str = "first",
     ) -> DataFrame:
-        if subset is None:
-            column_ids = self._block.value_columns
-        elif utils.is_list_like(subset):
-            column_ids = [
-                id for label in subset for id in self._block.label_to_col_id[label]
-            ]
-        else:
-            # interpret as single label
-            column_ids = self._block.label_to_col_id[typing.cast(blocks.Label, subset)]
+        column_ids = self._subset_column_ids(subset)
         block = block_ops.drop_duplicates(self._block, column_ids, keep)
         return DataFrame(block)
 
     def duplicated(self, subset=None, keep: str = "first") -> bigframes.series.Series:
-        if subset is None:
-            column_ids = self._block.value_columns
-        else:
-            column_ids = [
-                id for label in subset for id in self._block.label_to_col_id[label]
-            ]
+        column_ids = self._subset_column_ids(subset)
         block, indicator = block_ops.indicate_duplicates(self._block, column_ids, keep)
         return bigframes.series.Series(
             block.select_column(
@@ -3007,6 +3050,19 @@ class DataFrame(vendored_pandas_frame.DataFrame):
             )
         )
 
+    def _subset_column_ids(
+        self, subset: typing.Union[blocks.Label, typing.Sequence[blocks.Label]]
+    ) -> typing.Sequence[str]:
+        if subset is None:
+            return self._block.value_columns
+        label_to_col_id = self._block.label_to_col_id
+        if not utils.is_list_like(subset):
+            # interpret as single label
+            return label_to_col_id[typing.cast(blocks.Label, subset)]
+        return list(
+            itertools.chain.from_iterable(label_to_col_id[label] for label in subset)
+        )
+
     def rank(
         self,
         axis=0,
@@ -3070,7 +3126,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
                 f"Only DataFrame or Series operand is supported. {constants.FEEDBACK_LINK}"
             )
 
-        if len(self.index.names) > 1 or len(other.index.names) > 1:
+        if len(self._block.index_labels) > 1 or len(other._block.index_labels) > 1:
             raise NotImplementedError(
                 f"Multi-index input is not supported. {constants.FEEDBACK_LINK}"
             )
@@ -3129,7 +3185,7 @@ class DataFrame(vendored_pandas_frame.DataFrame):
         )
 
         # Set the index names to match the left side matrix
-        result.index.names = self.index.names
+        result.index.names = self._block.index_labels
 
         # Pivot has the result columns ordered alphabetically. It should still
         # match the columns in the right sided matrix. Let's reorder them as per
@@ -16,9 +16,10 @@
 
 import datetime
 import decimal
+import functools
 import textwrap
 import typing
-from typing import Any, Dict, Iterable, Literal, Tuple, Union
+from typing import Any, Dict, FrozenSet, Iterable, Literal, Tuple, Union
 
 import geopandas as gpd  # type: ignore
 import google.cloud.bigquery as bigquery
@@ -43,8 +44,23 @@ Dtype = Union[
     gpd.array.GeometryDtype,
 ]
 
+# Shared instances of the supported dtypes, so the mappings below don't each
+# construct their own.
+_BOOL_DTYPE = pd.BooleanDtype()
+_FLOAT_DTYPE = pd.Float64Dtype()
+_INT_DTYPE = pd.Int64Dtype()
+_STRING_DTYPE = pd.StringDtype(storage="pyarrow")
+_DATE_DTYPE = pd.ArrowDtype(pa.date32())
+_TIME_DTYPE = pd.ArrowDtype(pa.time64("us"))
+_TIMESTAMP_DTYPE = pd.ArrowDtype(pa.timestamp("us"))
+_TIMESTAMP_UTC_DTYPE = pd.ArrowDtype(pa.timestamp("us", tz="UTC"))
+_BINARY_DTYPE = pd.ArrowDtype(pa.binary())
+_NUMERIC_DTYPE = pd.ArrowDtype(pa.decimal128(38, 9))
+_BIGNUMERIC_DTYPE = pd.ArrowDtype(pa.decimal256(76, 38))
+_GEO_DTYPE = gpd.array.GeometryDtype()
+
 # On BQ side, ARRAY, STRUCT, GEOGRAPHY, JSON are not orderable
-UNORDERED_DTYPES = [gpd.array.GeometryDtype()]
+UNORDERED_DTYPES = [_GEO_DTYPE]
 
 # Type hints for dtype strings supported by BigQuery DataFrame
 DtypeString = Literal[
@@ -73,18 +89,15 @@ IbisDtype = Union[
     ibis_dtypes.Timestamp,
 ]
 
-BOOL_BIGFRAMES_TYPES = [pd.BooleanDtype()]
+BOOL_BIGFRAMES_TYPES = [_BOOL_DTYPE]
 
 # Corresponds to the pandas concept of numeric type (such as when 'numeric_only' is specified in an operation)
 # Pandas is inconsistent, so two definitions are provided, each used in different contexts
-NUMERIC_BIGFRAMES_TYPES_RESTRICTIVE = [
-    pd.Float64Dtype(),
-    pd.Int64Dtype(),
-]
+NUMERIC_BIGFRAMES_TYPES_RESTRICTIVE = [_FLOAT_DTYPE, _INT_DTYPE]
 NUMERIC_BIGFRAMES_TYPES_PERMISSIVE = NUMERIC_BIGFRAMES_TYPES_RESTRICTIVE + [
-    pd.BooleanDtype(),
-    pd.ArrowDtype(pa.decimal128(38, 9)),
-    pd.ArrowDtype(pa.decimal256(76, 38)),
+    _BOOL_DTYPE,
+    _NUMERIC_DTYPE,
+    _BIGNUMERIC_DTYPE,
 ]
 
 # Type hints for Ibis data types that can be read to Python objects by BigQuery DataFrame
@@ -97,33 +110,33 @@ ReadOnlyIbisDtype = Union[
     ibis_dtypes.Struct,
 ]
 
+_IBIS_TIMESTAMP_UTC = ibis_dtypes.Timestamp(timezone="UTC")
+_IBIS_NUMERIC = ibis_dtypes.Decimal(precision=38, scale=9, nullable=True)
+_IBIS_BIGNUMERIC = ibis_dtypes.Decimal(precision=76, scale=38, nullable=True)
+
 BIDIRECTIONAL_MAPPINGS: Iterable[Tuple[IbisDtype, Dtype]] = (
-    (ibis_dtypes.boolean, pd.BooleanDtype()),
-    (ibis_dtypes.date, pd.ArrowDtype(pa.date32())),
-    (ibis_dtypes.float64, pd.Float64Dtype()),
-    (ibis_dtypes.int64, pd.Int64Dtype()),
-    (ibis_dtypes.string, pd.StringDtype(storage="pyarrow")),
-    (ibis_dtypes.time, pd.ArrowDtype(pa.time64("us"))),
-    (ibis_dtypes.Timestamp(timezone=None), pd.ArrowDtype(pa.timestamp("us"))),
-    (
-        ibis_dtypes.Timestamp(timezone="UTC"),
-        pd.ArrowDtype(pa.timestamp("us", tz="UTC")),
-    ),
-    (ibis_dtypes.binary, pd.ArrowDtype(pa.binary())),
-    (
-        ibis_dtypes.Decimal(precision=38, scale=9, nullable=True),
-        pd.ArrowDtype(pa.decimal128(38, 9)),
-    ),
-    (
-        ibis_dtypes.Decimal(precision=76, scale=38, nullable=True),
-        pd.ArrowDtype(pa.decimal256(76, 38)),
-    ),
+    (ibis_dtypes.boolean, _BOOL_DTYPE),
+    (ibis_dtypes.date, _DATE_DTYPE),
+    (ibis_dtypes.float64, _FLOAT_DTYPE),
+    (ibis_dtypes.int64, _INT_DTYPE),
+    (ibis_dtypes.string, _STRING_DTYPE),
+    (ibis_dtypes.time, _TIME_DTYPE),
+    (ibis_dtypes.Timestamp(timezone=None), _TIMESTAMP_DTYPE),
+    (_IBIS_TIMESTAMP_UTC, _TIMESTAMP_UTC_DTYPE),
+    (ibis_dtypes.binary, _BINARY_DTYPE),
+    (_IBIS_NUMERIC, _NUMERIC_DTYPE),
+    (_IBIS_BIGNUMERIC, _BIGNUMERIC_DTYPE),
 )
 
 BIGFRAMES_TO_IBIS: Dict[Dtype, ibis_dtypes.DataType] = {
     pandas: ibis for ibis, pandas in BIDIRECTIONAL_MAPPINGS
 }
 
+# Set form of the supported Ibis types, for constant-time membership checks.
+_SUPPORTED_IBIS_TYPES: FrozenSet[ibis_dtypes.DataType] = frozenset(
+    BIGFRAMES_TO_IBIS.values()
+)
+
 IBIS_TO_ARROW: Dict[ibis_dtypes.DataType, pa.DataType] = {
     ibis_dtypes.boolean: pa.bool_(),
     ibis_dtypes.date: pa.date32(),
@@ -132,29 +145,21 @@ IBIS_TO_ARROW: Dict[ibis_dtypes.DataType, pa.DataType] = {
     ibis_dtypes.string: pa.string(),
     ibis_dtypes.time: pa.time64("us"),
     ibis_dtypes.Timestamp(timezone=None): pa.timestamp("us"),
-    ibis_dtypes.Timestamp(timezone="UTC"): pa.timestamp("us", tz="UTC"),
+    _IBIS_TIMESTAMP_UTC: pa.timestamp("us", tz="UTC"),
     ibis_dtypes.binary: pa.binary(),
-    ibis_dtypes.Decimal(precision=38, scale=9, nullable=True): pa.decimal128(38, 9),
-    ibis_dtypes.Decimal(precision=76, scale=38, nullable=True): pa.decimal256(76, 38),
+    _IBIS_NUMERIC: pa.decimal128(38, 9),
+    _IBIS_BIGNUMERIC: pa.decimal256(76, 38),
 }
 
 ARROW_TO_IBIS = {arrow: ibis for ibis, arrow in IBIS_TO_ARROW.items()}
 
 IBIS_TO_BIGFRAMES: Dict[ibis_dtypes.DataType, Dtype] = {
-    ibis: pandas for ibis, pandas in BIDIRECTIONAL_MAPPINGS
+    **{ibis: pandas for ibis, pandas in BIDIRECTIONAL_MAPPINGS},
+    # Allow REQUIRED fields to map correctly.
+    **{ibis.copy(nullable=False): pandas for ibis, pandas in BIDIRECTIONAL_MAPPINGS},
+    ibis_dtypes.GeoSpatial(geotype="geography", srid=4326, nullable=True): _GEO_DTYPE,
+    # TODO: Interval
 }
-# Allow REQUIRED fields to map correctly.
-IBIS_TO_BIGFRAMES.update(
-    {ibis.copy(nullable=False): pandas for ibis, pandas in BIDIRECTIONAL_MAPPINGS}
-)
-IBIS_TO_BIGFRAMES.update(
-    {
-        ibis_dtypes.GeoSpatial(
-            geotype="geography", srid=4326, nullable=True
-        ): gpd.array.GeometryDtype(),
-        # TODO: Interval
-    }
-)
 
 BIGFRAMES_STRING_TO_BIGFRAMES: Dict[DtypeString, Dtype] = {
     typing.cast(DtypeString, dtype.name): dtype for dtype in BIGFRAMES_TO_IBIS.keys()
@@ -162,19 +167,19 @@ BIGFRAMES_STRING_TO_BIGFRAMES: Dict[DtypeString, Dtype] = {
 
 # special case - string[pyarrow] doesn't include the storage in its name, and both
 # "string" and "string[pyarrow] are accepted"
-BIGFRAMES_STRING_TO_BIGFRAMES["string[pyarrow]"] = pd.StringDtype(storage="pyarrow")
+BIGFRAMES_STRING_TO_BIGFRAMES["string[pyarrow]"] = _STRING_DTYPE
 
 # For the purposes of dataframe.memory_usage
 # https://cloud.google.com/bigquery/docs/reference/standard-sql/data-types#data_type_sizes
 DTYPE_BYTE_SIZES = {
-    pd.BooleanDtype(): 1,
-    pd.Int64Dtype(): 8,
+    _BOOL_DTYPE: 1,
+    _INT_DTYPE: 8,
     pd.Float32Dtype(): 8,
     pd.StringDtype(): 8,
-    pd.ArrowDtype(pa.time64("us")): 8,
-    pd.ArrowDtype(pa.timestamp("us")): 8,
-    pd.ArrowDtype(pa.timestamp("us", tz="UTC")): 8,
-    pd.ArrowDtype(pa.date32()): 8,
+    _TIME_DTYPE: 8,
+    _TIMESTAMP_DTYPE: 8,
+    _TIMESTAMP_UTC_DTYPE: 8,
+    _DATE_DTYPE: 8,
 }
 
 
@@ -203,9 +208,15 @@ def ibis_dtype_to_bigframes_dtype(
     if isinstance(ibis_dtype, ibis_dtypes.Struct):
         return pd.ArrowDtype(ibis_dtype_to_arrow_dtype(ibis_dtype))
 
+    # Nested types are open-ended, so only scalar types go through the cache.
+    return _ibis_scalar_dtype_to_bigframes_dtype(ibis_dtype)
+
+
+@functools.lru_cache(maxsize=256)
+def _ibis_scalar_dtype_to_bigframes_dtype(ibis_dtype: ibis_dtypes.DataType) -> Dtype:
     # BigQuery only supports integers of size 64 bits.
     if isinstance(ibis_dtype, ibis_dtypes.Integer):
-        return pd.Int64Dtype()
+        return _INT_DTYPE
 
     if ibis_dtype in IBIS_TO_BIGFRAMES:
         return IBIS_TO_BIGFRAMES[ibis_dtype]
@@ -251,6 +262,9 @@ def ibis_value_to_canonical_type(value: ibis_types.Value) -> ibis_types.Value:
         value = vendored_ibis_ops.ToJsonString(value).to_expr()
         return value.name(name)
     # Allow REQUIRED fields to be joined with NULLABLE fields.
+    if ibis_type.nullable:
+        # Already canonical, skip building a no-op cast.
+        return value
     nullable_type = ibis_type.copy(nullable=True)
     return value.cast(nullable_type).name(name)
 
@@ -288,6 +302,17 @@ def bigframes_dtype_to_ibis_dtype(
     Raises:
         ValueError: If passed a dtype not supported by BigQuery DataFrames.
     """
+    # Fast path: dtype objects map directly, without a round-trip through str().
+    ibis_dtype = BIGFRAMES_TO_IBIS.get(bigframes_dtype)  # type: ignore[arg-type]
+    if ibis_dtype is not None:
+        return ibis_dtype
+    return _bigframes_dtype_to_ibis_dtype_slow(bigframes_dtype)
+
+
+@functools.lru_cache(maxsize=256)
+def _bigframes_dtype_to_ibis_dtype_slow(
+    bigframes_dtype: Union[DtypeString, Dtype, np.dtype[Any]]
+) -> ibis_dtypes.DataType:
     if isinstance(bigframes_dtype, pd.ArrowDtype):
         return arrow_dtype_to_ibis_dtype(bigframes_dtype.pyarrow_dtype)
 
@@ -318,6 +343,9 @@ def bigframes_dtype_to_ibis_dtype(
     return BIGFRAMES_TO_IBIS[bigframes_dtype]
 
 
+_NON_NULL_SCALAR_TYPES = (bool, int, str)
+
+
 def literal_to_ibis_scalar(
     literal, force_dtype: typing.Optional[Dtype] = None, validate: bool = True
 ):
@@ -348,29 +376,34 @@ def literal_to_ibis_scalar(
         return ibis.literal(None, geotype)
     ibis_dtype = BIGFRAMES_TO_IBIS[force_dtype] if force_dtype else None
 
-    if pd.api.types.is_list_like(literal):
-        if validate:
-            raise ValueError(
-                f"List types can't be stored in BigQuery DataFrames. {constants.FEEDBACK_LINK}"
-            )
-        # "correct" way would be to use ibis.array, but this produces invalid BQ SQL syntax
-        return tuple(literal)
-    if not pd.api.types.is_list_like(literal) and pd.isna(literal):
-        if ibis_dtype:
-            return ibis.null().cast(ibis_dtype)
-        else:
-            return ibis.null()
-
-    scalar_expr = ibis.literal(literal)
+    # Builtin non-float scalars are neither list-like nor null, skip the checks.
+    if type(literal) not in _NON_NULL_SCALAR_TYPES:
+        if pd.api.types.is_list_like(literal):
+            if validate:
+                raise ValueError(
+                    f"List types can't be stored in BigQuery DataFrames. {constants.FEEDBACK_LINK}"
+                )
+            # "correct" way would be to use ibis.array, but this produces invalid BQ SQL syntax
+            return tuple(literal)
+        if pd.isna(literal):
+            if ibis_dtype:
+                return ibis.null().cast(ibis_dtype)
+            else:
+                return ibis.null()
+
     if ibis_dtype:
         scalar_expr = ibis.literal(literal, ibis_dtype)
-    elif scalar_expr.type().is_floating():
-        scalar_expr = ibis.literal(literal, ibis_dtypes.float64)
-    elif scalar_expr.type().is_integer():
-        scalar_expr = ibis.literal(literal, ibis_dtypes.int64)
+    else:
+        scalar_expr = ibis.literal(literal)
+        inferred_type = scalar_expr.type()
+        # Widen to the only numeric widths BigQuery supports.
+        if inferred_type.is_floating() and inferred_type != ibis_dtypes.float64:
+            scalar_expr = ibis.literal(literal, ibis_dtypes.float64)
+        elif inferred_type.is_integer() and inferred_type != ibis_dtypes.int64:
+            scalar_expr = ibis.literal(literal, ibis_dtypes.int64)
 
     # TODO(bmil): support other literals that can be coerced to compatible types
-    if validate and (scalar_expr.type() not in BIGFRAMES_TO_IBIS.values()):
+    if validate and (scalar_expr.type() not in _SUPPORTED_IBIS_TYPES):
         raise ValueError(
             f"Literal did not coerce to a supported data type: {literal}. {constants.FEEDBACK_LINK}"
         )
@@ -378,6 +411,46 @@ def literal_to_ibis_scalar(
     return scalar_expr
 
 
+# casts that just work
+# TODO(bmil): add to this as more casts are verified
+_GOOD_CASTS: Dict[ibis_dtypes.DataType, FrozenSet[ibis_dtypes.DataType]] = {
+    ibis_dtypes.bool: frozenset((ibis_dtypes.int64,)),
+    ibis_dtypes.int64: frozenset(
+        (
+            ibis_dtypes.bool,
+            ibis_dtypes.float64,
+            ibis_dtypes.string,
+            _IBIS_NUMERIC,
+            _IBIS_BIGNUMERIC,
+        )
+    ),
+    ibis_dtypes.float64: frozenset(
+        (
+            ibis_dtypes.string,
+            ibis_dtypes.int64,
+            _IBIS_NUMERIC,
+            _IBIS_BIGNUMERIC,
+        )
+    ),
+    ibis_dtypes.string: frozenset(
+        (
+            ibis_dtypes.int64,
+            ibis_dtypes.float64,
+            _IBIS_NUMERIC,
+            _IBIS_BIGNUMERIC,
+            ibis_dtypes.binary,
+        )
+    ),
+    ibis_dtypes.date: frozenset((ibis_dtypes.string,)),
+    _IBIS_NUMERIC: frozenset((ibis_dtypes.float64, _IBIS_BIGNUMERIC)),
+    _IBIS_BIGNUMERIC: frozenset((ibis_dtypes.float64, _IBIS_NUMERIC)),
+    ibis_dtypes.time: frozenset(),
+    ibis_dtypes.timestamp: frozenset((_IBIS_TIMESTAMP_UTC,)),
+    _IBIS_TIMESTAMP_UTC: frozenset((ibis_dtypes.timestamp,)),
+    ibis_dtypes.binary: frozenset((ibis_dtypes.string,)),
+}
+
+
 def cast_ibis_value(
     value: ibis_types.Value, to_type: ibis_dtypes.DataType
 ) -> ibis_types.Value:
@@ -397,54 +470,15 @@ def cast_ibis_value(
         TypeError: if the type cast cannot be executed"""
     if value.type() == to_type:
         return value
-    # casts that just work
-    # TODO(bmil): add to this as more casts are verified
-    good_casts = {
-        ibis_dtypes.bool: (ibis_dtypes.int64,),
-        ibis_dtypes.int64: (
-            ibis_dtypes.bool,
-            ibis_dtypes.float64,
-            ibis_dtypes.string,
-            ibis_dtypes.Decimal(precision=38, scale=9),
-            ibis_dtypes.Decimal(precision=76, scale=38),
-        ),
-        ibis_dtypes.float64: (
-            ibis_dtypes.string,
-            ibis_dtypes.int64,
-            ibis_dtypes.Decimal(precision=38, scale=9),
-            ibis_dtypes.Decimal(precision=76, scale=38),
-        ),
-        ibis_dtypes.string: (
-            ibis_dtypes.int64,
-            ibis_dtypes.float64,
-            ibis_dtypes.Decimal(precision=38, scale=9),
-            ibis_dtypes.Decimal(precision=76, scale=38),
-            ibis_dtypes.binary,
-        ),
-        ibis_dtypes.date: (ibis_dtypes.string,),
-        ibis_dtypes.Decimal(precision=38, scale=9): (
-            ibis_dtypes.float64,
-            ibis_dtypes.Decimal(precision=76, scale=38),
-        ),
-        ibis_dtypes.Decimal(precision=76, scale=38): (
-            ibis_dtypes.float64,
-            ibis_dtypes.Decimal(precision=38, scale=9),
-        ),
-        ibis_dtypes.time: (),
-        ibis_dtypes.timestamp: (ibis_dtypes.Timestamp(timezone="UTC"),),
-        ibis_dtypes.Timestamp(timezone="UTC"): (ibis_dtypes.timestamp,),
-        ibis_dtypes.binary: (ibis_dtypes.string,),
-    }
-
     value = ibis_value_to_canonical_type(value)
-    if value.type() in good_casts:
-        if to_type in good_casts[value.type()]:
-            return value.cast(to_type)
-    else:
+    good_targets = _GOOD_CASTS.get(value.type())
+    if good_targets is None:
         # this should never happen
         raise TypeError(
             f"Unexpected value type {value.type()}. {constants.FEEDBACK_LINK}"
         )
+    if to_type in good_targets:
+        return value.cast(to_type)
 
     # casts that need some encouragement
 
@@ -532,28 +566,31 @@ def is_compatible(scalar: typing.Any, dtype: Dtype) -> typing.Optional[Dtype]:
     elif pd.api.types.is_numeric_dtype(dtype):
         # Implicit conversion currently only supported for numeric types
         if pd.api.types.is_bool(scalar):
-            return lcd_type(pd.BooleanDtype(), dtype)
+            return lcd_type(_BOOL_DTYPE, dtype)
         if pd.api.types.is_float(scalar):
-            return lcd_type(pd.Float64Dtype(), dtype)
+            return lcd_type(_FLOAT_DTYPE, dtype)
         if pd.api.types.is_integer(scalar):
-            return lcd_type(pd.Int64Dtype(), dtype)
+            return lcd_type(_INT_DTYPE, dtype)
         if isinstance(scalar, decimal.Decimal):
             # TODO: Check context to see if can use NUMERIC instead of BIGNUMERIC
             return lcd_type(pd.ArrowDtype(pa.decimal128(76, 38)), dtype)
     return None
 
 
+_NUMERIC_HIERARCHY: typing.Tuple[Dtype, ...] = (
+    _BOOL_DTYPE,
+    _INT_DTYPE,
+    _FLOAT_DTYPE,
+    _NUMERIC_DTYPE,
+    _BIGNUMERIC_DTYPE,
+)
+
+
 def lcd_type(dtype1: Dtype, dtype2: Dtype) -> typing.Optional[Dtype]:
     if dtype1 == dtype2:
         return dtype1
     # Implicit conversion currently only supported for numeric types
-    hierarchy: list[Dtype] = [
-        pd.BooleanDtype(),
-        pd.Int64Dtype(),
-        pd.Float64Dtype(),
-        pd.ArrowDtype(pa.decimal128(38, 9)),
-        pd.ArrowDtype(pa.decimal256(76, 38)),
-    ]
+    hierarchy = _NUMERIC_HIERARCHY
     if (dtype1 not in hierarchy) or (dtype2 not in hierarchy):
         return None
     lcd_index = max(hierarchy.index(dtype1), hierarchy.index(dtype2))
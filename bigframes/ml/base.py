@@ -24,7 +24,7 @@ This library is an evolving attempt to
 import abc
 from typing import cast, Optional, TypeVar, Union
 
-from bigframes.ml import core
+from bigframes.ml import core, utils
 import bigframes.pandas as bpd
 import third_party.bigframes_vendored.sklearn.base
 
@@ -195,6 +195,8 @@ class Transformer(BaseEstimator):
         X: Union[bpd.DataFrame, bpd.Series],
         y: Optional[Union[bpd.DataFrame, bpd.Series]] = None,
     ) -> bpd.DataFrame:
+        # Convert once, so transform reads the frame that fit cached.
+        (X,) = utils.convert_to_dataframe(X)
         return self.fit(X, y).transform(X)
 
 
@@ -215,4 +217,6 @@ class LabelTransformer(BaseEstimator):
         self,
         y: Union[bpd.DataFrame, bpd.Series],
     ) -> bpd.DataFrame:
+        # Convert once, so transform reads the frame that fit cached.
+        (y,) = utils.convert_to_dataframe(y)
         return self.fit(y).transform(y)
@@ -19,7 +19,7 @@ https://scikit-learn.org/stable/modules/classes.html#module-sklearn.compose."""
 from __future__ import annotations
 
 import typing
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from bigframes import constants
 from bigframes.core import log_adapter
@@ -110,13 +110,33 @@ class ColumnTransformer(
 
         Returns:
             a list of tuples of (sql_expression, output_name)"""
-        return [
-            transformer._compile_to_sql([column], X=X)[0]
+        targets = [
+            (column, transformer)
             for column in columns
             for _, transformer, target_column in self.transformers_
             if column == target_column
         ]
 
+        # Compile each transformer once for all of its columns, so that ones
+        # that query the training data (e.g. KBinsDiscretizer) do it in a batch.
+        columns_by_transformer: Dict[
+            int, Tuple[CompilablePreprocessorType, List[str]]
+        ] = {}
+        for column, transformer in targets:
+            columns_by_transformer.setdefault(id(transformer), (transformer, []))[
+                1
+            ].append(column)
+        compiled: Dict[Tuple[int, str], Tuple[str, str]] = {}
+        for transformer, transformer_columns in columns_by_transformer.values():
+            compiled.update(
+                zip(
+                    ((id(transformer), column) for column in transformer_columns),
+                    transformer._compile_to_sql(transformer_columns, X=X),
+                )
+            )
+
+        return [compiled[(id(transformer), column)] for column, transformer in targets]
+
     def fit(
         self,
         X: Union[bpd.DataFrame, bpd.Series],
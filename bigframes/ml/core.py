@@ -38,8 +38,11 @@ class BqmlModel:
     def __init__(self, session: bigframes.Session, model: bigquery.Model):
         self._session = session
         self._model = model
+        # The model id never changes for this wrapper, even when register()
+        # refreshes the model metadata, so the name is built once.
+        self._model_name = f"{model.project}.{model.dataset_id}.{model.model_id}"
         self._model_manipulation_sql_generator = ml_sql.ModelManipulationSqlGenerator(
-            self.model_name
+            self._model_name
         )
 
     @property
@@ -50,7 +53,7 @@ class BqmlModel:
     @property
     def model_name(self) -> str:
         """Get the fully qualified name of the model, i.e. project_id.dataset_id.model_id"""
-        return f"{self._model.project}.{self._model.dataset_id}.{self._model.model_id}"
+        return self._model_name
 
     @property
     def model(self) -> bigquery.Model:
@@ -183,7 +183,7 @@ class XGBRegressor(
             raise RuntimeError("A model must be fitted before score")
 
         input_data = (
-            X.join(y, how="outer") if (X is not None) and (y is not None) else None
+            utils.join_on_index(X, y) if (X is not None) and (y is not None) else None
         )
         return self._bqml_model.evaluate(input_data)
 
@@ -337,7 +337,7 @@ class XGBClassifier(
         X, y = utils.convert_to_dataframe(X, y)
 
         input_data = (
-            X.join(y, how="outer") if (X is not None) and (y is not None) else None
+            utils.join_on_index(X, y) if (X is not None) and (y is not None) else None
         )
         return self._bqml_model.evaluate(input_data)
 
@@ -503,7 +503,7 @@ class RandomForestRegressor(
         X, y = utils.convert_to_dataframe(X, y)
 
         input_data = (
-            X.join(y, how="outer") if (X is not None) and (y is not None) else None
+            utils.join_on_index(X, y) if (X is not None) and (y is not None) else None
         )
         return self._bqml_model.evaluate(input_data)
 
@@ -669,7 +669,7 @@ class RandomForestClassifier(
         X, y = utils.convert_to_dataframe(X, y)
 
         input_data = (
-            X.join(y, how="outer") if (X is not None) and (y is not None) else None
+            utils.join_on_index(X, y) if (X is not None) and (y is not None) else None
         )
         return self._bqml_model.evaluate(input_data)
 
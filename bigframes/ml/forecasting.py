@@ -25,6 +25,11 @@ from bigframes.core import log_adapter
 from bigframes.ml import base, core, globals, utils
 import bigframes.pandas as bpd
 
+# ARIMA_PLUS has no tunable options yet, so every instance uses these.
+_BQML_OPTIONS: Dict[str, str | int | bool | float | List[str]] = {
+    "model_type": "ARIMA_PLUS"
+}
+
 
 @log_adapter.class_logger
 class ARIMAPlus(base.SupervisedTrainablePredictor):
@@ -47,7 +52,7 @@ class ARIMAPlus(base.SupervisedTrainablePredictor):
     @property
     def _bqml_options(self) -> Dict[str, str | int | bool | float | List[str]]:
         """The model options as they will be set for BQML."""
-        return {"model_type": "ARIMA_PLUS"}
+        return dict(_BQML_OPTIONS)
 
     def _fit(
         self,
@@ -148,7 +153,7 @@ class ARIMAPlus(base.SupervisedTrainablePredictor):
             raise RuntimeError("A model must be fitted before score")
         X, y = utils.convert_to_dataframe(X, y)
 
-        input_data = X.join(y, how="outer")
+        input_data = utils.join_on_index(X, y)
         return self._bqml_model.evaluate(input_data)
 
     def to_gbq(self, model_name: str, replace: bool = False) -> ARIMAPlus:
@@ -159,7 +159,7 @@ class LinearRegression(
 
         X, y = utils.convert_to_dataframe(X, y)
 
-        input_data = X.join(y, how="outer")
+        input_data = utils.join_on_index(X, y)
         return self._bqml_model.evaluate(input_data)
 
     def to_gbq(self, model_name: str, replace: bool = False) -> LinearRegression:
@@ -273,7 +273,7 @@ class LogisticRegression(
 
         X, y = utils.convert_to_dataframe(X, y)
 
-        input_data = X.join(y, how="outer")
+        input_data = utils.join_on_index(X, y)
         return self._bqml_model.evaluate(input_data)
 
     def to_gbq(self, model_name: str, replace: bool = False) -> LogisticRegression:
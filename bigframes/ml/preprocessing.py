@@ -58,15 +58,9 @@ class StandardScaler(
                 Ignored.
 
         Returns: a list of tuples of (sql_expression, output_name)"""
-        return [
-            (
-                self._base_sql_generator.ml_standard_scaler(
-                    column, f"standard_scaled_{column}"
-                ),
-                f"standard_scaled_{column}",
-            )
-            for column in columns
-        ]
+        scaler = self._base_sql_generator.ml_standard_scaler
+        names = [f"standard_scaled_{column}" for column in columns]
+        return [(scaler(column, name), name) for column, name in zip(columns, names)]
 
     @classmethod
     def _parse_from_sql(cls, sql: str) -> tuple[StandardScaler, str]:
@@ -142,15 +136,9 @@ class MaxAbsScaler(
                 Ignored.
 
         Returns: a list of tuples of (sql_expression, output_name)"""
-        return [
-            (
-                self._base_sql_generator.ml_max_abs_scaler(
-                    column, f"max_abs_scaled_{column}"
-                ),
-                f"max_abs_scaled_{column}",
-            )
-            for column in columns
-        ]
+        scaler = self._base_sql_generator.ml_max_abs_scaler
+        names = [f"max_abs_scaled_{column}" for column in columns]
+        return [(scaler(column, name), name) for column, name in zip(columns, names)]
 
     @classmethod
     def _parse_from_sql(cls, sql: str) -> tuple[MaxAbsScaler, str]:
@@ -226,15 +214,9 @@ class MinMaxScaler(
                 Ignored.
 
         Returns: a list of tuples of (sql_expression, output_name)"""
-        return [
-            (
-                self._base_sql_generator.ml_min_max_scaler(
-                    column, f"min_max_scaled_{column}"
-                ),
-                f"min_max_scaled_{column}",
-            )
-            for column in columns
-        ]
+        scaler = self._base_sql_generator.ml_min_max_scaler
+        names = [f"min_max_scaled_{column}" for column in columns]
+        return [(scaler(column, name), name) for column, name in zip(columns, names)]
 
     @classmethod
     def _parse_from_sql(cls, sql: str) -> tuple[MinMaxScaler, str]:
@@ -334,22 +316,22 @@ class KBinsDiscretizer(
         Returns: a list of tuples of (sql_expression, output_name)"""
         array_split_points = {}
         if self.strategy == "uniform":
+            # Fetch the bounds of every column in a single query.
+            bounds = typing.cast(bpd.DataFrame, X[columns]).agg(["min", "max"])
+            bounds_local = bounds.to_pandas()
             for column in columns:
-                min_value = X[column].min()
-                max_value = X[column].max()
+                min_value = bounds_local.loc["min", column]
+                max_value = bounds_local.loc["max", column]
                 bin_size = (max_value - min_value) / self.n_bins
                 array_split_points[column] = [
                     min_value + i * bin_size for i in range(self.n_bins - 1)
                 ]
 
+        bucketize = self._base_sql_generator.ml_bucketize
+        names = [f"kbinsdiscretizer_{column}" for column in columns]
         return [
-            (
-                self._base_sql_generator.ml_bucketize(
-                    column, array_split_points[column], f"kbinsdiscretizer_{column}"
-                ),
-                f"kbinsdiscretizer_{column}",
-            )
-            for column in columns
+            (bucketize(column, array_split_points[column], name), name)
+            for column, name in zip(columns, names)
         ]
 
     @classmethod
@@ -406,6 +388,9 @@ class OneHotEncoder(
     third_party.bigframes_vendored.sklearn.preprocessing._encoder.OneHotEncoder,
 ):
     # BQML max value https://cloud.google.com/bigquery/docs/reference/standard-sql/bigqueryml-syntax-one-hot-encoder#syntax
+    # These are always emitted explicitly: BQML's own defaults (top_k=32000,
+    # frequency_threshold=5) would drop categories sklearn keeps, and
+    # _parse_from_sql expects all four arguments.
     TOP_K_DEFAULT = 1000000
     FREQUENCY_THRESHOLD_DEFAULT = 0
 
@@ -466,14 +451,11 @@ class OneHotEncoder(
             if self.min_frequency is not None
             else OneHotEncoder.FREQUENCY_THRESHOLD_DEFAULT
         )
+        encoder = self._base_sql_generator.ml_one_hot_encoder
+        names = [f"onehotencoded_{column}" for column in columns]
         return [
-            (
-                self._base_sql_generator.ml_one_hot_encoder(
-                    column, drop, top_k, frequency_threshold, f"onehotencoded_{column}"
-                ),
-                f"onehotencoded_{column}",
-            )
-            for column in columns
+            (encoder(column, drop, top_k, frequency_threshold, name), name)
+            for column, name in zip(columns, names)
         ]
 
     @classmethod
@@ -535,7 +517,10 @@ class LabelEncoder(
     base.LabelTransformer,
     third_party.bigframes_vendored.sklearn.preprocessing._label.LabelEncoder,
 ):
-    # BQML max value https://cloud.google.com/bigquery/docs/reference/standard-sql/bigqueryml-syntax-one-hot-encoder#syntax
+    # BQML max value https://cloud.google.com/bigquery/docs/reference/standard-sql/bigqueryml-syntax-label-encoder#syntax
+    # ML.LABEL_ENCODER(expr, top_k, frequency_threshold) is always emitted with
+    # explicit values, since BQML's own defaults (top_k=32000,
+    # frequency_threshold=5) would map categories sklearn keeps to unknown.
     TOP_K_DEFAULT = 1000000
     FREQUENCY_THRESHOLD_DEFAULT = 0
 
@@ -592,14 +577,11 @@ class LabelEncoder(
             if self.min_frequency is not None
             else LabelEncoder.FREQUENCY_THRESHOLD_DEFAULT
         )
+        encoder = self._base_sql_generator.ml_label_encoder
+        names = [f"labelencoded_{column}" for column in columns]
         return [
-            (
-                self._base_sql_generator.ml_label_encoder(
-                    column, top_k, frequency_threshold, f"labelencoded_{column}"
-                ),
-                f"labelencoded_{column}",
-            )
-            for column in columns
+            (encoder(column, top_k, frequency_threshold, name), name)
+            for column, name in zip(columns, names)
         ]
 
     @classmethod
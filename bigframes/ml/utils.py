@@ -56,3 +56,16 @@ def _convert_to_series(frame: ArrayType) -> bpd.Series:
     raise ValueError(
         f"Unsupported type {type(frame)} to convert to Series. {constants.FEEDBACK_LINK}"
     )
+
+
+def join_on_index(X: bpd.DataFrame, y: bpd.DataFrame) -> bpd.DataFrame:
+    """Outer joins the feature and label columns on their indexes.
+
+    Unlike DataFrame.join, frames selected from the same DataFrame are
+    aligned row by row instead of with a SQL JOIN."""
+    if not X.columns.intersection(y.columns).empty:
+        raise NotImplementedError(
+            f"Deduping column names is not implemented. {constants.FEEDBACK_LINK}"
+        )
+    combined_index, _ = X._block.index.join(y._block.index, how="outer")
+    return bpd.DataFrame(combined_index._block)
@@ -126,31 +126,18 @@ def _convert_expr_input(
 
 
 # Operation Factories
+# A plain subclass reuses the base dataclass's generated methods, which is much
+# cheaper at import time than generating a new dataclass for every op.
 def create_unary_op(name: str) -> UnaryOp:
-    return dataclasses.make_dataclass(
-        name,
-        [("name", typing.ClassVar[str], name)],  # type: ignore
-        bases=(UnaryOp,),
-        frozen=True,
-    )()
+    return type(name, (UnaryOp,), {"name": name})()
 
 
 def create_binary_op(name: str) -> BinaryOp:
-    return dataclasses.make_dataclass(
-        name,
-        [("name", typing.ClassVar[str], name)],  # type: ignore
-        bases=(BinaryOp,),
-        frozen=True,
-    )()
+    return type(name, (BinaryOp,), {"name": name})()
 
 
 def create_ternary_op(name: str) -> TernaryOp:
-    return dataclasses.make_dataclass(
-        name,
-        [("name", typing.ClassVar[str], name)],  # type: ignore
-        bases=(TernaryOp,),
-        frozen=True,
-    )()
+    return type(name, (TernaryOp,), {"name": name})()
 
 
 # Unary Ops
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import typing
 
 import ibis
@@ -28,6 +29,8 @@ import third_party.bigframes_vendored.ibis.expr.operations as vendored_ibis_ops
 
 
 class WindowOp:
+    __slots__ = ()
+
     def _as_ibis(self, value: ibis_types.Column, window=None):
         raise NotImplementedError("Base class WindowOp has no implementaiton.")
 
@@ -43,49 +46,47 @@ class WindowOp:
 
 
 class AggregateOp(WindowOp):
+    __slots__ = ()
     name = "abstract_aggregate"
 
     def _as_ibis(self, value: ibis_types.Column, window=None):
         raise NotImplementedError("Base class AggregateOp has no implementaiton.")
 
 
-def numeric_op(operation):
-    def constrained_op(op, column: ibis_types.Column, window=None):
-        if column.type().is_boolean():
-            column = typing.cast(
-                ibis_types.NumericColumn, column.cast(ibis_dtypes.int64)
-            )
-        if column.type().is_numeric():
-            return operation(op, column, window)
-        else:
-            raise ValueError(
-                f"Numeric operation cannot be applied to type {column.type()}. {constants.FEEDBACK_LINK}"
-            )
-
-    return constrained_op
+def _as_numeric(column: ibis_types.Column) -> ibis_types.NumericColumn:
+    column_type = column.type()
+    if column_type.is_boolean():
+        return typing.cast(ibis_types.NumericColumn, column.cast(ibis_dtypes.int64))
+    if column_type.is_numeric():
+        return typing.cast(ibis_types.NumericColumn, column)
+    raise ValueError(
+        f"Numeric operation cannot be applied to type {column_type}. {constants.FEEDBACK_LINK}"
+    )
 
 
 class SumOp(AggregateOp):
+    __slots__ = ()
     name = "sum"
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.NumericColumn, window=None
     ) -> ibis_types.NumericValue:
+        column = _as_numeric(column)
         # Will be null if all inputs are null. Pandas defaults to zero sum though.
         bq_sum = _apply_window_if_present(column.sum(), window)
-        return (
-            ibis.case().when(bq_sum.isnull(), ibis_types.literal(0)).else_(bq_sum).end()  # type: ignore
+        return typing.cast(
+            ibis_types.NumericValue, ibis.coalesce(bq_sum, ibis_types.literal(0))
         )
 
 
 class MedianOp(AggregateOp):
+    __slots__ = ()
     name = "median"
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.NumericColumn, window=None
     ) -> ibis_types.NumericValue:
+        column = _as_numeric(column)
         # PERCENTILE_CONT has very few allowed windows. For example, "window
         # framing clause is not allowed for analytic function percentile_cont".
         if window is not None:
@@ -100,14 +101,16 @@ class MedianOp(AggregateOp):
 
 
 class ApproxQuartilesOp(AggregateOp):
+    __slots__ = ("name", "_quartile")
+
     def __init__(self, quartile: int):
         self.name = f"{quartile*25}%"
         self._quartile = quartile
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.NumericColumn, window=None
     ) -> ibis_types.NumericValue:
+        column = _as_numeric(column)
         # PERCENTILE_CONT has very few allowed windows. For example, "window
         # framing clause is not allowed for analytic function percentile_cont".
         if window is not None:
@@ -121,50 +124,51 @@ class ApproxQuartilesOp(AggregateOp):
 
 
 class MeanOp(AggregateOp):
+    __slots__ = ()
     name = "mean"
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.NumericColumn, window=None
     ) -> ibis_types.NumericValue:
+        column = _as_numeric(column)
         return _apply_window_if_present(column.mean(), window)
 
 
 class ProductOp(AggregateOp):
+    __slots__ = ()
     name = "product"
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.NumericColumn, window=None
     ) -> ibis_types.NumericValue:
-        # Need to short-circuit as log with zeroes is illegal sql
-        is_zero = typing.cast(ibis_types.BooleanColumn, (column == 0))
-
+        column = _as_numeric(column)
         # There is no product sql aggregate function, so must implement as a sum of logs, and then
         # apply power after. Note, log and power base must be equal! This impl uses base 2.
-        logs = typing.cast(
-            ibis_types.NumericColumn,
-            ibis.case().when(is_zero, 0).else_(column.abs().log2()).end(),
+        # Inputs are precomputed as plain numeric columns so that each reduction is a bare
+        # SUM/MAX over a single expression, with no CASE inside the aggregate.
+        is_zero = (column == 0).cast(ibis_dtypes.int64)
+        # Log with zeroes is illegal sql, so shift zeroes to one, which contributes log2(1) == 0.
+        log_abs = typing.cast(ibis_types.NumericColumn, (column.abs() + is_zero)).log2()
+        # Can't determine sign from logs, so have to determine parity of count of negative inputs
+        is_negative = (column < 0).cast(ibis_dtypes.int64)
+
+        logs_sum = _apply_window_if_present(log_abs.sum(), window)
+        negative_count = _apply_window_if_present(
+            typing.cast(ibis_types.NumericColumn, is_negative).sum(), window
         )
-        logs_sum = _apply_window_if_present(logs.sum(), window)
-        magnitude = typing.cast(ibis_types.NumericValue, ibis_types.literal(2)).pow(
-            logs_sum
+        any_zeroes = _apply_window_if_present(
+            typing.cast(ibis_types.NumericColumn, is_zero).max(), window
         )
 
-        # Can't determine sign from logs, so have to determine parity of count of negative inputs
-        is_negative = typing.cast(
-            ibis_types.NumericColumn,
-            ibis.case().when(column.sign() == -1, 1).else_(0).end(),
+        magnitude = typing.cast(ibis_types.NumericValue, ibis_types.literal(2)).pow(
+            logs_sum
         )
-        negative_count = _apply_window_if_present(is_negative.sum(), window)
         negative_count_parity = negative_count % typing.cast(
             ibis_types.NumericValue, ibis.literal(2)
         )  # 1 if result should be negative, otherwise 0
-
-        any_zeroes = _apply_window_if_present(is_zero.any(), window)
         float_result = (
             ibis.case()
-            .when(any_zeroes, ibis_types.literal(0))
+            .when(any_zeroes == 1, ibis_types.literal(0))
             .else_(magnitude * pow(-1, negative_count_parity))
             .end()
         )
@@ -172,6 +176,7 @@ class ProductOp(AggregateOp):
 
 
 class MaxOp(AggregateOp):
+    __slots__ = ()
     name = "max"
 
     def _as_ibis(self, column: ibis_types.Column, window=None) -> ibis_types.Value:
@@ -179,6 +184,7 @@ class MaxOp(AggregateOp):
 
 
 class MinOp(AggregateOp):
+    __slots__ = ()
     name = "min"
 
     def _as_ibis(self, column: ibis_types.Column, window=None) -> ibis_types.Value:
@@ -186,36 +192,34 @@ class MinOp(AggregateOp):
 
 
 class StdOp(AggregateOp):
+    __slots__ = ()
     name = "std"
 
-    @numeric_op
     def _as_ibis(self, x: ibis_types.Column, window=None) -> ibis_types.Value:
-        return _apply_window_if_present(
-            typing.cast(ibis_types.NumericColumn, x).std(), window
-        )
+        x = _as_numeric(x)
+        return _apply_window_if_present(x.std(), window)
 
 
 class VarOp(AggregateOp):
+    __slots__ = ()
     name = "var"
 
-    @numeric_op
     def _as_ibis(self, x: ibis_types.Column, window=None) -> ibis_types.Value:
-        return _apply_window_if_present(
-            typing.cast(ibis_types.NumericColumn, x).var(), window
-        )
+        x = _as_numeric(x)
+        return _apply_window_if_present(x.var(), window)
 
 
 class PopVarOp(AggregateOp):
+    __slots__ = ()
     name = "popvar"
 
-    @numeric_op
     def _as_ibis(self, x: ibis_types.Column, window=None) -> ibis_types.Value:
-        return _apply_window_if_present(
-            typing.cast(ibis_types.NumericColumn, x).var(how="pop"), window
-        )
+        x = _as_numeric(x)
+        return _apply_window_if_present(x.var(how="pop"), window)
 
 
 class CountOp(AggregateOp):
+    __slots__ = ()
     name = "count"
 
     def _as_ibis(
@@ -229,6 +233,8 @@ class CountOp(AggregateOp):
 
 
 class CutOp(WindowOp):
+    __slots__ = ("_bins_int", "_bins", "_labels")
+
     def __init__(self, bins: typing.Union[int, pd.IntervalIndex], labels=None):
         if isinstance(bins, int):
             if not bins > 0:
@@ -299,14 +305,16 @@ class CutOp(WindowOp):
 
 
 class QcutOp(WindowOp):
+    __slots__ = ("name", "_quantiles")
+
     def __init__(self, quantiles: typing.Union[int, typing.Sequence[float]]):
         self.name = f"qcut-{quantiles}"
         self._quantiles = quantiles
 
-    @numeric_op
     def _as_ibis(
         self, column: ibis_types.Column, window=None
     ) -> ibis_types.IntegerValue:
+        column = _as_numeric(column)
         if isinstance(self._quantiles, int):
             quantiles_ibis = dtypes.literal_to_ibis_scalar(self._quantiles)
             percent_ranks = typing.cast(
@@ -346,6 +354,7 @@ class QcutOp(WindowOp):
 
 
 class NuniqueOp(AggregateOp):
+    __slots__ = ()
     name = "nunique"
 
     def _as_ibis(
@@ -361,6 +370,7 @@ class NuniqueOp(AggregateOp):
 class AnyValueOp(AggregateOp):
     # Warning: only use if all values are equal. Non-deterministic otherwise.
     # Do not expose to users. For special cases only (e.g. pivot).
+    __slots__ = ()
     name = "any_value"
 
     def _as_ibis(
@@ -374,6 +384,7 @@ class AnyValueOp(AggregateOp):
 
 
 class RankOp(WindowOp):
+    __slots__ = ()
     name = "rank"
 
     def _as_ibis(
@@ -392,6 +403,8 @@ class RankOp(WindowOp):
 
 
 class DenseRankOp(WindowOp):
+    __slots__ = ()
+
     def _as_ibis(
         self, column: ibis_types.Column, window=None
     ) -> ibis_types.IntegerValue:
@@ -408,11 +421,15 @@ class DenseRankOp(WindowOp):
 
 
 class FirstOp(WindowOp):
+    __slots__ = ()
+
     def _as_ibis(self, column: ibis_types.Column, window=None) -> ibis_types.Value:
         return _apply_window_if_present(column.first(), window)
 
 
 class FirstNonNullOp(WindowOp):
+    __slots__ = ()
+
     @property
     def skips_nulls(self):
         return False
@@ -424,11 +441,15 @@ class FirstNonNullOp(WindowOp):
 
 
 class LastOp(WindowOp):
+    __slots__ = ()
+
     def _as_ibis(self, column: ibis_types.Column, window=None) -> ibis_types.Value:
         return _apply_window_if_present(column.last(), window)
 
 
 class LastNonNullOp(WindowOp):
+    __slots__ = ()
+
     @property
     def skips_nulls(self):
         return False
@@ -440,6 +461,8 @@ class LastNonNullOp(WindowOp):
 
 
 class ShiftOp(WindowOp):
+    __slots__ = ("_periods",)
+
     def __init__(self, periods: int):
         self._periods = periods
 
@@ -456,11 +479,13 @@ class ShiftOp(WindowOp):
 
 
 class DiffOp(WindowOp):
+    __slots__ = ("_periods",)
+
     def __init__(self, periods: int):
         self._periods = periods
 
     def _as_ibis(self, column: ibis_types.Column, window=None) -> ibis_types.Value:
-        shifted = ShiftOp(self._periods)._as_ibis(column, window)
+        shifted = shift_op(self._periods)._as_ibis(column, window)
         if column.type().is_boolean():
             return typing.cast(ibis_types.BooleanColumn, column) != typing.cast(
                 ibis_types.BooleanColumn, shifted
@@ -478,40 +503,43 @@ class DiffOp(WindowOp):
 
 
 class AllOp(AggregateOp):
+    __slots__ = ()
+
     def _as_ibis(
         self, column: ibis_types.Column, window=None
     ) -> ibis_types.BooleanValue:
         # BQ will return null for empty column, result would be true in pandas.
-        result = _is_true(column).all()
+        result = _apply_window_if_present(_is_true(column).all(), window)
         return typing.cast(
-            ibis_types.BooleanScalar,
-            _apply_window_if_present(result, window).fillna(ibis_types.literal(True)),
+            ibis_types.BooleanScalar, ibis.coalesce(result, ibis_types.literal(True))
         )
 
 
 class AnyOp(AggregateOp):
+    __slots__ = ()
     name = "any"
 
     def _as_ibis(
         self, column: ibis_types.Column, window=None
     ) -> ibis_types.BooleanValue:
         # BQ will return null for empty column, result would be false in pandas.
-        result = _is_true(column).any()
+        result = _apply_window_if_present(_is_true(column).any(), window)
         return typing.cast(
-            ibis_types.BooleanScalar,
-            _apply_window_if_present(result, window).fillna(ibis_types.literal(True)),
+            ibis_types.BooleanScalar, ibis.coalesce(result, ibis_types.literal(False))
         )
 
 
 def _is_true(column: ibis_types.Column) -> ibis_types.BooleanColumn:
-    if column.type().is_boolean():
+    column_type = column.type()
+    if column_type.is_boolean():
+        # Aggregate boolean columns directly, without a comparison.
         return typing.cast(ibis_types.BooleanColumn, column)
-    elif column.type().is_numeric():
+    elif column_type.is_numeric():
         result = typing.cast(ibis_types.NumericColumn, column).__ne__(
             ibis_types.literal(0)
         )
         return typing.cast(ibis_types.BooleanColumn, result)
-    elif column.type().is_string():
+    elif column_type.is_string():
         result = typing.cast(
             ibis_types.StringValue, column
         ).length() > ibis_types.literal(0)
@@ -549,6 +577,20 @@ dense_rank_op = DenseRankOp()
 all_op = AllOp()
 any_op = AnyOp()
 first_op = FirstOp()
+pop_var_op = PopVarOp()
+any_value_op = AnyValueOp()
+first_non_null_op = FirstNonNullOp()
+last_non_null_op = LastNonNullOp()
+
+
+@functools.lru_cache(maxsize=None)
+def shift_op(periods: int) -> ShiftOp:
+    return ShiftOp(periods)
+
+
+@functools.lru_cache(maxsize=None)
+def diff_op(periods: int) -> DiffOp:
+    return DiffOp(periods)
 
 
 # TODO: Alternative names and lookup from numpy function objects
@@ -127,10 +127,10 @@ class SeriesMethods:
         op: ops.UnaryOp,
     ) -> series.Series:
         """Applies a unary operator to the series."""
-        block, result_id = self._block.apply_unary_op(
-            self._value_column, op, result_label=self._name
+        block, _ = self._block.project_exprs(
+            [op.as_expr(self._value_column)], [self._name], drop=True
         )
-        return series.Series(block.select_column(result_id))
+        return series.Series(block)
 
     def _apply_binary_op(
         self,
@@ -145,30 +145,20 @@ class SeriesMethods:
             raise NotImplementedError(
                 f"Pandas series not supported as operand. {constants.FEEDBACK_LINK}"
             )
+        name = self._name
         if isinstance(other, series.Series):
             (self_col, other_col, block) = self._align(other, how=alignment)
-
-            name = self._name
-            if (
-                isinstance(other, series.Series)
-                and other.name != self._name
-                and alignment == "outer"
-            ):
+            if other.name != name and alignment == "outer":
                 name = None
-            expr = op.as_expr(
-                other_col if reverse else self_col, self_col if reverse else other_col
-            )
-            block, result_id = block.project_expr(expr, name)
-            return series.Series(block.select_column(result_id))
-
+            left, right = ex.free_var(self_col), ex.free_var(other_col)
         else:
-            name = self._name
-            expr = op.as_expr(
-                ex.const(other) if reverse else self._value_column,
-                self._value_column if reverse else ex.const(other),
-            )
-            block, result_id = self._block.project_expr(expr, name)
-            return series.Series(block.select_column(result_id))
+            block = self._block
+            left, right = ex.free_var(self._value_column), ex.const(other)
+
+        expr = op.as_expr(right, left) if reverse else op.as_expr(left, right)
+        # Project only the result, rather than appending it and then selecting it.
+        block, _ = block.project_exprs([expr], [name], drop=True)
+        return series.Series(block)
 
     def _apply_corr_aggregation(self, other: series.Series) -> float:
         (left, right, block) = self._align(other, how="outer")
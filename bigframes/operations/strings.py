@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+import functools
+import operator
 import re
-from typing import cast, Literal, Optional, Union
+from typing import cast, Iterable, Literal, Optional, Union
 
 import bigframes.constants as constants
 from bigframes.core import log_adapter
@@ -32,6 +34,11 @@ REGEXP_FLAGS = {
     re.DOTALL: "s",
 }
 
+# Above this many patterns, startswith/endswith match a single regex
+# alternation instead of OR-ing one comparison per pattern.
+_MAX_AFFIX_COMPARISONS = 4
+_RE2_METACHARACTERS = frozenset("\\.+*?()|[]{}^$")
+
 
 @log_adapter.class_logger
 class StringMethods(bigframes.operations.base.SeriesMethods, vendorstr.StringMethods):
@@ -218,6 +225,10 @@ class StringMethods(bigframes.operations.base.SeriesMethods, vendorstr.StringMet
     ) -> series.Series:
         if not isinstance(pat, tuple):
             pat = (pat,)
+        if len(pat) > _MAX_AFFIX_COMPARISONS:
+            return self._apply_unary_op(
+                ops.StrContainsRegexOp(pat=f"^({_re2_alternation(pat)})")
+            )
         return self._apply_unary_op(ops.StartsWithOp(pat=pat))
 
     def endswith(
@@ -226,6 +237,10 @@ class StringMethods(bigframes.operations.base.SeriesMethods, vendorstr.StringMet
     ) -> series.Series:
         if not isinstance(pat, tuple):
             pat = (pat,)
+        if len(pat) > _MAX_AFFIX_COMPARISONS:
+            return self._apply_unary_op(
+                ops.StrContainsRegexOp(pat=f"({_re2_alternation(pat)})$")
+            )
         return self._apply_unary_op(ops.EndsWithOp(pat=pat))
 
     def zfill(self, width: int) -> series.Series:
@@ -245,20 +260,36 @@ class StringMethods(bigframes.operations.base.SeriesMethods, vendorstr.StringMet
         return self._apply_binary_op(others, ops.strconcat_op, alignment=join)
 
 
-def _parse_flags(flags: int) -> Optional[str]:
-    re2flags = []
-    for reflag, re2flag in REGEXP_FLAGS.items():
-        if flags & flags:
-            re2flags.append(re2flag)
-            flags = flags ^ reflag
+def _re2_alternation(pats: Iterable[str]) -> str:
+    return "|".join(
+        "".join("\\" + char if char in _RE2_METACHARACTERS else char for char in pat)
+        for pat in pats
+    )
 
-    # Remaining flags couldn't be mapped to re2 engine
-    if flags:
-        raise NotImplementedError(
-            f"Could not handle RegexFlag: {flags}. {constants.FEEDBACK_LINK}"
-        )
 
+def _compute_re2_flags(flags: int) -> Optional[str]:
+    re2flags = [re2flag for reflag, re2flag in REGEXP_FLAGS.items() if flags & reflag]
     if re2flags:
         return "(?" + "".join(re2flags) + ")"
     else:
         return None
+
+
+_SUPPORTED_FLAGS_MASK = functools.reduce(operator.or_, map(int, REGEXP_FLAGS), 0)
+
+# Inline re2 flags for every combination of the supported python flags.
+_FLAG_TABLE = {
+    mask: _compute_re2_flags(mask)
+    for mask in range(_SUPPORTED_FLAGS_MASK + 1)
+    if not mask & ~_SUPPORTED_FLAGS_MASK
+}
+
+
+def _parse_flags(flags: int) -> Optional[str]:
+    # Remaining flags couldn't be mapped to re2 engine
+    residual = flags & ~_SUPPORTED_FLAGS_MASK
+    if residual:
+        raise NotImplementedError(
+            f"Could not handle RegexFlag: {residual}. {constants.FEEDBACK_LINK}"
+        )
+    return _FLAG_TABLE[flags & _SUPPORTED_FLAGS_MASK]
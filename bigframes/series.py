@@ -27,7 +27,6 @@ import google.cloud.bigquery as bigquery
 import numpy
 import pandas
 import pandas.core.dtypes.common
-import typing_extensions
 
 import bigframes.constants as constants
 import bigframes.core
@@ -252,17 +251,29 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
     def __repr__(self) -> str:
         # TODO(swast): Add a timeout here? If the query is taking a long time,
         # maybe we just print the job metadata that we have so far?
-        # TODO(swast): Avoid downloading the whole series by using job
-        # metadata, like we do with DataFrame.
         opts = bigframes.options.display
         max_results = opts.max_rows
         if opts.repr_mode == "deferred":
             return formatter.repr_query_job(self.query_job)
 
-        pandas_df, _, query_job = self._block.retrieve_repr_request_results(max_results)
+        pandas_df, row_count, query_job = self._block.retrieve_repr_request_results(
+            max_results
+        )
         self._set_internal_query_job(query_job)
 
-        return repr(pandas_df.iloc[:, 0])
+        pd_series = pandas_df.iloc[:, 0]
+        repr_string = repr(pd_series)
+        if row_count <= len(pd_series):
+            return repr_string
+
+        # Only the first rows were downloaded, so report the true length.
+        lines = repr_string.split("\n")[:-1]
+        footer = [f"Length: {row_count}", f"dtype: {pd_series.dtype}"]
+        if pd_series.name is not None:
+            footer.insert(0, f"Name: {pd_series.name}")
+        lines.append("...")
+        lines.append(", ".join(footer))
+        return "\n".join(lines)
 
     def astype(
         self,
@@ -346,9 +357,10 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
             block, condition_id = block.project_expr(
                 ops.ne_op.as_expr(level_id, ex.const(index))
             )
-        block = block.filter(condition_id, keep_null=True)
-        block = block.drop_columns([condition_id])
-        return Series(block.select_column(self._value_column))
+        block = block.filter_and_select(
+            condition_id, [self._value_column], keep_null=True
+        )
+        return Series(block)
 
     def droplevel(self, level: LevelsType, axis: int | str = 0):
         resolved_level_ids = self._resolve_levels(level)
@@ -388,13 +400,13 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
 
     def ffill(self, *, limit: typing.Optional[int] = None) -> Series:
         window = bigframes.core.window_spec.WindowSpec(preceding=limit, following=0)
-        return self._apply_window_op(agg_ops.LastNonNullOp(), window)
+        return self._apply_window_op(agg_ops.last_non_null_op, window)
 
     pad = ffill
 
     def bfill(self, *, limit: typing.Optional[int] = None) -> Series:
         window = bigframes.core.window_spec.WindowSpec(preceding=0, following=limit)
-        return self._apply_window_op(agg_ops.FirstNonNullOp(), window)
+        return self._apply_window_op(agg_ops.first_non_null_op, window)
 
     def cummax(self) -> Series:
         return self._apply_window_op(
@@ -416,14 +428,14 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.ShiftOp(periods), window)
+        return self._apply_window_op(agg_ops.shift_op(periods), window)
 
     def diff(self, periods: int = 1) -> Series:
         window = bigframes.core.window_spec.WindowSpec(
             preceding=periods if periods > 0 else None,
             following=-periods if periods < 0 else None,
         )
-        return self._apply_window_op(agg_ops.DiffOp(periods), window)
+        return self._apply_window_op(agg_ops.diff_op(periods), window)
 
     def pct_change(self, periods: int = 1) -> Series:
         # Future versions of pandas will not perfrom ffill automatically
@@ -769,14 +781,6 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
     def var(self) -> float:
         return typing.cast(float, self._apply_aggregation(agg_ops.var_op))
 
-    def _central_moment(self, n: int) -> float:
-        """Useful helper for calculating central moment statistics"""
-        # Nth central moment is mean((x-mean(x))^n)
-        # See: https://en.wikipedia.org/wiki/Moment_(mathematics)
-        mean_deltas = self - self.mean()
-        delta_powers = mean_deltas**n
-        return delta_powers.mean()
-
     def agg(self, func: str | typing.Sequence[str]) -> scalars.Scalar | Series:
         if _is_list_like(func):
             if self.dtype not in bigframes.dtypes.NUMERIC_BIGFRAMES_TYPES_PERMISSIVE:
@@ -799,36 +803,11 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
     aggregate = agg
 
     def skew(self):
-        count = self.count()
-        if count < 3:
-            return pandas.NA
-
-        moment3 = self._central_moment(3)
-        moment2 = self.var() * (count - 1) / count  # Convert sample var to pop var
-
-        # See G1 estimator:
-        # https://en.wikipedia.org/wiki/Skewness#Sample_skewness
-        numerator = moment3
-        denominator = moment2 ** (3 / 2)
-        adjustment = (count * (count - 1)) ** 0.5 / (count - 2)
-
-        return (numerator / denominator) * adjustment
+        # Count, variance and third moment are computed in a single query.
+        return self._get_single_value(block_ops.skew(self._block, [self._value_column]))
 
     def kurt(self):
-        count = self.count()
-        if count < 4:
-            return pandas.NA
-
-        moment4 = self._central_moment(4)
-        moment2 = self.var() * (count - 1) / count  # Convert sample var to pop var
-
-        # Kurtosis is often defined as the second standardize moment: moment(4)/moment(2)**2
-        # Pandas however uses Fisher’s estimator, implemented below
-        numerator = (count + 1) * (count - 1) * moment4
-        denominator = (count - 2) * (count - 3) * moment2**2
-        adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
-
-        return (numerator / denominator) - adjustment
+        return self._get_single_value(block_ops.kurt(self._block, [self._value_column]))
 
     kurtosis = kurt
 
@@ -1044,6 +1023,12 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
         values, index = self._align_n([other1, other2], how)
         return (values[0], values[1], values[2], index)
 
+    def _get_single_value(self, block: blocks.Block) -> Any:
+        """Downloads the only value of a single-row, single-column block."""
+        pd_df, query_job = block.to_pandas()
+        self._set_internal_query_job(query_job)
+        return pd_df.iloc[0, 0]
+
     def _apply_aggregation(self, op: agg_ops.AggregateOp) -> Any:
         return self._block.get_stat(self._value_column, op)
 
@@ -1528,5 +1513,4 @@ class Series(bigframes.operations.base.SeriesMethods, vendored_pandas_series.Ser
         return self
 
 
-def _is_list_like(obj: typing.Any) -> typing_extensions.TypeGuard[typing.Sequence]:
-    return pandas.api.types.is_list_like(obj)
+_is_list_like = utils.is_list_like
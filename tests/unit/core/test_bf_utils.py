@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy
+import pandas
+import pytest
+
 from bigframes.core import utils
 
 
@@ -54,3 +58,24 @@ def test_get_standardized_ids_tuple():
     col_ids, _ = utils.get_standardized_ids(col_labels)
 
     assert col_ids == ["('foo',_1)", "('foo',_2)", "('bar',_1)"]
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        "label",
+        b"label",
+        1,
+        1.5,
+        numpy.int64(1),
+        [1, 2],
+        ("a", "b"),
+        {"a"},
+        {"a": 1},
+        numpy.array([1, 2]),
+        pandas.Index(["a"]),
+    ],
+)
+def test_is_list_like_matches_pandas(obj):
+    assert utils.is_list_like(obj) == pandas.api.types.is_list_like(obj)
@@ -12,11 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 import pandas
 import pandas.testing
 import pytest
 
+import bigframes.core.block_transforms as block_ops
 import bigframes.core.blocks as blocks
+import bigframes.operations as ops
+import bigframes.operations.aggregations as agg_ops
 
 
 @pytest.mark.parametrize(
@@ -80,3 +85,182 @@ def test_block_from_local(data):
     pandas.testing.assert_index_equal(block.column_labels, expected.columns)
     assert tuple(block.index_labels) == tuple(expected.index.names)
     assert block.shape == expected.shape
+
+
+def test_combine_shared_source_columns():
+    block = blocks.block_from_local(
+        pandas.DataFrame(
+            {"x": [1, 2, 3], "y": [4, 5, 6]},
+            index=pandas.Index([7, 8, 9], name="idx"),
+        )
+    )
+    x_col, y_col = block.value_columns
+
+    combined = blocks.combine_shared_source_columns(
+        [
+            block.select_column(y_col).with_column_labels(["a"]),
+            block.select_column(x_col).with_column_labels(["b"]),
+            block.select_column(y_col).with_column_labels(["c"]),
+        ]
+    )
+
+    assert combined is not None
+    pandas.testing.assert_index_equal(
+        combined.column_labels, pandas.Index(["a", "b", "c"])
+    )
+    assert tuple(combined.index_labels) == ("idx",)
+    result = combined.expr._try_evaluate_local()
+    assert list(result[combined.value_columns[0]]) == [4, 5, 6]
+    assert list(result[combined.value_columns[1]]) == [1, 2, 3]
+
+
+def test_combine_shared_source_columns_different_sources():
+    left = blocks.block_from_local(pandas.DataFrame({"x": [1, 2, 3]}))
+    right = blocks.block_from_local(pandas.DataFrame({"x": [1, 2, 3]}))
+
+    assert blocks.combine_shared_source_columns([left, right]) is None
+
+
+def test_summarize_repeated_stats():
+    block = blocks.block_from_local(
+        pandas.DataFrame({"x": [1, 2, 3], "y": [4.0, 5.0, None]})
+    )
+
+    summary = block.summarize(
+        block.value_columns, [agg_ops.sum_op, agg_ops.mean_op, agg_ops.sum_op]
+    )
+
+    result = summary.expr._try_evaluate_local()
+    assert list(result[summary.index_columns[0]]) == ["sum", "mean", "sum"]
+    assert list(result[summary.value_columns[0]]) == [6, 2, 6]
+    assert list(result[summary.value_columns[1]]) == [9, 4.5, 9]
+
+
+def test_merge_multi_key_partially_matching_labels():
+    left = blocks.block_from_local(
+        pandas.DataFrame({"k1": [1, 2], "k2": [3, 4], "v": [5, 6]})
+    )
+    right = blocks.block_from_local(
+        pandas.DataFrame({"k1": [1, 2], "other_k2": [3, 4], "v": [7, 8]})
+    )
+
+    merged = left.merge(
+        right,
+        "inner",
+        left.value_columns[:2],
+        right.value_columns[:2],
+        sort=False,
+    )
+
+    pandas.testing.assert_index_equal(
+        merged.column_labels, pandas.Index(["k1", "k2", "v_x", "other_k2", "v_y"])
+    )
+
+
+def test_multi_apply_unary_op():
+    block = blocks.block_from_local(
+        pandas.DataFrame({"x": [1, None, 3], "y": [4.0, 5.0, None]})
+    )
+
+    result_block = block.multi_apply_unary_op(block.value_columns, ops.isnull_op)
+
+    assert result_block.value_columns == block.value_columns
+    pandas.testing.assert_index_equal(result_block.column_labels, block.column_labels)
+    result = result_block.expr._try_evaluate_local()
+    assert list(result[block.value_columns[0]]) == [False, True, False]
+    assert list(result[block.value_columns[1]]) == [False, False, True]
+
+
+def test_drop_duplicates_result_known_unique():
+    block = blocks.block_from_local(pandas.DataFrame({"x": [1, 1, 2], "y": [3, 4, 5]}))
+    x_col, y_col = block.value_columns
+
+    deduped = block_ops.drop_duplicates(block, [x_col])
+
+    assert deduped.is_unique_over([x_col])
+    assert deduped.is_unique_over([x_col, y_col])
+    assert not deduped.is_unique_over([y_col])
+    assert not block.is_unique_over([x_col])
+    assert block_ops.drop_duplicates(deduped, [x_col, y_col]) is deduped
+
+
+def test_indicate_duplicates_known_unique():
+    block = blocks.block_from_local(pandas.DataFrame({"x": [1, 2, 3]}))
+    x_col = block.value_columns[0]
+
+    result_block, indicator = block_ops.indicate_duplicates(
+        block.with_unique_keys([x_col]), [x_col]
+    )
+
+    result = result_block.expr._try_evaluate_local()
+    assert list(result[indicator]) == [False, False, False]
+
+
+@pytest.fixture
+def block_with_mock_session(monkeypatch):
+    block = blocks.block_from_local(pandas.DataFrame({"x": [1, 2]}))
+    session = mock.Mock()
+    session._execute.return_value = (mock.Mock(), mock.Mock())
+    session._rows_to_dataframe.return_value = pandas.DataFrame(
+        {block.index_columns[0]: [0, 1], block.value_columns[0]: [1, 2]}
+    )
+    monkeypatch.setattr(blocks.Block, "session", property(lambda self: session))
+    return block, session
+
+
+def test_to_pandas_without_size_limit_skips_table_size_lookup(
+    block_with_mock_session,
+):
+    block, session = block_with_mock_session
+
+    result, _ = block.to_pandas()
+
+    session._get_table_size.assert_not_called()
+    assert list(result["x"]) == [1, 2]
+
+
+def test_row_preserving_transforms_reuse_cached_row_count(monkeypatch):
+    block = blocks.block_from_local(pandas.DataFrame({"x": [1, 2], "y": [3, 4]}))
+    assert block.shape == (2, 2)
+    compute_row_count = mock.Mock(side_effect=AssertionError("recounted rows"))
+    monkeypatch.setattr(blocks.Block, "_compute_row_count", compute_row_count)
+
+    x_id, y_id = block.value_columns
+    derived, _ = block.apply_unary_op(x_id, ops.isnull_op)
+    derived = derived.select_columns([y_id]).with_column_labels(["z"])
+
+    assert derived.shape == (2, 1)
+
+
+def test_to_pandas_reuses_downloaded_results(block_with_mock_session):
+    block, session = block_with_mock_session
+
+    first, _ = block.to_pandas()
+    first["x"] = 0
+    second, _ = block.to_pandas()
+
+    session._execute.assert_called_once()
+    assert list(second["x"]) == [1, 2]
+
+
+def test_retrieve_repr_request_results_counts_only_when_truncated(monkeypatch):
+    block = blocks.block_from_local(pandas.DataFrame({"x": [1, 2, 3]}))
+    compute_row_count = mock.Mock(return_value=3)
+    monkeypatch.setattr(blocks.Block, "_compute_row_count", compute_row_count)
+    rows = pandas.DataFrame({"x": [1, 2, 3]})
+    monkeypatch.setattr(
+        blocks.Block,
+        "slice",
+        lambda self, start, stop: mock.Mock(
+            to_pandas=mock.Mock(return_value=(rows.iloc[start:stop], None))
+        ),
+    )
+
+    head, count, _ = block.retrieve_repr_request_results(5)
+    assert (len(head), count) == (3, 3)
+    compute_row_count.assert_not_called()
+
+    block._cached_row_count = None
+    head, count, _ = block.retrieve_repr_request_results(2)
+    assert (len(head), count) == (2, 3)
+    compute_row_count.assert_called_once()
@@ -0,0 +1,49 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+import bigframes.core.eval as eval_
+import bigframes.core.expression as ex
+import bigframes.operations as ops
+
+COLUMNS = {"a": "col_a", "b": "col_b"}
+
+
+def test_parse_expression_arithmetic():
+    result = eval_.parse_expression("(a + b) * 2", COLUMNS.get)
+
+    assert result == ops.mul_op.as_expr(
+        ops.add_op.as_expr(ex.free_var("col_a"), ex.free_var("col_b")),
+        ex.const(2),
+    )
+
+
+def test_parse_expression_chained_comparison():
+    result = eval_.parse_expression("0 < a <= b", COLUMNS.get)
+
+    assert result == ops.and_op.as_expr(
+        ops.lt_op.as_expr(ex.const(0), ex.free_var("col_a")),
+        ops.le_op.as_expr(ex.free_var("col_a"), ex.free_var("col_b")),
+    )
+
+
+def test_parse_expression_unknown_column():
+    with pytest.raises(KeyError):
+        eval_.parse_expression("a + c", COLUMNS.get)
+
+
+def test_parse_expression_unsupported_syntax():
+    with pytest.raises(NotImplementedError):
+        eval_.parse_expression("a.sum()", COLUMNS.get)
@@ -0,0 +1,44 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest.mock as mock
+
+import pandas
+import pytest
+
+import bigframes.core.blocks as blocks
+import bigframes.core.indexes.index as indexes
+
+
+@pytest.mark.parametrize(
+    ("row_count", "expected"),
+    [
+        (2, "Index([1, 2], dtype='Int64', name='idx')"),
+        (100, "Index([1, 2], dtype='Int64', name='idx')\n...\nLength: 100"),
+    ],
+)
+def test_index_repr_reports_total_length(
+    monkeypatch: pytest.MonkeyPatch, row_count, expected
+):
+    block = blocks.block_from_local(
+        pandas.DataFrame({"x": [0, 0]}, index=pandas.Index([1, 2], name="idx"))
+    )
+    head = pandas.DataFrame(index=pandas.Index([1, 2], dtype="Int64"))
+    monkeypatch.setattr(
+        blocks.Block,
+        "retrieve_repr_request_results",
+        mock.Mock(return_value=(head, row_count, None)),
+    )
+
+    assert repr(indexes.IndexValue(block)) == expected
@@ -0,0 +1,33 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ibis
+
+from bigframes.core.compile import row_identity
+
+
+def test_get_relative_predicates_factors_out_equivalent_predicates():
+    table = ibis.table({"col1": "int64"}, name="test_table")
+    left_predicates = [table["col1"] > 1, table["col1"] < 10]
+    # Equivalent to the first left predicate, but a distinct expression object.
+    right_predicates = [table["col1"] > 1, table["col1"] != 5]
+
+    left_relative, right_relative = row_identity._get_relative_predicates(
+        left_predicates, right_predicates
+    )
+
+    assert len(left_relative) == 1
+    assert left_relative[0].equals(left_predicates[1])
+    assert len(right_relative) == 1
+    assert right_relative[0].equals(right_predicates[1])
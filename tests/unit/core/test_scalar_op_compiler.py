@@ -0,0 +1,78 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ibis
+import pandas as pd
+
+from bigframes.core.compile import scalar_op_compiler
+
+
+def test_floordiv_and_mod_by_nonzero_literal_skip_zero_divisor_branch():
+    table = ibis.table({"a": "int64"}, name="test_table")
+    divisor = ibis.literal(-3)
+
+    floordiv_sql = ibis.bigquery.compile(
+        scalar_op_compiler.floordiv_op(table.a, divisor).name("result")
+    )
+    mod_sql = ibis.bigquery.compile(
+        scalar_op_compiler.mod_op(table.a, divisor).name("result")
+    )
+
+    assert "CASE" not in floordiv_sql
+    assert "-3 = 0" not in mod_sql
+
+
+def test_floordiv_and_mod_by_nonzero_literal_match_python():
+    values = [-7, 7, 0, 5]
+    client = ibis.pandas.connect({"test_table": pd.DataFrame({"a": values})})
+    table = client.table("test_table")
+    divisor = ibis.literal(-3)
+
+    floordiv = client.execute(
+        scalar_op_compiler.floordiv_op(table.a, divisor).name("result")
+    )
+    mod = client.execute(scalar_op_compiler.mod_op(table.a, divisor).name("result"))
+
+    assert floordiv.tolist() == [value // -3 for value in values]
+    assert mod.tolist() == [value % -3 for value in values]
+
+
+def test_floordiv_compares_divisor_to_zero_of_its_own_type():
+    table = ibis.table({"a": "float64", "b": "float64"}, name="test_table")
+
+    sql = ibis.bigquery.compile(
+        scalar_op_compiler.floordiv_op(table.a, table.b).name("result")
+    )
+
+    assert "`b` = 0.0" in sql
+
+
+def test_clip_with_ordered_literal_bounds_uses_least_and_greatest():
+    table = ibis.table({"a": "int64"}, name="test_table")
+
+    sql = ibis.bigquery.compile(
+        scalar_op_compiler.clip_op(table.a, ibis.literal(1), ibis.literal(3)).name(
+            "result"
+        )
+    )
+    flipped_sql = ibis.bigquery.compile(
+        scalar_op_compiler.clip_op(table.a, ibis.literal(3), ibis.literal(1)).name(
+            "result"
+        )
+    )
+
+    assert "CASE" not in sql
+    assert "least(greatest(" in sql
+    # Flipped bounds keep the CASE, which applies the lower bound first.
+    assert "CASE" in flipped_sql
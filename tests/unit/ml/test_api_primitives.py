@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
+import pandas as pd
 import pytest
 import sklearn.decomposition as sklearn_decomposition  # type: ignore
 import sklearn.linear_model as sklearn_linear_model  # type: ignore
 
+import bigframes.ml.core
 import bigframes.ml.decomposition
+import bigframes.ml.forecasting
 import bigframes.ml.linear_model
+import bigframes.ml.preprocessing
+import bigframes.pandas as bpd
 
 
 def test_base_estimator_repr():
@@ -51,3 +58,65 @@ def test_base_estimator_repr_matches_sklearn():
     estimator = bigframes.ml.decomposition.PCA(n_components=7)
     sklearn_estimator = sklearn_decomposition.PCA(n_components=7)
     assert estimator.__repr__() == sklearn_estimator.__repr__()
+
+
+def test_transformer_fit_transform_converts_series_once():
+    mock_series = mock.create_autospec(spec=bpd.Series)
+    mock_series.to_frame.side_effect = lambda: mock.create_autospec(spec=bpd.DataFrame)
+    scaler = bigframes.ml.preprocessing.StandardScaler()
+
+    with mock.patch.object(
+        scaler, "fit", return_value=scaler
+    ) as fit, mock.patch.object(scaler, "transform") as transform:
+        scaler.fit_transform(mock_series)
+
+    mock_series.to_frame.assert_called_once()
+    assert fit.call_args.args[0] is transform.call_args.args[0]
+
+
+def test_one_hot_encoder_compile_to_sql_reflects_param_changes():
+    encoder = bigframes.ml.preprocessing.OneHotEncoder()
+    first = encoder._compile_to_sql(["col"])
+
+    encoder.max_categories = 5
+    recompiled = encoder._compile_to_sql(["col"])
+    assert recompiled != first
+    assert "4" in recompiled[0][0]
+
+
+def test_one_hot_encoder_default_params_round_trip():
+    encoder = bigframes.ml.preprocessing.OneHotEncoder()
+    [(sql, _)] = encoder._compile_to_sql(["col"])
+    assert (
+        sql == "ML.ONE_HOT_ENCODER(col, 'none', 1000000, 0) OVER() AS onehotencoded_col"
+    )
+
+    parsed, col_label = bigframes.ml.preprocessing.OneHotEncoder._parse_from_sql(sql)
+    assert col_label == "col"
+    assert parsed._compile_to_sql(["col"]) == [(sql, "onehotencoded_col")]
+
+
+def test_one_hot_encoder_refit_creates_new_model():
+    mock_X = mock.create_autospec(spec=bpd.DataFrame)
+    mock_X.columns = pd.Index(["col"])
+    mock_X.sql = "input_sql"
+    encoder = bigframes.ml.preprocessing.OneHotEncoder()
+    encoder._bqml_model_factory = mock.create_autospec(
+        spec=bigframes.ml.core.BqmlModelFactory
+    )
+    create_model = encoder._bqml_model_factory.create_model
+
+    encoder.fit(mock_X)
+    encoder.fit(mock_X)
+
+    # The previous model may have expired, so a refit never reuses it.
+    assert create_model.call_count == 2
+
+
+def test_arima_plus_bqml_options_not_shared():
+    first = bigframes.ml.forecasting.ARIMAPlus()
+    first._bqml_options["horizon"] = 10
+
+    assert bigframes.ml.forecasting.ARIMAPlus()._bqml_options == {
+        "model_type": "ARIMA_PLUS"
+    }
@@ -68,7 +68,7 @@ def mock_y():
 
 
 @pytest.fixture
-def mock_X(mock_y, mock_session):
+def mock_X(mock_y, mock_session, mocker: pytest_mock.MockerFixture):
     mock_X = mock.create_autospec(spec=bpd.DataFrame)
     mock_X._session = mock_session
     mock_X._to_sql_query.return_value = (
@@ -83,6 +83,7 @@ def mock_X(mock_y, mock_session):
         ["index_column_label"],
     )
     mock_X._cached.return_value = mock_X
+    mocker.patch("bigframes.ml.utils.join_on_index", return_value=mock_X.join(mock_y))
 
     return mock_X
 
@@ -0,0 +1,47 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ibis
+import pytest
+
+import bigframes.operations.aggregations as agg_ops
+
+
+@pytest.fixture
+def table():
+    return ibis.table({"bool_col": "boolean", "int_col": "int64"}, name="test_table")
+
+
+def _compile(table, value):
+    return ibis.bigquery.compile(table.aggregate(result=value))
+
+
+@pytest.mark.parametrize(
+    ("op", "sql_func", "default"),
+    [
+        (agg_ops.all_op, "LOGICAL_AND", "TRUE"),
+        (agg_ops.any_op, "LOGICAL_OR", "FALSE"),
+    ],
+)
+def test_boolean_aggregate_uses_bool_column_directly(table, op, sql_func, default):
+    sql = _compile(table, op._as_ibis(table["bool_col"]))
+
+    assert f"coalesce({sql_func}(t0.`bool_col`), {default})" in sql
+
+
+@pytest.mark.parametrize("op", [agg_ops.all_op, agg_ops.any_op])
+def test_boolean_aggregate_compares_numeric_to_zero(table, op):
+    sql = _compile(table, op._as_ibis(table["int_col"]))
+
+    assert "t0.`int_col` <> 0" in sql
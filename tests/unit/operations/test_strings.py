@@ -0,0 +1,65 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+import pytest
+
+import bigframes.operations.strings as strings
+
+
+@pytest.mark.parametrize(
+    ("flags", "expected"),
+    [
+        (0, None),
+        (re.IGNORECASE, "(?i)"),
+        (re.MULTILINE, "(?m)"),
+        (re.IGNORECASE | re.DOTALL, "(?is)"),
+    ],
+)
+def test_parse_flags(flags, expected):
+    assert strings._parse_flags(flags) == expected
+
+
+def test_parse_flags_unsupported_raises():
+    with pytest.raises(NotImplementedError):
+        strings._parse_flags(re.VERBOSE)
+
+
+def test_parse_flags_covers_all_supported_combinations():
+    all_flags = re.IGNORECASE | re.MULTILINE | re.DOTALL
+    assert strings._parse_flags(all_flags) == "(?ims)"
+    with pytest.raises(NotImplementedError):
+        strings._parse_flags(all_flags | re.VERBOSE)
+
+
+def test_re2_alternation_matches_patterns_literally():
+    pats = ("a.b", "(x)", "c+", "$d", "e|f", "[g]", "h\\i")
+    alternation = strings._re2_alternation(pats)
+
+    for value in [
+        "a.b1",
+        "axb",
+        "(x)y",
+        "xy",
+        "c+",
+        "cc",
+        "$d",
+        "d",
+        "e|f",
+        "e",
+        "h\\i",
+    ]:
+        assert bool(re.search(f"^({alternation})", value)) == value.startswith(pats)
+        assert bool(re.search(f"({alternation})$", value)) == value.endswith(pats)
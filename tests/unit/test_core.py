@@ -72,6 +72,45 @@ def test_arrayvalue_with_get_column_type():
     assert isinstance(col3_type, pandas.Float64Dtype)
 
 
+def test_arrayvalue_is_ordered_by():
+    value = resources.create_arrayvalue(
+        pandas.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+        total_ordering_columns=["col1"],
+    )
+    col1_asc = bigframes.core.ordering.OrderingColumnReference("col1")
+    col2_asc = bigframes.core.ordering.OrderingColumnReference("col2")
+    col1_desc = bigframes.core.ordering.OrderingColumnReference(
+        "col1", direction=bigframes.core.ordering.OrderingDirection.DESC
+    )
+
+    assert value.is_ordered_by([col1_asc])
+    assert not value.is_ordered_by([col1_desc])
+    assert not value.is_ordered_by([col2_asc])
+
+    sorted_value = value.order_by([col2_asc])
+    assert sorted_value.is_ordered_by([col2_asc])
+    assert not sorted_value.is_ordered_by([col1_asc])
+
+
+def test_arrayvalue_multi_key_order_by_matches_stable_passes():
+    value = resources.create_arrayvalue(
+        pandas.DataFrame(
+            {"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [3, 2, 1]}
+        ),
+        total_ordering_columns=["col1"],
+    )
+    col2_asc = bigframes.core.ordering.OrderingColumnReference("col2")
+    col3_desc = bigframes.core.ordering.OrderingColumnReference(
+        "col3", direction=bigframes.core.ordering.OrderingDirection.DESC
+    )
+
+    multi_key = value.order_by([col2_asc, col3_desc])
+    stable_passes = value.order_by([col3_desc]).order_by([col2_asc])
+
+    assert multi_key.is_ordered_by([col2_asc, col3_desc])
+    assert stable_passes.is_ordered_by([col2_asc, col3_desc])
+
+
 def test_arrayvalue_with_get_column():
     value = resources.create_arrayvalue(
         pandas.DataFrame(
@@ -225,3 +264,20 @@ def test_arrayvalue_to_ibis_expr_with_corr_aggregate():
     assert len(expr.columns) == 1
     assert actual.columns[0] == "col4"
     assert expr.columns[0].type().is_float64()
+
+
+def test_arrayvalue_to_sql_is_cached_per_options():
+    value = resources.create_arrayvalue(
+        pandas.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+        total_ordering_columns=["col1"],
+    )
+    ir = value._compile_unordered()
+
+    sql = ir.to_sql()
+    assert ir.to_sql() is sql
+    renamed = ir.to_sql(col_id_overrides={"col1": "renamed"})
+    assert renamed is not sql
+    assert "renamed" in renamed
+
+    ordered = value._compile_ordered()
+    assert ordered.to_sql(sorted=True) is ordered.to_sql(sorted=True)
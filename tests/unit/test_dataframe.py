@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import unittest.mock as mock
+
+import google.api_core.exceptions
 import google.cloud.bigquery
 import pytest
 
@@ -57,3 +60,100 @@ def test_dataframe_to_gbq_writes_to_anonymous_dataset(
     destination = dataframe.to_gbq()
 
     assert destination.startswith(anonymous_dataset_id)
+
+
+def test_dataframe_columns_name_does_not_change_block(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    dataframe = resources.create_dataframe(monkeypatch)
+
+    dataframe.columns.name = "renamed"
+
+    assert dataframe.columns.name is None
+    assert dataframe._block.column_labels.name is None
+
+
+def test_dataframe_cumprod_non_numeric_raises(monkeypatch: pytest.MonkeyPatch):
+    dataframe = resources.create_dataframe(monkeypatch)
+
+    with pytest.raises(ValueError, match="cumprod"):
+        dataframe.cumprod()
+
+
+def test_dataframe_export_reuses_io_query_result(monkeypatch: pytest.MonkeyPatch):
+    session = resources.create_bigquery_session()
+    dataframe = resources.create_dataframe(monkeypatch, session=session)
+    initial_query_count = session.bqclient.query.call_count
+
+    dataframe.to_parquet("gs://bucket/first-*.parquet")
+    dataframe.to_csv("gs://bucket/second-*.csv")
+
+    # One query for the result table, then one EXPORT DATA per call.
+    assert session.bqclient.query.call_count - initial_query_count == 3
+
+
+def _fail_next_export(monkeypatch, session, error):
+    start_query = session._start_query
+    failed_export = mock.Mock(side_effect=error)
+    exports = iter([failed_export, start_query])
+    monkeypatch.setattr(
+        session,
+        "_start_query",
+        lambda sql, **kwargs: (next(exports) if "EXPORT DATA" in sql else start_query)(
+            sql, **kwargs
+        ),
+    )
+    return failed_export
+
+
+def test_dataframe_export_reruns_io_query_when_result_table_expired(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    session = resources.create_bigquery_session()
+    dataframe = resources.create_dataframe(monkeypatch, session=session)
+    dataframe.to_parquet("gs://bucket/first-*.parquet")
+    initial_query_count = session.bqclient.query.call_count
+    failed_export = _fail_next_export(
+        monkeypatch,
+        session,
+        google.api_core.exceptions.NotFound(
+            "Not found: Table test-project:test_dataset.test_table"
+        ),
+    )
+
+    dataframe.to_csv("gs://bucket/second-*.csv")
+
+    # The failed EXPORT DATA is mocked, so only the query for a new result
+    # table and the second EXPORT DATA reach the client.
+    failed_export.assert_called_once()
+    assert session.bqclient.query.call_count - initial_query_count == 2
+
+
+def test_dataframe_export_missing_destination_not_retried(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    session = resources.create_bigquery_session()
+    dataframe = resources.create_dataframe(monkeypatch, session=session)
+    dataframe.to_parquet("gs://bucket/first-*.parquet")
+    initial_query_count = session.bqclient.query.call_count
+    _fail_next_export(
+        monkeypatch,
+        session,
+        google.api_core.exceptions.NotFound("Not found: URI gs://missing/*.csv"),
+    )
+
+    with pytest.raises(google.api_core.exceptions.NotFound):
+        dataframe.to_csv("gs://missing/*.csv")
+
+    assert session.bqclient.query.call_count == initial_query_count
+
+
+def test_dataframe_io_query_compiled_once(monkeypatch: pytest.MonkeyPatch):
+    dataframe = resources.create_dataframe(monkeypatch)
+
+    first = dataframe._create_io_query(index=True, ordering_id=None)
+    with mock.patch.object(dataframe, "_compile_io_query") as compile_io_query:
+        second = dataframe._create_io_query(index=True, ordering_id=None)
+
+    assert first == second
+    compile_io_query.assert_not_called()
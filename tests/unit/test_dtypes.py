@@ -225,6 +225,8 @@ def test_unsupported_dtype_str_raises_unexpected_datatype():
         (True, ibis.literal(True, ibis_dtypes.boolean)),
         (5, ibis.literal(5, ibis_dtypes.int64)),
         (-33.2, ibis.literal(-33.2, ibis_dtypes.float64)),
+        ("abc", ibis.literal("abc", ibis_dtypes.string)),
+        (None, ibis.null()),
     ],
 )
 def test_literal_to_ibis_scalar_converts(literal, ibis_scalar):
@@ -248,3 +250,18 @@ def test_remote_function_io_types_are_supported_bigframes_types():
     for python_type in rf_supported_io_types:
         ibis_type = python_type_to_bigquery_type(python_type)
         assert ibis_type in bigframes.dtypes.IBIS_TO_BIGFRAMES
+
+
+def test_ibis_value_to_canonical_type_makes_required_nullable():
+    table = ibis.table(
+        [("required", ibis_dtypes.Int64(nullable=False)), ("nullable", "int64")],
+        name="t",
+    )
+
+    required = bigframes.dtypes.ibis_value_to_canonical_type(table["required"])
+    nullable_column = table["nullable"]
+    nullable = bigframes.dtypes.ibis_value_to_canonical_type(nullable_column)
+
+    assert required.type() == ibis_dtypes.Int64(nullable=True)
+    assert required.get_name() == "required"
+    assert nullable is nullable_column
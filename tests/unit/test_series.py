@@ -0,0 +1,57 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest.mock as mock
+
+import pandas
+import pytest
+
+import bigframes.core.blocks as blocks
+import bigframes.series
+
+from . import resources
+
+
+@pytest.mark.parametrize(
+    ("row_count", "expected_footer"),
+    [
+        (2, "Name: col, dtype: object"),
+        (100, "...\nName: col, Length: 100, dtype: object"),
+    ],
+)
+def test_series_repr_reports_total_length(
+    monkeypatch: pytest.MonkeyPatch, row_count, expected_footer
+):
+    series = resources.create_dataframe(monkeypatch)["col"]
+    head = pandas.DataFrame({"col": ["a", "b"]})
+    monkeypatch.setattr(
+        blocks.Block,
+        "retrieve_repr_request_results",
+        mock.Mock(return_value=(head, row_count, None)),
+    )
+
+    assert repr(series).endswith(expected_footer)
+
+
+@pytest.mark.parametrize("method", ["skew", "kurt"])
+def test_series_moment_statistics_use_single_query(
+    monkeypatch: pytest.MonkeyPatch, method
+):
+    resources.create_dataframe(monkeypatch)
+    series = bigframes.series.Series([1.0, 2.0, 4.0, 8.0])
+    to_pandas = mock.Mock(return_value=(pandas.DataFrame({"result": [0.5]}), None))
+    monkeypatch.setattr(blocks.Block, "to_pandas", to_pandas)
+
+    assert getattr(series, method)() == 0.5
+    to_pandas.assert_called_once()
@@ -1621,6 +1621,43 @@ class DataFrame(NDFrame):
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
+    def eval(self, expr: str):
+        """
+        Evaluate a string describing operations on DataFrame columns.
+
+        The whole expression is applied as a single projection, rather than
+        one operation at a time. Arithmetic (``+``, ``-``, ``*``, ``/``,
+        ``//``, ``%``, ``**``), comparison and boolean (``&``, ``|``, ``~``,
+        ``and``, ``or``, ``not``) operators are supported.
+
+        **Examples:**
+
+            >>> import bigframes.pandas as bpd
+            >>> bpd.options.display.progress_bar = None
+
+            >>> df = bpd.DataFrame({'A': [1, 2, 3], 'B': [10, 8, 6]})
+            >>> df.eval('(A + B) * 2')
+            0    22
+            1    20
+            2    18
+            dtype: Int64
+
+            >>> df.eval('A < B - 5')
+            0     True
+            1     True
+            2    False
+            dtype: boolean
+
+        Args:
+            expr (str):
+                The expression to evaluate. Column names are referenced by
+                name.
+
+        Returns:
+            bigframes.series.Series: The result of the expression.
+        """
+        raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
+
     def keys(self):
         """
         Get the 'info axis'.